@@ -14,8 +14,9 @@ Two modes are supported, in priority order:
 
 2. **Stdin** (legacy / direct invocation):
    If ``MCE_EXEC_CODE`` is absent the entrypoint falls back to reading the
-   entire stdin stream.  This keeps the container usable when invoked
-   manually (e.g. ``echo 'result=1' | docker run -i mce-sandbox``).
+   stdin stream, capped at ``MCE_MAX_STDIN_BYTES`` (default 256 KiB).  This
+   keeps the container usable when invoked manually
+   (e.g. ``echo 'result=1' | docker run -i mce-sandbox``).
 
 Execution contract
 ------------------
@@ -38,11 +39,109 @@ from __future__ import annotations
 import builtins
 import io
 import json
+import math
 import os
 import signal
 import sys
 import traceback
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover — orjson ships in sandbox/requirements.txt
+    orjson = None  # type: ignore[assignment]
+
+# Builtins removed from the user namespace.  Security is defence-in-depth
+# alongside the AST guard and Docker limits.  __import__ is kept so
+# ``import`` statements work normally.
+_BLOCKED_BUILTINS: frozenset[str] = frozenset({"open", "exec", "eval", "compile", "input", "breakpoint"})
+
+# Filtered builtins computed once per process instead of once per execution
+_SAFE_BUILTINS: dict[str, object] = {k: v for k, v in vars(builtins).items() if k not in _BLOCKED_BUILTINS}
+
+# orjson options matching stdlib json output: int/float dict keys are allowed, and
+# datetimes and dataclasses go through ``default=str`` instead of native encoding
+_ORJSON_OPTS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    if orjson is not None
+    else 0
+)
+
+# Upper bound on code accepted over stdin; the executor's own limit is far lower
+_MAX_STDIN_BYTES = int(os.environ.get("MCE_MAX_STDIN_BYTES", str(256 * 1024)))
+
+
+def _read_stdin_code(limit: int) -> str | None:
+    """Read the code payload from stdin in chunks, aborting once it exceeds *limit*.
+
+    Args:
+        limit: Maximum number of bytes accepted.
+
+    Returns:
+        Decoded source code, or None if the payload is larger than *limit*.
+    """
+    buf = bytearray()
+    stream = sys.stdin.buffer
+    while chunk := stream.read1(65536):
+        buf += chunk
+        if len(buf) > limit:
+            return None
+    return buf.decode("utf-8")
+
+
+def _has_non_finite(value: object) -> bool:
+    """Return True if *value* contains a NaN or infinite float at any depth.
+
+    Args:
+        value: Decoded result value to inspect.
+
+    Returns:
+        True when a non-finite float is present.
+    """
+    if isinstance(value, float):
+        return not math.isfinite(value)
+    if isinstance(value, dict):
+        return any(_has_non_finite(v) for v in value.values())
+    if isinstance(value, list | tuple):
+        return any(_has_non_finite(v) for v in value)
+    return False
+
+
+def _dumps(payload: dict[str, object]) -> bytes:
+    """Serialize *payload* to JSON bytes, preferring orjson over stdlib json.
+
+    Output matches stdlib ``json.dumps(payload, default=str)``. Falls back to
+    stdlib ``json`` when orjson is unavailable, rejects the payload (e.g.
+    integers wider than 64 bits), or has written ``null`` for a NaN or
+    infinite float that stdlib json keeps as ``NaN``/``Infinity``.
+
+    Args:
+        payload: Result dict to serialize.
+
+    Returns:
+        UTF-8 encoded JSON document.
+    """
+    if orjson is not None:
+        try:
+            encoded = orjson.dumps(payload, default=str, option=_ORJSON_OPTS)
+        except TypeError:
+            pass
+        else:
+            # Only scan for non-finite floats when orjson may have replaced one with null
+            if b"null" not in encoded or not _has_non_finite(payload):
+                return encoded
+    return json.dumps(payload, default=str).encode("utf-8")
+
+
+def _emit(payload: dict[str, object]) -> None:
+    """Write *payload* as a single JSON line straight to the stdout byte buffer.
+
+    Args:
+        payload: Result dict to write.
+    """
+    out = sys.stdout.buffer
+    out.write(_dumps(payload) + b"\n")
+    out.flush()
+
 
 def _install_timeout(seconds: int) -> None:
     """Install a SIGALRM-based hard timeout.
@@ -57,14 +156,12 @@ def _install_timeout(seconds: int) -> None:
 
     def _handler(signum: int, frame: object) -> None:  # noqa: ARG001
         sys.stdout = _real_stdout  # type: ignore[name-defined]  # restored inside handler
-        print(  # noqa: T201
-            json.dumps(
-                {
-                    "success": False,
-                    "error": f"Execution timed out after {seconds}s",
-                    "traceback": None,
-                }
-            )
+        _emit(
+            {
+                "success": False,
+                "error": f"Execution timed out after {seconds}s",
+                "traceback": None,
+            }
         )
         sys.exit(1)
 
@@ -85,10 +182,14 @@ def main() -> None:
 
         code = base64.b64decode(encoded).decode("utf-8")
     else:
-        code = sys.stdin.read()
+        stdin_code = _read_stdin_code(_MAX_STDIN_BYTES)
+        if stdin_code is None:
+            _emit({"success": False, "error": f"Code exceeds {_MAX_STDIN_BYTES} bytes"})
+            return
+        code = stdin_code
 
     if not code.strip():
-        print(json.dumps({"success": False, "error": "No code provided"}))  # noqa: T201
+        _emit({"success": False, "error": "No code provided"})
         return
 
     # ------------------------------------------------------------------
@@ -99,16 +200,11 @@ def main() -> None:
         _install_timeout(timeout_seconds)
 
     # ------------------------------------------------------------------
-    # 3. Block dangerous builtins
-    # Security is defence-in-depth alongside the AST guard and Docker limits.
-    # __import__ is kept so ``import`` statements work normally.
-    # ------------------------------------------------------------------
-    _blocked = {"open", "exec", "eval", "compile", "input", "breakpoint"}
-    safe_builtins = {k: v for k, v in vars(builtins).items() if k not in _blocked}
-
+    # 3. Restricted namespace (dangerous builtins removed at import time)
     # Single namespace for globals and locals so top-level imports are visible
     # inside functions defined in the same code block.
-    namespace: dict[str, object] = {"__builtins__": safe_builtins}
+    # ------------------------------------------------------------------
+    namespace: dict[str, object] = {"__builtins__": _SAFE_BUILTINS}
 
     # ------------------------------------------------------------------
     # 4. Redirect stdout so user print() calls don't corrupt the JSON line
@@ -127,13 +223,11 @@ def main() -> None:
             output = namespace["result"]
         else:
             sys.stdout = _real_stdout
-            print(  # noqa: T201
-                json.dumps(
-                    {
-                        "success": False,
-                        "error": "Code must define a 'result' variable or a 'main()' function",
-                    }
-                )
+            _emit(
+                {
+                    "success": False,
+                    "error": "Code must define a 'result' variable or a 'main()' function",
+                }
             )
             return
 
@@ -143,33 +237,29 @@ def main() -> None:
             signal.alarm(0)
 
         prints = _captured.getvalue() or None
-        print(json.dumps({"success": True, "data": output, "prints": prints}, default=str))  # noqa: T201
+        _emit({"success": True, "data": output, "prints": prints})
 
     except SyntaxError as exc:
         sys.stdout = _real_stdout
         if hasattr(signal, "SIGALRM"):
             signal.alarm(0)
-        print(  # noqa: T201
-            json.dumps(
-                {
-                    "success": False,
-                    "error": f"Syntax error: {exc}",
-                    "traceback": traceback.format_exc(),
-                }
-            )
+        _emit(
+            {
+                "success": False,
+                "error": f"Syntax error: {exc}",
+                "traceback": traceback.format_exc(),
+            }
         )
     except Exception as exc:  # noqa: BLE001
         sys.stdout = _real_stdout
         if hasattr(signal, "SIGALRM"):
             signal.alarm(0)
-        print(  # noqa: T201
-            json.dumps(
-                {
-                    "success": False,
-                    "error": str(exc),
-                    "traceback": traceback.format_exc(),
-                }
-            )
+        _emit(
+            {
+                "success": False,
+                "error": str(exc),
+                "traceback": traceback.format_exc(),
+            }
         )
 
 
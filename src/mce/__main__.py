@@ -3,13 +3,10 @@
 from __future__ import annotations
 
 import argparse
-import asyncio
 import sys
 
-from dotenv import load_dotenv
-
-from mce.config import _ENV_FILE, load_config
-from mce.utils.logging import get_logger, setup_logging
+# Everything beyond argparse is imported inside the command handlers so that
+# ``mce --help`` and argument errors return without loading pydantic or structlog.
 
 
 def _build_parser() -> argparse.ArgumentParser:
@@ -107,6 +104,8 @@ async def _cmd_clean(args: argparse.Namespace) -> int:
     import shutil  # noqa: PLC0415
     from pathlib import Path  # noqa: PLC0415
 
+    from mce.config import load_config  # noqa: PLC0415
+
     config = load_config(getattr(args, "env_file", None))
 
     # Remove compiled output directory
@@ -141,6 +140,8 @@ async def _cmd_compile(args: argparse.Namespace) -> int:
         Exit code (0 = success).
     """
     from mce.compiler.orchestrator import Orchestrator  # noqa: PLC0415
+    from mce.config import load_config  # noqa: PLC0415
+    from mce.utils.logging import get_logger  # noqa: PLC0415
 
     config = load_config(getattr(args, "env_file", None))
     orchestrator = Orchestrator(config)
@@ -185,10 +186,12 @@ async def _cmd_serve(config_args: argparse.Namespace) -> int:
         Exit code.
     """
     from mce.compiler.orchestrator import Orchestrator, _to_module_name  # noqa: PLC0415
+    from mce.config import load_config  # noqa: PLC0415
     from mce.runtime.cache import CacheStore  # noqa: PLC0415
     from mce.runtime.executor import CodeExecutor  # noqa: PLC0415
     from mce.runtime.registry import Registry  # noqa: PLC0415
     from mce.server import create_server  # noqa: PLC0415
+    from mce.utils.logging import get_logger  # noqa: PLC0415
 
     config = load_config(getattr(config_args, "env_file", None))
     logger = get_logger(__name__)
@@ -200,49 +203,53 @@ async def _cmd_serve(config_args: argparse.Namespace) -> int:
 
     # Initialize cache
     cache = CacheStore(config.cache_db_path, config.cache_ttl_seconds, config.cache_max_entries)
-    await cache.initialize()
-    await cache.cleanup_expired()
-
-    # Load registry
-    registry = Registry(config.compiled_output_dir)
-    registry.load()
-
-    # Load auth configs from swaggers.yaml so dynamic token fetching (Keycloak, OAuth2, etc.)
-    # is available at runtime without requiring MCE_{SERVER}_AUTH env vars.
-    orchestrator = Orchestrator(config)
-    sources = orchestrator.load_swagger_sources()
-    auth_configs = {_to_module_name(s.name): s.auth for s in sources if s.auth is not None}
-
-    servers = registry.list_servers()
-    logger.info(
-        "mce_starting",
-        servers=[s.name for s in servers],
-        transport=getattr(config_args, "transport", "stdio"),
-        sandbox_mode=config.sandbox_mode,
-        warm_pool_size=config.warm_pool_size if config.sandbox_mode == "warm" else 0,
-        host=config.host,
-        port=config.port,
-    )
-
-    # Start executor (creates warm container pool if sandbox_mode=warm).
-    # startup() is inside the try so shutdown() always runs — even if startup
-    # fails mid-way (e.g. first container created, second raises), ensuring
-    # no warm containers are left orphaned in Docker.
-    executor = CodeExecutor(config, cache, auth_configs)
+    # The cache holds one SQLite connection for the server's lifetime; close it however serving ends
     try:
-        await executor.startup()
-        mcp = create_server(config, registry=registry, cache=cache, executor=executor)
-        transport = getattr(config_args, "transport", "stdio")
-
-        if transport == "stdio":
-            await mcp.run_stdio_async()
-        else:
-            await mcp.run_http_async(host=config.host, port=config.port)
+        await cache.initialize()
+        await cache.cleanup_expired()
+
+        # Load registry
+        registry = Registry(config.compiled_output_dir)
+        registry.load()
+
+        # Load auth configs from swaggers.yaml so dynamic token fetching (Keycloak, OAuth2, etc.)
+        # is available at runtime without requiring MCE_{SERVER}_AUTH env vars.
+        orchestrator = Orchestrator(config)
+        sources = orchestrator.load_swagger_sources()
+        auth_configs = {_to_module_name(s.name): s.auth for s in sources if s.auth is not None}
+
+        servers = registry.list_servers()
+        logger.info(
+            "mce_starting",
+            servers=[s.name for s in servers],
+            transport=getattr(config_args, "transport", "stdio"),
+            sandbox_mode=config.sandbox_mode,
+            warm_pool_size=config.warm_pool_size if config.sandbox_mode == "warm" else 0,
+            host=config.host,
+            port=config.port,
+        )
+
+        # Start executor (creates warm container pool if sandbox_mode=warm).
+        # startup() is inside the try so shutdown() always runs — even if startup
+        # fails mid-way (e.g. first container created, second raises), ensuring
+        # no warm containers are left orphaned in Docker.
+        executor = CodeExecutor(config, cache, auth_configs)
+        try:
+            await executor.startup()
+            mcp = create_server(config, registry=registry, cache=cache, executor=executor)
+            transport = getattr(config_args, "transport", "stdio")
+
+            if transport == "stdio":
+                await mcp.run_stdio_async()
+            else:
+                await mcp.run_http_async(host=config.host, port=config.port)
+        finally:
+            # Stop and remove all warm containers, close Docker client
+            await executor.shutdown()
+
+        return 0
     finally:
-        # Stop and remove all warm containers, close Docker client
-        await executor.shutdown()
-
-    return 0
+        await cache.close()
 
 
 async def _cmd_run(args: argparse.Namespace) -> int:
@@ -255,6 +262,7 @@ async def _cmd_run(args: argparse.Namespace) -> int:
         Exit code.
     """
     from mce.compiler.orchestrator import Orchestrator  # noqa: PLC0415
+    from mce.config import load_config  # noqa: PLC0415
 
     config = load_config(getattr(args, "env_file", None))
     orchestrator = Orchestrator(config)
@@ -272,6 +280,13 @@ def main() -> None:
     parser = _build_parser()
     args = parser.parse_args()
 
+    import asyncio  # noqa: PLC0415
+
+    from dotenv import load_dotenv  # noqa: PLC0415
+
+    from mce.config import _ENV_FILE, load_config  # noqa: PLC0415
+    from mce.utils.logging import setup_logging  # noqa: PLC0415
+
     # Load .env into os.environ early so vault.py can read server credentials.
     # override=False means explicit env vars always win over .env values.
     env_file_path = args.env_file if args.env_file else str(_ENV_FILE)
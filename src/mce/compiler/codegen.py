@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+import functools
 import keyword
 import re
 import textwrap
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from jinja2 import Environment, FileSystemLoader, StrictUndefined
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, StrictUndefined
 
 from mce.errors import CompileError
 from mce.utils.logging import get_logger
@@ -21,6 +22,13 @@ logger = get_logger(__name__)
 # Directory containing Jinja2 templates
 _TEMPLATES_DIR = Path(__file__).parent / "templates"
 
+# Per-function templates: general-purpose, and a specialization for body-less GET endpoints
+_BLOCK_TEMPLATE = "function_block.py.j2"
+_GET_BLOCK_TEMPLATE = "get_function_block.py.j2"
+
+# Upper bound on memoized parameter-name sanitizations (shared across all specs)
+_SAFE_NAME_CACHE_SIZE = 4096
+
 # Type mapping from swagger/JSON schema types to Python type annotations
 _TYPE_MAP: dict[str, str] = {
     "string": "str",
@@ -31,6 +39,49 @@ _TYPE_MAP: dict[str, str] = {
     "array": "list[Any]",
 }
 
+# camelCase/PascalCase boundary patterns used by _safe_name
+_ACRONYM_BOUNDARY_RE = re.compile(r"([A-Z]+)([A-Z][a-z])")
+_CAMEL_BOUNDARY_RE = re.compile(r"([a-z\d])([A-Z])")
+_UNDERSCORE_RUN_RE = re.compile(r"_+")
+
+
+class _IdentifierTable(dict[int, str]):
+    """``str.translate`` table mapping every non-identifier character to ``_``.
+
+    ASCII is precomputed; ``__missing__`` covers the rest so non-ASCII
+    characters are replaced too, matching ``[^a-zA-Z0-9_]``.
+    """
+
+    def __missing__(self, key: int) -> str:
+        return "_"
+
+
+_IDENTIFIER_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_")
+_IDENTIFIER_TABLE = _IdentifierTable({i: chr(i) if chr(i) in _IDENTIFIER_CHARS else "_" for i in range(128)})
+
+
+def _build_bytecode_cache(cache_dir: Path | None) -> FileSystemBytecodeCache | None:
+    """Create the on-disk Jinja2 bytecode cache, or None if disabled or unusable.
+
+    Jinja2 keys cache entries by template name and source checksum, so edited
+    templates are recompiled automatically.
+
+    Args:
+        cache_dir: Directory for compiled template bytecode, or None to disable the cache.
+
+    Returns:
+        FileSystemBytecodeCache rooted at *cache_dir*, or None when no directory
+        is given or it cannot be created.
+    """
+    if cache_dir is None:
+        return None
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+    except OSError as exc:
+        logger.debug("jinja_bytecode_cache_disabled", reason=str(exc))
+        return None
+    return FileSystemBytecodeCache(str(cache_dir))
+
 
 def _wrap_text(text: str, width: int, subsequent_indent: str = "") -> str:
     """Wrap each paragraph of text to fit within width, preserving blank lines."""
@@ -79,34 +130,68 @@ def _build_param_annotation(param: ParamSchema) -> str:
     return base
 
 
-def _build_function_signature(endpoint: EndpointSpec) -> str:
-    """Build function signature string (parameters only) for a function def.
+def _partition_parameters(
+    endpoint: EndpointSpec,
+) -> tuple[list[ParamSchema], list[ParamSchema], list[ParamSchema], list[ParamSchema]]:
+    """Split an endpoint's parameters into the groups codegen needs, in one pass.
 
     Args:
         endpoint: Endpoint specification.
 
     Returns:
-        Comma-separated parameter list string.
+        Tuple of (required, optional, query, path) parameter lists, each in
+        declaration order.
     """
-    parts: list[str] = []
-
-    # Required params first
+    required: list[ParamSchema] = []
+    optional: list[ParamSchema] = []
+    query: list[ParamSchema] = []
+    path: list[ParamSchema] = []
     for p in endpoint.parameters:
-        if p.required:
-            annotation = _swagger_type_to_python(p.param_type)
-            parts.append(f"{_safe_name(p.name)}: {annotation}")
+        (required if p.required else optional).append(p)
+        if p.location == "query":
+            query.append(p)
+        elif p.location == "path":
+            path.append(p)
+    return required, optional, query, path
 
-    # Optional params with defaults
-    for p in endpoint.parameters:
-        if not p.required:
-            annotation = _swagger_type_to_python(p.param_type)
-            if p.param_type == "array":
-                default = "None"
-            elif p.default and p.param_type == "string":
-                default = f'"{p.default}"'
-            else:
-                default = p.default or "None"
-            parts.append(f"{_safe_name(p.name)}: {annotation} | None = {default}")
+
+def _optional_default(param: ParamSchema) -> str:
+    """Render the default value expression for an optional parameter.
+
+    Args:
+        param: Optional parameter schema descriptor.
+
+    Returns:
+        Python expression used as the parameter default.
+    """
+    if param.param_type == "array":
+        return "None"
+    if param.default and param.param_type == "string":
+        return f'"{param.default}"'
+    return param.default or "None"
+
+
+def _build_function_signature(
+    endpoint: EndpointSpec,
+    required: list[ParamSchema],
+    optional: list[ParamSchema],
+) -> str:
+    """Build function signature string (parameters only) for a function def.
+
+    Args:
+        endpoint: Endpoint specification.
+        required: Required parameters from ``_partition_parameters``.
+        optional: Optional parameters from ``_partition_parameters``.
+
+    Returns:
+        Comma-separated parameter list string.
+    """
+    # Required params first, then optional params with defaults
+    parts = [f"{_safe_name(p.name)}: {_swagger_type_to_python(p.param_type)}" for p in required]
+    parts += [
+        f"{_safe_name(p.name)}: {_swagger_type_to_python(p.param_type)} | None = {_optional_default(p)}"
+        for p in optional
+    ]
 
     # Request body as json_body for mutating methods
     if endpoint.request_body_schema:
@@ -115,49 +200,46 @@ def _build_function_signature(endpoint: EndpointSpec) -> str:
     return ", ".join(parts)
 
 
-def _build_params_dict(endpoint: EndpointSpec) -> str:
+def _build_params_dict(query_params: list[ParamSchema]) -> str:
     """Build the query params dict construction code.
 
     Args:
-        endpoint: Endpoint specification.
+        query_params: Query parameters from ``_partition_parameters``.
 
     Returns:
         Python code string for building the params dict.
     """
-    query_params = [p for p in endpoint.parameters if p.location == "query"]
     if not query_params:
         return "None"
 
-    lines = ["{"]
-    for p in query_params:
-        safe = _safe_name(p.name)
-        lines.append(f'        "{p.name}": {safe},')
-    lines.append("    }")
-    raw = "\n".join(lines)
-    return raw
+    entries = "".join(f'        "{p.name}": {_safe_name(p.name)},\n' for p in query_params)
+    return f"{{\n{entries}    }}"
 
 
-def _build_path_formatted(endpoint: EndpointSpec) -> str:
+def _build_path_formatted(endpoint: EndpointSpec, path_params: list[ParamSchema]) -> str:
     """Build python format expression for URL path substitution.
 
     Args:
         endpoint: Endpoint specification.
+        path_params: Path parameters from ``_partition_parameters``.
 
     Returns:
         Python f-string body for path formatting.
     """
     path = endpoint.path
-    path_params = [p for p in endpoint.parameters if p.location == "path"]
     for p in path_params:
         path = path.replace(f"{{{p.name}}}", f"{{{_safe_name(p.name)}}}")
     return f'f"{path}"' if path_params else f'"{path}"'
 
 
+@functools.lru_cache(maxsize=_SAFE_NAME_CACHE_SIZE)
 def _safe_name(name: str) -> str:
     """Sanitize a parameter name to a valid Python snake_case identifier.
 
     Handles camelCase names (e.g. ``dashboardId`` → ``dashboard_id``) so that
     generated parameter names are readable and follow Python conventions.
+    Memoized because each parameter name is sanitized several times per
+    endpoint and names repeat heavily across endpoints.
 
     Args:
         name: Raw parameter name (may be camelCase or already snake_case).
@@ -166,10 +248,10 @@ def _safe_name(name: str) -> str:
         Safe snake_case Python identifier.
     """
     # Split camelCase/PascalCase boundaries before lowercasing
-    name = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1_\2", name)
-    name = re.sub(r"([a-z\d])([A-Z])", r"\1_\2", name)
-    sanitized = re.sub(r"[^a-zA-Z0-9_]", "_", name)
-    sanitized = re.sub(r"_+", "_", sanitized).strip("_").lower()
+    name = _ACRONYM_BOUNDARY_RE.sub(r"\1_\2", name)
+    name = _CAMEL_BOUNDARY_RE.sub(r"\1_\2", name)
+    sanitized = name.translate(_IDENTIFIER_TABLE)
+    sanitized = _UNDERSCORE_RUN_RE.sub("_", sanitized).strip("_").lower()
     if sanitized and sanitized[0].isdigit():
         sanitized = f"p_{sanitized}"
     if keyword.iskeyword(sanitized):
@@ -324,13 +406,18 @@ def _build_docstring_args(endpoint: EndpointSpec) -> list[dict[str, Any]]:
 class CodeGenerator:
     """Generate Python function modules from compiled ServerSpec."""
 
-    def __init__(self) -> None:
-        """Initialize the Jinja2 environment with the templates directory."""
+    def __init__(self, bytecode_cache_dir: Path | None = None) -> None:
+        """Initialize the Jinja2 environment with the templates directory.
+
+        Args:
+            bytecode_cache_dir: Directory for compiled template bytecode; None disables the cache.
+        """
         self._env = Environment(
             loader=FileSystemLoader(str(_TEMPLATES_DIR)),
             undefined=StrictUndefined,
             trim_blocks=True,
             lstrip_blocks=True,
+            bytecode_cache=_build_bytecode_cache(bytecode_cache_dir),
         )
         self._env.globals["swagger_type_to_python"] = _swagger_type_to_python
         self._env.globals["safe_name"] = _safe_name
@@ -350,6 +437,8 @@ class CodeGenerator:
         template = self._env.get_template("function.py.j2")
 
         functions_data = [self._prepare_function_data(ep) for ep in spec.endpoints]
+        for fn in functions_data:
+            fn["rendered"] = self._render_block(fn)
 
         header_desc_width = max(40, 120 - len(f"# Server: {spec.name} \u2014 "))
         try:
@@ -372,29 +461,72 @@ class CodeGenerator:
         )
         return code
 
+    def _render_block(self, fn: dict[str, Any]) -> str:
+        """Render the per-function block template selected for one function.
+
+        Args:
+            fn: Function data dict from ``_prepare_function_data``.
+
+        Returns:
+            Rendered Python source for the function definition.
+        """
+        return str(self._env.get_template(fn["template"]).render(fn=fn))
+
     def _prepare_function_data(self, endpoint: EndpointSpec) -> dict[str, Any]:
         """Prepare template context data for a single endpoint.
 
+        GET endpoints without a request body are routed to the specialized
+        ``get_function_block.py.j2``, which has no method or body branches.
+
         Args:
             endpoint: Endpoint specification.
 
         Returns:
             Dict with all template variables for the function.
         """
+        if endpoint.method == "GET" and not endpoint.request_body_schema:
+            return self._prepare_get_function_data(endpoint)
+        data = self._prepare_common_data(endpoint)
+        data["template"] = _BLOCK_TEMPLATE
+        data["method"] = endpoint.method
+        data["has_body"] = bool(endpoint.request_body_schema) and endpoint.method in ("POST", "PUT", "PATCH")
+        return data
+
+    def _prepare_get_function_data(self, endpoint: EndpointSpec) -> dict[str, Any]:
+        """Prepare template context data for a GET endpoint without a request body.
+
+        Args:
+            endpoint: Endpoint specification.
+
+        Returns:
+            Dict with the template variables used by ``get_function_block.py.j2``.
+        """
+        data = self._prepare_common_data(endpoint)
+        data["template"] = _GET_BLOCK_TEMPLATE
+        return data
+
+    def _prepare_common_data(self, endpoint: EndpointSpec) -> dict[str, Any]:
+        """Prepare the method-independent template context for a single endpoint.
+
+        Args:
+            endpoint: Endpoint specification.
+
+        Returns:
+            Dict with the template variables shared by every function template.
+        """
+        required, optional, query, path = _partition_parameters(endpoint)
         return {
             "name": endpoint.operation_id,
-            "method": endpoint.method,
             "path": endpoint.path,
-            "path_expr": _build_path_formatted(endpoint),
+            "path_expr": _build_path_formatted(endpoint, path),
             "summary": _wrap_text(endpoint.summary, width=113, subsequent_indent="    "),
             "description": _wrap_text(endpoint.description or "", width=116, subsequent_indent="    "),
-            "signature": (_sig := _build_function_signature(endpoint)),
+            "signature": (_sig := _build_function_signature(endpoint, required, optional)),
             "params": _sig.split(", ") if _sig else [],
-            "params_dict": _build_params_dict(endpoint),
-            "has_body": bool(endpoint.request_body_schema) and endpoint.method in ("POST", "PUT", "PATCH"),
+            "params_dict": _build_params_dict(query),
             "docstring_args": _build_docstring_args(endpoint),
             "response_fields": [r.name for r in endpoint.response_schema],
-            "has_query_params": any(p.location == "query" for p in endpoint.parameters),
+            "has_query_params": bool(query),
             "base_url": endpoint.base_url,
             "return_type": _build_return_type(endpoint),
             "typeddict_classes": _build_typeddict_classes(endpoint),
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
+import functools
 import hashlib
 import json
 import re
@@ -14,13 +16,15 @@ from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 
 import httpx
+import orjson
 import yaml
 
 from mce.compiler.codegen import CodeGenerator, _build_return_type
-from mce.compiler.swagger_parser import SwaggerParser
+from mce.compiler.swagger_parser import SwaggerParser, load_yaml, new_fetch_client
 from mce.compiler.top_level_codegen import TopLevelFunctionGenerator
 from mce.errors import CompileError
 from mce.models import EndpointManifest, ServerManifest, ServerSpec, SwaggerSource
+from mce.utils.hashing import hash_content
 from mce.utils.logging import get_logger
 
 if TYPE_CHECKING:
@@ -28,6 +32,33 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Maximum number of swagger sources compiled concurrently
+_MAX_CONCURRENT_COMPILES = 8
+
+# Per-server record of generated files that last passed ruff cleanly
+_LINT_CACHE_FILE = ".lint_cache.json"
+
+# Default Jinja2 bytecode cache location under the compiled output directory
+_TEMPLATE_CACHE_DIR = ".jinja_cache"
+
+
+@functools.cache
+def _ruff_binary() -> str:
+    """Resolve the ruff executable once per process.
+
+    Prefers the binary shipped with the installed ``ruff`` wheel so linting works
+    even when the virtualenv's ``bin`` directory is not on ``PATH``.
+
+    Returns:
+        Absolute path to the ruff binary, or ``"ruff"`` to defer to a ``PATH`` lookup.
+    """
+    try:
+        from ruff import find_ruff_bin  # noqa: PLC0415
+
+        return str(find_ruff_bin())
+    except (ImportError, FileNotFoundError):
+        return "ruff"
+
 
 def _to_module_name(name: str) -> str:
     """Convert a server name to a valid Python module identifier.
@@ -66,9 +97,14 @@ class Orchestrator:
             config: MCE configuration instance.
         """
         self._config = config
-        self._codegen = CodeGenerator()
-        self._top_level_gen = TopLevelFunctionGenerator()
         self._output_dir = Path(config.compiled_output_dir)
+        template_cache_dir = (
+            Path(config.template_cache_dir) if config.template_cache_dir else self._output_dir / _TEMPLATE_CACHE_DIR
+        )
+        self._codegen = CodeGenerator(template_cache_dir)
+        self._top_level_gen = TopLevelFunctionGenerator(template_cache_dir)
+        # Shared compiled_at stamp for every manifest written in one compile_all pass
+        self._compile_timestamp: str | None = None
 
     def load_swagger_sources(self) -> list[SwaggerSource]:
         """Load swagger source configurations from YAML config file.
@@ -86,7 +122,7 @@ class Orchestrator:
 
         try:
             with open(config_path, encoding="utf-8") as f:
-                raw = yaml.safe_load(f)
+                raw = load_yaml(f)
         except (OSError, yaml.YAMLError) as exc:
             raise CompileError(f"Failed to load swagger config {config_path}: {exc}") from exc
 
@@ -118,18 +154,28 @@ class Orchestrator:
             return result
 
         self._output_dir.mkdir(parents=True, exist_ok=True)
+        self._compile_timestamp = datetime.now(tz=UTC).isoformat()
+
+        # Fan out across sources so swagger fetches overlap; results keep source order.
+        # One client for the whole pass lets sources on the same host reuse connections.
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_COMPILES)
+        async with new_fetch_client() as client:
+            outcomes = await asyncio.gather(
+                *(self._compile_bounded(semaphore, source, dry_run, client) for source in sources),
+                return_exceptions=True,
+            )
 
-        for source in sources:
-            try:
-                compiled = await self._compile_source(source, dry_run=dry_run)
-                if compiled:
-                    result.compiled.append(source.name)
-                    result.total_endpoints += compiled
-                else:
-                    result.skipped.append(source.name)
-            except Exception as exc:  # noqa: BLE001
-                logger.error("compile_failed", server=source.name, error=str(exc))
+        for source, outcome in zip(sources, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                if not isinstance(outcome, Exception):
+                    raise outcome  # cancellation / interpreter exit — never swallow
+                logger.error("compile_failed", server=source.name, error=str(outcome))
                 result.failed.append(source.name)
+            elif outcome:
+                result.compiled.append(source.name)
+                result.total_endpoints += outcome
+            else:
+                result.skipped.append(source.name)
 
         if not dry_run:
             self._lint_all_generated_code()
@@ -144,12 +190,39 @@ class Orchestrator:
         )
         return result
 
-    async def _compile_source(self, source: SwaggerSource, dry_run: bool) -> int:
+    async def _compile_bounded(
+        self,
+        semaphore: asyncio.Semaphore,
+        source: SwaggerSource,
+        dry_run: bool,
+        client: httpx.AsyncClient | None = None,
+    ) -> int:
+        """Compile a single swagger source while holding a concurrency slot.
+
+        Args:
+            semaphore: Semaphore limiting concurrent source compiles.
+            source: Swagger source configuration.
+            dry_run: Skip writing files.
+            client: Shared HTTP client for swagger fetches.
+
+        Returns:
+            Number of endpoints compiled, or 0 if skipped.
+        """
+        async with semaphore:
+            return await self._compile_source(source, dry_run=dry_run, client=client)
+
+    async def _compile_source(
+        self,
+        source: SwaggerSource,
+        dry_run: bool,
+        client: httpx.AsyncClient | None = None,
+    ) -> int:
         """Compile a single swagger source.
 
         Args:
             source: Swagger source configuration.
             dry_run: Skip writing files.
+            client: Shared HTTP client for swagger fetches; None creates one per fetch.
 
         Returns:
             Number of endpoints compiled, or 0 if skipped.
@@ -162,7 +235,8 @@ class Orchestrator:
         manifest_path = server_dir / "manifest.json"
 
         # Parse the swagger document (resolves base_url from spec if not set in swaggers.yaml)
-        parser = SwaggerParser(source)
+        # A dry run only reports endpoint counts, so skip the response-schema walk
+        parser = SwaggerParser(source, client, parse_responses=not dry_run)
         spec = await parser.parse()
 
         # Propagate resolved base_url back so _generate_mcp_json uses the right value
@@ -183,28 +257,48 @@ class Orchestrator:
             # Code is current; still refresh skills and top-level tools so config
             # changes (new functions, updated YAML) propagate without a forced rebuild.
             if skills_content is not None or source.top_level_functions:
-                server_dir.mkdir(parents=True, exist_ok=True)
-            if skills_content is not None:
-                self._write_skills(server_dir, skills_content, source.name)
-            if source.top_level_functions:
-                self._write_top_level_functions(server_dir, spec, module_name, source.top_level_functions)
+                await asyncio.to_thread(
+                    self._write_outputs, server_dir, spec, module_name, source, None, skills_content
+                )
             logger.info("server_up_to_date", server=source.name)
             return 0
 
         # Generate code
         code = self._codegen.generate(spec)
 
-        # Write output
+        # Write output off the event loop so it overlaps with other sources' fetches
+        await asyncio.to_thread(self._write_outputs, server_dir, spec, module_name, source, code, skills_content)
+
+        logger.info("server_compiled", server=source.name, endpoints=len(spec.endpoints))
+        return len(spec.endpoints)
+
+    def _write_outputs(
+        self,
+        server_dir: Path,
+        spec: ServerSpec,
+        module_name: str,
+        source: SwaggerSource,
+        code: str | None,
+        skills_content: str | None,
+    ) -> None:
+        """Write all compiled artefacts for one server (blocking; run in a worker thread).
+
+        Args:
+            server_dir: Output directory for this server.
+            spec: Parsed server spec.
+            module_name: Python module directory name.
+            source: Swagger source configuration.
+            code: Generated functions.py source, or None when the code is up to date.
+            skills_content: Skills document content, or None to leave it untouched.
+        """
         server_dir.mkdir(parents=True, exist_ok=True)
-        self._write_functions(server_dir, spec, code)
-        self._write_manifest(server_dir, spec)
+        if code is not None:
+            self._write_functions(server_dir, spec, code)
+            self._write_manifest(server_dir, spec)
         self._write_skills(server_dir, skills_content, source.name)
         if source.top_level_functions:
             self._write_top_level_functions(server_dir, spec, module_name, source.top_level_functions)
 
-        logger.info("server_compiled", server=source.name, endpoints=len(spec.endpoints))
-        return len(spec.endpoints)
-
     @staticmethod
     async def _fetch_skills_content(skills_url: str, server_name: str) -> str | None:
         """Fetch skills document content from a local file path or remote HTTP(S) URL.
@@ -286,6 +380,9 @@ class Orchestrator:
         compiler_dir = Path(__file__).parent
         paths = [
             compiler_dir / "templates" / "function.py.j2",
+            compiler_dir / "templates" / "_function_header.py.j2",
+            compiler_dir / "templates" / "function_block.py.j2",
+            compiler_dir / "templates" / "get_function_block.py.j2",
             compiler_dir / "codegen.py",
         ]
         h = hashlib.sha256()
@@ -307,14 +404,15 @@ class Orchestrator:
         if not manifest_path.exists():
             return False
         try:
-            with open(manifest_path, encoding="utf-8") as f:
-                manifest = json.load(f)
-            return (
-                str(manifest.get("swagger_hash")) == current_hash
-                and str(manifest.get("template_hash")) == self._template_hash()
-            )
-        except (OSError, json.JSONDecodeError, KeyError):
+            manifest = orjson.loads(manifest_path.read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return False
+        if not isinstance(manifest, dict):
             return False
+        return (
+            str(manifest.get("swagger_hash")) == current_hash
+            and str(manifest.get("template_hash")) == self._template_hash()
+        )
 
     def _write_functions(self, server_dir: Path, spec: ServerSpec, code: str) -> None:
         """Write generated functions.py to the server output directory.
@@ -361,15 +459,14 @@ class Orchestrator:
             description=spec.description,
             swagger_hash=spec.swagger_hash,
             template_hash=self._template_hash(),
-            compiled_at=datetime.now(tz=UTC).isoformat(),
+            compiled_at=self._compile_timestamp or datetime.now(tz=UTC).isoformat(),
             base_url=spec.base_url,
             is_read_only=spec.is_read_only,
             endpoints=endpoint_manifests,
         )
 
         manifest_path = server_dir / "manifest.json"
-        with open(manifest_path, "w", encoding="utf-8") as f:
-            json.dump(manifest.model_dump(), f, indent=2)
+        manifest_path.write_bytes(manifest.model_dump_json(indent=2).encode("utf-8"))
 
         logger.debug("manifest_written", path=str(manifest_path))
 
@@ -510,15 +607,21 @@ class Orchestrator:
         return json.dumps(mcp_config, indent=2)
 
     def _lint_all_generated_code(self) -> None:
-        """Run ruff check on all generated Python files."""
+        """Run ruff check on generated Python files whose content changed since the last clean lint."""
         generated_files = list(self._output_dir.glob("**/functions.py"))
         generated_files += list(self._output_dir.glob("**/top_level_functions.py"))
         if not generated_files:
             return
 
+        file_hashes = {f: hash_content(f.read_bytes()) for f in generated_files}
+        pending = [f for f in generated_files if not self._lint_cache_hit(f, file_hashes[f])]
+        if not pending:
+            logger.info("generated_code_lint_cached", files=len(generated_files))
+            return
+
         try:
             result = subprocess.run(  # noqa: S603
-                ["ruff", "check", "--quiet", *[str(f) for f in generated_files]],  # noqa: S607
+                [_ruff_binary(), "check", "--quiet", *[str(f) for f in pending]],
                 capture_output=True,
                 text=True,
                 timeout=30,
@@ -526,6 +629,43 @@ class Orchestrator:
             if result.returncode != 0:
                 logger.warning("generated_code_lint_warnings", output=result.stdout[:2000])
             else:
-                logger.info("generated_code_lint_passed", files=len(generated_files))
+                self._record_lint_pass({f: file_hashes[f] for f in pending})
+                logger.info("generated_code_lint_passed", files=len(pending))
         except (subprocess.TimeoutExpired, FileNotFoundError) as exc:
             logger.warning("lint_skipped", reason=str(exc))
+
+    @staticmethod
+    def _read_lint_cache(server_dir: Path) -> dict[str, str]:
+        """Load the per-server map of file name → SHA256 of the last cleanly linted content.
+
+        Args:
+            server_dir: Compiled server directory.
+
+        Returns:
+            Mapping of generated file name to content hash; empty when absent or unreadable.
+        """
+        try:
+            raw = orjson.loads((server_dir / _LINT_CACHE_FILE).read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return {}
+        return {str(k): str(v) for k, v in raw.items()} if isinstance(raw, dict) else {}
+
+    def _lint_cache_hit(self, path: Path, content_hash: str) -> bool:
+        """Return True if *path* passed lint last time with identical content."""
+        return self._read_lint_cache(path.parent).get(path.name) == content_hash
+
+    def _record_lint_pass(self, file_hashes: dict[Path, str]) -> None:
+        """Persist content hashes of files that just passed ruff, grouped per server directory.
+
+        Args:
+            file_hashes: Mapping of linted file path to its content hash.
+        """
+        by_dir: dict[Path, dict[str, str]] = {}
+        for path, content_hash in file_hashes.items():
+            by_dir.setdefault(path.parent, {})[path.name] = content_hash
+
+        for server_dir, entries in by_dir.items():
+            cache = self._read_lint_cache(server_dir)
+            cache.update(entries)
+            with contextlib.suppress(OSError):
+                (server_dir / _LINT_CACHE_FILE).write_text(json.dumps(cache, indent=2), encoding="utf-8")
@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import copy
+import hashlib
+import itertools
+import logging
 import re
-from typing import Any
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 
 import httpx
+import orjson
 import yaml
 
 from mce.errors import CompileError, SwaggerFetchError
@@ -14,30 +23,127 @@ from mce.models import EndpointSpec, ParamSchema, ResponseField, ServerSpec, Swa
 from mce.utils.hashing import hash_content
 from mce.utils.logging import get_logger
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from typing import IO
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover — PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 logger = get_logger(__name__)
 
 # Maximum nesting depth before we skip a schema
 _MAX_SCHEMA_DEPTH = 2
 
-# Methods that mutate state
-_MUTATING_METHODS = {"post", "put", "patch", "delete"}
+# Methods that mutate state (compared against the uppercased method)
+_MUTATING_METHODS: frozenset[str] = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+# Path-item keys that are HTTP operations (swagger keys are lowercase by spec)
+_HTTP_METHODS: frozenset[str] = frozenset({"get", "post", "put", "patch", "delete", "head", "options"})
 
 # Unsupported discriminator keywords
-_COMPLEX_KEYWORDS = {"oneOf", "anyOf", "allOf", "discriminator", "not"}
+_COMPLEX_KEYWORDS: frozenset[str] = frozenset({"oneOf", "anyOf", "allOf", "discriminator", "not"})
+
+# Canonical instances of the schema type and parameter location vocabularies, so
+# thousands of ParamSchema/ResponseField objects share one string per value
+_TYPE_INTERN: dict[str, str] = {
+    t: sys.intern(t) for t in ("string", "integer", "number", "boolean", "object", "array", "null")
+}
+_LOCATION_INTERN: dict[str, str] = {loc: sys.intern(loc) for loc in ("query", "path", "header", "cookie", "body")}
+
+# Reusable-object sections indexed up front for $ref lookup: OpenAPI 3 components
+# and their Swagger 2.0 top-level equivalents, as (ref prefix, path into the document)
+_REF_SECTIONS: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("#/components/schemas/", ("components", "schemas")),
+    ("#/components/parameters/", ("components", "parameters")),
+    ("#/components/requestBodies/", ("components", "requestBodies")),
+    ("#/components/responses/", ("components", "responses")),
+    ("#/definitions/", ("definitions",)),
+    ("#/parameters/", ("parameters",)),
+    ("#/responses/", ("responses",)),
+)
+
+# Success response keys checked for a response schema, in priority order
+_SUCCESS_STATUS_CODES = ("200", "201", "200-299")
+
+# Timeout for fetching a remote swagger document
+_FETCH_TIMEOUT_SECONDS = 30.0
+
+# Bytes per read when streaming a remote swagger document into the hasher
+_FETCH_CHUNK_SIZE = 65536
+
+# Identifier sanitization patterns (compiled once; used per endpoint)
+_RE_ACRONYM_BOUNDARY = re.compile(r"([A-Z]+)([A-Z][a-z])")
+_RE_CAMEL_BOUNDARY = re.compile(r"([a-z\d])([A-Z])")
+_RE_NON_IDENT = re.compile(r"[^a-zA-Z0-9_]")
+_RE_UNDERSCORES = re.compile(r"_+")
+_RE_ID_SEGMENTS = re.compile(r"[a-zA-Z0-9]+")
+_RE_PATH_TEMPLATE_PARAM = re.compile(r"\{([^}]+)\}")
+
+# First non-blank character of a JSON document, for both text and byte content
+_JSON_DOCUMENT_STARTS: tuple[str | bytes, ...] = ("{", "[", b"{", b"[")
+
+
+def new_fetch_client() -> httpx.AsyncClient:
+    """Create an HTTP client configured for fetching swagger documents.
+
+    Returns:
+        Unopened AsyncClient; the caller owns its lifetime.
+    """
+    return httpx.AsyncClient(timeout=_FETCH_TIMEOUT_SECONDS, verify=False)
+
+
+def load_yaml(stream: str | bytes | IO[str] | IO[bytes]) -> Any:
+    """Parse a YAML document with the libyaml-backed safe loader when available.
+
+    Args:
+        stream: YAML text, UTF-8 bytes or an open file.
+
+    Returns:
+        The parsed document.
+
+    Raises:
+        yaml.YAMLError: When the document is not valid YAML.
+    """
+    return yaml.load(stream, Loader=_YamlLoader)
 
 
 class SwaggerParser:
-    """Parse OpenAPI 3.x / Swagger 2.0 documents into normalized ServerSpec models."""
+    """Parse OpenAPI 3.x / Swagger 2.0 documents into normalized ServerSpec models.
+
+    Models are built with ``model_construct`` (no validation): every field is
+    coerced to its declared type here, so re-validating would be redundant.
+    """
 
-    def __init__(self, source: SwaggerSource) -> None:
+    def __init__(
+        self,
+        source: SwaggerSource,
+        client: httpx.AsyncClient | None = None,
+        *,
+        parse_responses: bool = True,
+    ) -> None:
         """Initialize parser for the given swagger source.
 
         Args:
             source: Swagger source configuration.
+            client: Shared HTTP client for remote fetches so connections are reused
+                across sources; a short-lived client is created per fetch when None.
+            parse_responses: Walk response schemas into ``response_schema`` fields.
+                Callers that never read them (e.g. dry runs) pass False to skip the walk.
         """
         self._source = source
+        self._client = client
+        self._parse_responses = parse_responses
+        # Per-endpoint log calls reuse one bound logger and skip building events below the level
+        self._log = logger.bind(server=source.name)
+        self._debug_enabled = self._log.is_enabled_for(logging.DEBUG)
         self._raw_doc: dict[str, Any] = {}
         self._components: dict[str, Any] = {}
+        # Per-document memos: a schema referenced from many endpoints is resolved and walked once
+        self._ref_cache: dict[str, dict[str, Any] | None] = {}
+        self._fields_cache: dict[tuple[str, int], list[ResponseField]] = {}
 
     async def parse(self) -> ServerSpec:
         """Fetch and parse the swagger document.
@@ -49,14 +155,17 @@ class SwaggerParser:
             SwaggerFetchError: When document cannot be loaded.
             CompileError: When document format is unsupported.
         """
-        raw_content = await self._fetch_document()
+        raw_content, doc_hash = await self._fetch_document()
+
         self._raw_doc = self._load_document(raw_content)
+        self._fields_cache.clear()
         self._components = self._raw_doc.get("components", {}).get("schemas", {})
+        self._index_refs()
 
-        doc_hash = hash_content(raw_content)
         description = self._extract_description()
         base_url = self._resolve_base_url()
-        endpoints = self._parse_paths()
+        # Walking the paths is pure CPU; run it off the loop so concurrent source fetches keep progressing
+        endpoints = await asyncio.to_thread(self._parse_paths)
 
         logger.info(
             "swagger_parsed",
@@ -65,7 +174,7 @@ class SwaggerParser:
             swagger_hash=doc_hash[:12],
         )
 
-        return ServerSpec(
+        return ServerSpec.model_construct(
             name=self._source.name,
             description=description,
             base_url=base_url,
@@ -74,11 +183,12 @@ class SwaggerParser:
             swagger_hash=doc_hash,
         )
 
-    async def _fetch_document(self) -> str:
+    async def _fetch_document(self) -> tuple[str | bytes, str]:
         """Fetch swagger document from URL or local file path.
 
         Returns:
-            Raw document content as string.
+            Tuple of (raw document content, SHA256 hex digest of the content).
+            Local files are returned as undecoded bytes.
 
         Raises:
             SwaggerFetchError: When fetch fails.
@@ -90,49 +200,64 @@ class SwaggerParser:
             return await self._fetch_remote(url)
         return self._fetch_local(url)
 
-    async def _fetch_remote(self, url: str) -> str:
+    async def _fetch_remote(self, url: str) -> tuple[str, str]:
         """Fetch swagger document from a remote URL.
 
+        The body is streamed and hashed chunk by chunk, so the digest is ready
+        when the download finishes instead of requiring a second pass.
+
         Args:
             url: HTTP/HTTPS URL.
 
         Returns:
-            Response body as string.
+            Tuple of (response body as string, SHA256 hex digest of the body).
 
         Raises:
             SwaggerFetchError: On network or HTTP errors.
         """
         try:
-            async with httpx.AsyncClient(timeout=30.0, verify=False) as client:
-                response = await client.get(url, follow_redirects=True)
+            async with contextlib.AsyncExitStack() as stack:
+                client = self._client
+                if client is None:
+                    client = await stack.enter_async_context(new_fetch_client())
+                response = await stack.enter_async_context(client.stream("GET", url, follow_redirects=True))
                 response.raise_for_status()
-                return response.text
+                hasher = hashlib.sha256()
+                buf = bytearray()
+                async for chunk in response.aiter_bytes(_FETCH_CHUNK_SIZE):
+                    hasher.update(chunk)
+                    buf += chunk
+                # Lenient like response.text: a mis-declared charset must not fail the fetch
+                return buf.decode(response.encoding or "utf-8", errors="replace"), hasher.hexdigest()
         except httpx.HTTPError as exc:
             raise SwaggerFetchError(f"Failed to fetch swagger from {url}: {exc}") from exc
 
-    def _fetch_local(self, path: str) -> str:
+    def _fetch_local(self, path: str) -> tuple[bytes, str]:
         """Read swagger document from local filesystem.
 
+        The file is read in one call and left undecoded: both loaders accept
+        UTF-8 bytes, so decoding would only add a full copy of the document.
+
         Args:
             path: Filesystem path (absolute or relative).
 
         Returns:
-            File contents as string.
+            Tuple of (file contents as bytes, SHA256 hex digest of the contents).
 
         Raises:
             SwaggerFetchError: When file cannot be read.
         """
         try:
-            with open(path, encoding="utf-8") as f:
-                return f.read()
+            content = Path(path).read_bytes()
         except OSError as exc:
             raise SwaggerFetchError(f"Failed to read swagger file {path}: {exc}") from exc
+        return content, hash_content(content)
 
-    def _load_document(self, content: str) -> dict[str, Any]:
+    def _load_document(self, content: str | bytes) -> dict[str, Any]:
         """Parse YAML or JSON swagger document string.
 
         Args:
-            content: Raw document content.
+            content: Raw document content, as text or UTF-8 bytes.
 
         Returns:
             Parsed document as a dict.
@@ -140,8 +265,14 @@ class SwaggerParser:
         Raises:
             CompileError: When document parsing fails.
         """
+        doc: Any = None
+        if content.lstrip()[:1] in _JSON_DOCUMENT_STARTS:
+            # JSON is the common case for /openapi.json — skip the YAML state machine
+            with contextlib.suppress(orjson.JSONDecodeError):
+                doc = orjson.loads(content)
         try:
-            doc = yaml.safe_load(content)
+            if doc is None:
+                doc = load_yaml(content)
             if not isinstance(doc, dict):
                 raise CompileError(f"Swagger document for {self._source.name} is not a mapping")
             return doc
@@ -233,7 +364,7 @@ class SwaggerParser:
             path_level_params: list[Any] = path_item.get("parameters", [])
 
             for method, operation in path_item.items():
-                if method.lower() not in ("get", "post", "put", "patch", "delete", "head", "options"):
+                if method not in _HTTP_METHODS and method.lower() not in _HTTP_METHODS:
                     continue
                 if not isinstance(operation, dict):
                     continue
@@ -245,7 +376,7 @@ class SwaggerParser:
                     else:
                         skipped += 1
                 except Exception as exc:  # noqa: BLE001
-                    logger.warning(
+                    self._log.warning(
                         "endpoint_skipped",
                         path=path,
                         method=method,
@@ -277,36 +408,50 @@ class SwaggerParser:
             EndpointSpec if parseable, None to skip.
         """
         # Skip read-only violations
-        if self._source.is_read_only and method.lower() in _MUTATING_METHODS:
-            logger.debug("skipped_readonly_method", path=path, method=method)
+        if self._source.is_read_only and method in _MUTATING_METHODS:
+            if self._debug_enabled:
+                self._log.debug("skipped_readonly_method", path=path, method=method)
             return None
 
         operation_id = operation.get("operationId") or self._generate_operation_id(method, path)
         operation_id = self._sanitize_identifier(operation_id)
-        summary = str(operation.get("summary", operation.get("description", f"{method} {path}")))
-        description = str(operation.get("description", ""))
-
-        all_params = list(path_level_params) + list(operation.get("parameters", []))
-        parameters = self._parse_parameters(all_params)
+        # Fallbacks are only built when needed; str() only runs for non-string YAML scalars
+        raw_description = operation.get("description")
+        summary = operation.get("summary", raw_description)
+        if summary is None:
+            summary = f"{method} {path}"
+        elif not isinstance(summary, str):
+            summary = str(summary)
+        if raw_description is None:
+            description = ""
+        elif isinstance(raw_description, str):
+            description = raw_description
+        else:
+            description = str(raw_description)
+
+        parameters = self._parse_parameters(itertools.chain(path_level_params, operation.get("parameters", ())))
 
         # Auto-detect path params from URL template not explicitly declared in spec
         declared_path_names = {p.name for p in parameters if p.location == "path"}
-        for match in re.finditer(r"\{([^}]+)\}", path):
+        for match in _RE_PATH_TEMPLATE_PARAM.finditer(path):
             param_name = match.group(1)
             if param_name not in declared_path_names:
-                parameters.append(ParamSchema(name=param_name, location="path", param_type="string", required=True))
+                parameters.append(
+                    ParamSchema.model_construct(name=param_name, location="path", param_type="string", required=True)
+                )
 
         request_body_schema: dict[str, Any] | None = None
         if method in ("POST", "PUT", "PATCH"):
             request_body_schema = self._parse_request_body(operation.get("requestBody", {}))
 
-        response_schema = self._parse_response_schema(operation.get("responses", {}))
+        response_schema = self._parse_response_schema(operation.get("responses", {})) if self._parse_responses else []
 
         # Operation-level servers override the global base URL
         op_servers: list[Any] = operation.get("servers", [])
         op_base_url = str(op_servers[0].get("url", "")).rstrip("/") if op_servers else ""
 
-        return EndpointSpec(
+        raw_tags = operation.get("tags", [])
+        return EndpointSpec.model_construct(
             path=path,
             method=method,
             operation_id=operation_id,
@@ -315,7 +460,7 @@ class SwaggerParser:
             parameters=parameters,
             request_body_schema=request_body_schema,
             response_schema=response_schema,
-            tags=operation.get("tags", []),
+            tags=[str(t) for t in raw_tags] if isinstance(raw_tags, list) else [],
             base_url=op_base_url,
         )
 
@@ -329,9 +474,8 @@ class SwaggerParser:
         Returns:
             Snake-case operation ID string.
         """
-        sanitized = re.sub(r"[^a-zA-Z0-9_/]", "_", path)
-        parts = [p for p in sanitized.split("/") if p and p != "_"]
-        return f"{method.lower()}_{'_'.join(parts)}" or f"{method.lower()}_endpoint"
+        parts = _RE_ID_SEGMENTS.findall(path)
+        return f"{method.lower()}_{'_'.join(parts)}" if parts else f"{method.lower()}_endpoint"
 
     def _sanitize_identifier(self, name: str) -> str:
         """Convert a string to a valid Python snake_case identifier.
@@ -346,20 +490,20 @@ class SwaggerParser:
             Clean snake_case Python identifier.
         """
         # Split camelCase/PascalCase boundaries before lowercasing
-        name = re.sub(r"([A-Z]+)([A-Z][a-z])", r"\1_\2", name)
-        name = re.sub(r"([a-z\d])([A-Z])", r"\1_\2", name)
+        name = _RE_ACRONYM_BOUNDARY.sub(r"\1_\2", name)
+        name = _RE_CAMEL_BOUNDARY.sub(r"\1_\2", name)
         # Replace non-identifier characters with underscores
-        name = re.sub(r"[^a-zA-Z0-9_]", "_", name)
-        name = re.sub(r"_+", "_", name).strip("_")
-        if name and name[0].isdigit():
+        name = _RE_NON_IDENT.sub("_", name)
+        name = _RE_UNDERSCORES.sub("_", name).strip("_")
+        if name[:1].isdigit():
             name = f"fn_{name}"
         return name.lower() or "endpoint"
 
-    def _parse_parameters(self, raw_params: list[Any]) -> list[ParamSchema]:
+    def _parse_parameters(self, raw_params: Iterable[Any]) -> list[ParamSchema]:
         """Parse parameter list from swagger params array.
 
         Args:
-            raw_params: Raw parameter objects list.
+            raw_params: Raw parameter objects, consumed once.
 
         Returns:
             List of normalized ParamSchema objects.
@@ -379,15 +523,16 @@ class SwaggerParser:
                 continue
             seen.add(name)
 
-            location = raw.get("in", "query")
+            location = str(raw.get("in", "query"))
+            location = _LOCATION_INTERN.get(location, location)
             schema = raw.get("schema", {})
             param_type = self._extract_type(schema)
             required = bool(raw.get("required", location == "path"))
             enum_values = schema.get("enum") if isinstance(schema.get("enum"), list) else None
 
             params.append(
-                ParamSchema(
-                    name=name,
+                ParamSchema.model_construct(
+                    name=str(name),
                     location=location,
                     param_type=param_type,
                     required=required,
@@ -406,26 +551,27 @@ class SwaggerParser:
             body: requestBody object from swagger.
 
         Returns:
-            Simplified schema dict or None.
+            Simplified schema dict or None. It is a deep copy, so it never
+            aliases a component shared with other endpoints of the document.
         """
         if not body:
             return None
 
         content = body.get("content", {})
         json_content = content.get("application/json", {})
-        schema = json_content.get("schema")
+        schema: dict[str, Any] | None = json_content.get("schema")
         if not schema:
             return None
 
         if "$ref" in schema:
             resolved = self._resolve_ref(schema["$ref"])
-            return resolved if resolved else None
+            return copy.deepcopy(resolved) if resolved else None
 
         # Check complexity — skip if unsupported keywords present
-        if any(k in schema for k in _COMPLEX_KEYWORDS):
+        if not _COMPLEX_KEYWORDS.isdisjoint(schema):
             return None
 
-        return dict(schema)
+        return copy.deepcopy(schema)
 
     def _parse_response_schema(self, responses: dict[str, Any]) -> list[ResponseField]:
         """Extract response fields from 200/201 response schema.
@@ -436,7 +582,7 @@ class SwaggerParser:
         Returns:
             List of ResponseField objects.
         """
-        for status_code in ("200", "201", "200-299"):
+        for status_code in _SUCCESS_STATUS_CODES:
             if status_code in responses:
                 resp = responses[status_code]
                 if not isinstance(resp, dict):
@@ -461,15 +607,35 @@ class SwaggerParser:
         )
         json_schema = json_content.get("schema", {})
 
-        if "$ref" in json_schema:
-            resolved = self._resolve_ref(json_schema["$ref"])
+        ref = json_schema.get("$ref") if isinstance(json_schema, dict) else None
+        if ref is not None:
+            resolved = self._resolve_ref(ref)
             json_schema = resolved if resolved else {}
 
-        if any(k in json_schema for k in _COMPLEX_KEYWORDS):
+        if isinstance(json_schema, dict) and not _COMPLEX_KEYWORDS.isdisjoint(json_schema):
             return []
 
+        if ref is not None:
+            return self._ref_fields(ref, depth=0)
         return self._schema_to_fields(json_schema, depth=0)
 
+    def _ref_fields(self, ref: str, depth: int) -> list[ResponseField]:
+        """Convert the schema behind a ``$ref`` to fields, memoized per (ref, depth).
+
+        Args:
+            ref: Reference string like #/components/schemas/Foo.
+            depth: Recursion depth the referenced schema is walked at.
+
+        Returns:
+            List of ResponseField objects (shared between callers; do not mutate).
+        """
+        key = (ref, depth)
+        fields = self._fields_cache.get(key)
+        if fields is None:
+            fields = self._schema_to_fields(self._resolve_ref(ref) or {}, depth)
+            self._fields_cache[key] = fields
+        return fields
+
     def _schema_to_fields(self, schema: dict[str, Any], depth: int) -> list[ResponseField]:
         """Recursively convert schema to ResponseField list.
 
@@ -490,19 +656,23 @@ class SwaggerParser:
             props: dict[str, Any] = schema.get("properties", {})
             required_set: set[str] = set(schema.get("required", []))
             for prop_name, prop_schema in props.items():
-                if "$ref" in prop_schema:
-                    resolved = self._resolve_ref(prop_schema["$ref"])
+                prop_ref = prop_schema.get("$ref") if isinstance(prop_schema, dict) else None
+                if prop_ref is not None:
+                    resolved = self._resolve_ref(prop_ref)
                     prop_schema = resolved if resolved else {}  # noqa: PLW2901
 
                 field_type = self._extract_type(prop_schema)
                 nested: list[ResponseField] | None = None
 
                 if field_type == "object" and depth < _MAX_SCHEMA_DEPTH:
-                    nested = self._schema_to_fields(prop_schema, depth + 1) or None
+                    if prop_ref is not None:
+                        nested = self._ref_fields(prop_ref, depth + 1) or None
+                    else:
+                        nested = self._schema_to_fields(prop_schema, depth + 1) or None
 
                 fields.append(
-                    ResponseField(
-                        name=prop_name,
+                    ResponseField.model_construct(
+                        name=str(prop_name),
                         field_type=field_type,
                         description=str(prop_schema.get("description", "")),
                         required=prop_name in required_set,
@@ -513,12 +683,12 @@ class SwaggerParser:
         elif schema_type == "array":
             items = schema.get("items", {})
             if "$ref" in items:
-                resolved = self._resolve_ref(items["$ref"])
-                items = resolved if resolved else {}
-            item_fields = self._schema_to_fields(items, depth + 1)
+                item_fields = self._ref_fields(items["$ref"], depth + 1)
+            else:
+                item_fields = self._schema_to_fields(items, depth + 1)
             if item_fields:
                 fields.append(
-                    ResponseField(
+                    ResponseField.model_construct(
                         name="items",
                         field_type="array",
                         nested=item_fields if depth < _MAX_SCHEMA_DEPTH else None,
@@ -541,9 +711,27 @@ class SwaggerParser:
         raw_type = schema.get("type", "string")
         if isinstance(raw_type, list):
             # Handle nullable types like ["string", "null"]
-            non_null = [t for t in raw_type if t != "null"]
-            return str(non_null[0]) if non_null else "string"
-        return str(raw_type)
+            raw_type = next((t for t in raw_type if t != "null"), "string")
+        type_name = str(raw_type)
+        return _TYPE_INTERN.get(type_name, type_name)
+
+    def _index_refs(self) -> None:
+        """Pre-populate the $ref cache with every reusable object in the document.
+
+        One pass over the component sections turns each later resolution of a
+        ``#/components/...`` (or Swagger 2.0 ``#/definitions/...``) pointer into
+        a single dict lookup. Any other local pointer is still walked lazily.
+        """
+        self._ref_cache.clear()
+        for prefix, path in _REF_SECTIONS:
+            section: Any = self._raw_doc
+            for key in path:
+                section = section.get(key) if isinstance(section, dict) else None
+            if not isinstance(section, dict):
+                continue
+            for name, obj in section.items():
+                if isinstance(obj, dict):
+                    self._ref_cache[f"{prefix}{name}"] = obj
 
     def _resolve_ref(self, ref: str) -> dict[str, Any] | None:
         """Resolve a $ref pointer within local components/schemas.
@@ -552,16 +740,21 @@ class SwaggerParser:
             ref: Reference string like #/components/schemas/Foo.
 
         Returns:
-            Resolved schema dict or None if not found.
+            Resolved schema dict or None if not found. The dict is the node from
+            the (cached) parsed document itself, so callers must treat it as read-only.
         """
-        if not ref.startswith("#/"):
-            return None  # External $ref not supported
-
-        parts = ref.lstrip("#/").split("/")
-        node: Any = self._raw_doc
-        try:
-            for part in parts:
-                node = node[part]
-            return dict(node) if isinstance(node, dict) else None
-        except (KeyError, TypeError):
-            return None
+        if ref in self._ref_cache:
+            return self._ref_cache[ref]
+
+        resolved: dict[str, Any] | None = None
+        if ref.startswith("#/"):  # External $ref not supported
+            node: Any = self._raw_doc
+            try:
+                for part in ref.lstrip("#/").split("/"):
+                    node = node[part]
+                resolved = node if isinstance(node, dict) else None
+            except (KeyError, TypeError):
+                resolved = None
+
+        self._ref_cache[ref] = resolved
+        return resolved
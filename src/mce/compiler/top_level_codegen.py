@@ -16,9 +16,11 @@ from typing import TYPE_CHECKING, Any
 from jinja2 import Environment, FileSystemLoader, StrictUndefined
 
 from mce.compiler.codegen import (
+    _build_bytecode_cache,
     _build_docstring_args,
     _build_function_signature,
     _build_return_type,
+    _partition_parameters,
     _safe_name,
 )
 from mce.errors import CompileError
@@ -63,14 +65,19 @@ class TopLevelFunctionGenerator:
       function as a FastMCP ``@mcp.tool()`` at startup.
     """
 
-    def __init__(self) -> None:
-        """Initialise the Jinja2 environment."""
+    def __init__(self, bytecode_cache_dir: Path | None = None) -> None:
+        """Initialise the Jinja2 environment.
+
+        Args:
+            bytecode_cache_dir: Directory for compiled template bytecode; None disables the cache.
+        """
         self._env = Environment(
             loader=FileSystemLoader(str(_TEMPLATES_DIR)),
             undefined=StrictUndefined,
             trim_blocks=True,
             lstrip_blocks=True,
             keep_trailing_newline=True,
+            bytecode_cache=_build_bytecode_cache(bytecode_cache_dir),
         )
 
     def generate(
@@ -151,7 +158,8 @@ class TopLevelFunctionGenerator:
         Returns:
             Dict with all template variables for this function.
         """
-        sig = _build_function_signature(endpoint)
+        required, optional, _query, _path = _partition_parameters(endpoint)
+        sig = _build_function_signature(endpoint, required, optional)
 
         # Build "kwarg=kwarg" strings so asyncio.to_thread gets the right values
         call_kwargs: list[str] = []
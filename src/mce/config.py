@@ -26,11 +26,15 @@ class MCEConfig(BaseSettings):
     port: int = 8000
     log_level: str = "INFO"
     debug: bool = False
+    # Upper bound on calls a single batch_execute request runs at the same time
+    max_concurrent_tools: int = 8
 
     # Compiler
     compile_on_startup: bool = True
     compiled_output_dir: str = "./compiled"
     swagger_config_file: str = "./config/swaggers.yaml"
+    # Jinja2 bytecode cache for the code templates; empty = <compiled_output_dir>/.jinja_cache
+    template_cache_dir: str = ""
     # LiteLLM model string — use provider/model format, e.g.:
     #   openai/gpt-4o  |  anthropic/claude-3-5-sonnet-20241022
     #   gemini/gemini-2.0-flash  |  openrouter/mistralai/mistral-7b-instruct
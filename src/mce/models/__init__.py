@@ -4,16 +4,22 @@ from __future__ import annotations
 
 from typing import Annotated, Any, Literal
 
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator
 
 # ---------------------------------------------------------------------------
 # Swagger / OpenAPI models (swagger.py namespace)
 # ---------------------------------------------------------------------------
 
+# Parsed specs are handed between compiler stages as-is, so they are immutable
+# once built
+_FROZEN = ConfigDict(frozen=True)
+
 
 class ParamSchema(BaseModel):
     """Represents a single parameter to an API endpoint."""
 
+    model_config = _FROZEN
+
     name: str
     location: str  # "query" | "path" | "header" | "body"
     param_type: str  # "string" | "integer" | "number" | "boolean" | "object" | "array"
@@ -26,6 +32,8 @@ class ParamSchema(BaseModel):
 class ResponseField(BaseModel):
     """Represents a field in an API response schema."""
 
+    model_config = _FROZEN
+
     name: str
     field_type: str
     description: str = ""
@@ -36,6 +44,8 @@ class ResponseField(BaseModel):
 class EndpointSpec(BaseModel):
     """Normalized representation of a single API endpoint."""
 
+    model_config = _FROZEN
+
     path: str
     method: str
     operation_id: str
@@ -51,6 +61,8 @@ class EndpointSpec(BaseModel):
 class ServerSpec(BaseModel):
     """Normalized representation of a complete API server from a swagger doc."""
 
+    model_config = _FROZEN
+
     name: str
     description: str
     base_url: str
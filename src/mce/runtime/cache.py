@@ -2,38 +2,57 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
+import contextlib
 import time
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import aiosqlite
 
 from mce.errors import CacheError
-from mce.models import CacheEntry, CacheSummary
+from mce.runtime.cache_db import (
+    DELETE_BY_SWAGGER_HASH_SQL,
+    DELETE_EXPIRED_SQL,
+    EVICT_LRU_SQL,
+    FTS_MIN_QUERY_CHARS,
+    HIT_ENTRY_SQL,
+    INCREMENTAL_VACUUM_SQL,
+    SEARCH_ALL_SQL,
+    SEARCH_FTS_SQL,
+    SEARCH_MATCHING_SQL,
+    TOUCH_ENTRY_SQL,
+    UPSERT_ENTRY_SQL,
+    configure_connection,
+    count_entries,
+    delete_entry,
+    encode_servers,
+    migrate_schema,
+    row_to_entry,
+    row_to_summary,
+)
+from mce.runtime.cache_writer import BatchWriter
 from mce.utils.hashing import hash_code
 from mce.utils.logging import get_logger
 
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from mce.models import CacheEntry, CacheSummary
+
 logger = get_logger(__name__)
 
-_CREATE_TABLE_SQL = """
-CREATE TABLE IF NOT EXISTS code_cache (
-    id TEXT PRIMARY KEY,
-    description TEXT NOT NULL,
-    code TEXT NOT NULL,
-    servers_used TEXT NOT NULL,
-    swagger_hash TEXT NOT NULL,
-    created_at REAL NOT NULL,
-    last_used_at REAL NOT NULL,
-    use_count INTEGER DEFAULT 1,
-    ttl_seconds INTEGER NOT NULL
-);
-CREATE INDEX IF NOT EXISTS idx_cache_last_used ON code_cache(last_used_at);
-CREATE INDEX IF NOT EXISTS idx_cache_description ON code_cache(description);
-"""
+# LRU recency is refreshed on a hit only once it is older than this; finer
+# resolution doesn't change which entries are evicted in practice
+_TOUCH_INTERVAL_SECONDS = 60.0
 
 
 class CacheStore:
-    """Async SQLite-backed cache for successfully executed code snippets."""
+    """Async SQLite-backed cache for successfully executed code snippets.
+
+    A single connection is opened on first use and reused for every operation;
+    call ``close()`` on shutdown to stop its worker thread.
+    """
 
     def __init__(self, db_path: str, ttl_seconds: int = 3600, max_entries: int = 500) -> None:
         """Initialize the cache store.
@@ -46,6 +65,16 @@ class CacheStore:
         self._db_path = db_path
         self._ttl_seconds = ttl_seconds
         self._max_entries = max_entries
+        self._db: aiosqlite.Connection | None = None
+        # Serializes operations so one coroutine's statements never join another's transaction
+        self._lock = asyncio.Lock()
+        # Set by initialize() when this SQLite build provides FTS5 with the trigram tokenizer
+        self._fts_enabled = False
+        # Row count tracked in-process so store() needs no COUNT(*) scan; None until first counted.
+        # Assumes this store is the database's only writer.
+        self._row_count: int | None = None
+        # Groups concurrent store() rows into shared write transactions
+        self._writer = BatchWriter(self._write_batch)
 
     async def initialize(self) -> None:
         """Create database tables if they don't exist.
@@ -55,13 +84,46 @@ class CacheStore:
         """
         Path(self._db_path).parent.mkdir(parents=True, exist_ok=True)
         try:
-            async with aiosqlite.connect(self._db_path) as db:
-                await db.executescript(_CREATE_TABLE_SQL)
-                await db.commit()
-            logger.info("cache_initialized", path=self._db_path)
+            async with self._connect() as db:
+                self._fts_enabled = await migrate_schema(db)
+                self._row_count = await count_entries(db)
+            logger.info("cache_initialized", path=self._db_path, fts=self._fts_enabled)
         except aiosqlite.Error as exc:
             raise CacheError(f"Failed to initialize cache database: {exc}") from exc
 
+    async def close(self) -> None:
+        """Finish queued stores, then close the shared database connection, if open."""
+        await self._writer.drain()
+        async with self._lock:
+            if self._db is not None:
+                await self._db.close()
+                self._db = None
+
+    @contextlib.asynccontextmanager
+    async def _connect(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Acquire exclusive use of the shared connection, opening it on first use.
+
+        Yields:
+            Open aiosqlite connection with the per-connection pragmas applied.
+        """
+        async with self._lock:
+            if self._db is None:
+                db = await aiosqlite.connect(self._db_path)
+                try:
+                    await configure_connection(db)
+                except aiosqlite.Error:
+                    await db.close()
+                    raise
+                db.row_factory = aiosqlite.Row
+                self._db = db
+            try:
+                yield self._db
+            except aiosqlite.Error:
+                # Don't leave a half-applied transaction open on the shared connection
+                with contextlib.suppress(aiosqlite.Error):
+                    await self._db.rollback()
+                raise
+
     async def store(
         self,
         code: str,
@@ -85,44 +147,72 @@ class CacheStore:
         """
         entry_id = hash_code(code)
         now = time.time()
+        params = (
+            entry_id,
+            description,
+            code,
+            encode_servers(tuple(servers_used)),
+            swagger_hash,
+            now,
+            now,
+            self._ttl_seconds,
+        )
 
-        try:
-            async with aiosqlite.connect(self._db_path) as db:
-                # Upsert — increment use_count if already exists
-                await db.execute(
-                    """
-                    INSERT INTO code_cache
-                        (id, description, code, servers_used, swagger_hash,
-                         created_at, last_used_at, use_count, ttl_seconds)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?)
-                    ON CONFLICT(id) DO UPDATE SET
-                        last_used_at = excluded.last_used_at,
-                        use_count = use_count + 1
-                    """,
-                    (
-                        entry_id,
-                        description,
-                        code,
-                        json.dumps(servers_used),
-                        swagger_hash,
-                        now,
-                        now,
-                        self._ttl_seconds,
-                    ),
-                )
-                await db.commit()
+        await self._writer.submit(params)
+
+        logger.debug("cache_stored", id=entry_id[:12], description=description[:50])
+        return entry_id
+
+    async def _write_batch(self, rows: list[tuple[object, ...]]) -> None:
+        """Upsert *rows* in a single write transaction, then apply LRU eviction.
 
-            logger.debug("cache_stored", id=entry_id[:12], description=description[:50])
-            await self._evict_if_needed()
-            return entry_id
+        Eviction runs after the upserts have committed and is best-effort, so
+        it never turns a successful store into an error.
+
+        Args:
+            rows: Bound parameters for ``UPSERT_ENTRY_SQL``, one tuple per entry.
+        """
+        async with self._connect() as db:
+            row_count = self._row_count if self._row_count is not None else await count_entries(db)
+            await db.execute("BEGIN IMMEDIATE")
+            for params in rows:
+                async with db.execute(UPSERT_ENTRY_SQL, params) as cursor:
+                    (use_count,) = await cursor.fetchone()  # type: ignore[misc]
+                if use_count == 1:
+                    row_count += 1
+            await db.commit()
+            # Only count what was committed
+            self._row_count = row_count
+            if row_count > self._max_entries:
+                await self._evict_lru(db, row_count - self._max_entries)
+
+    async def _evict_lru(self, db: aiosqlite.Connection, excess: int) -> None:
+        """Delete the *excess* least recently used entries, logging rather than raising on failure.
 
+        Args:
+            db: Active database connection.
+            excess: Number of entries over ``max_entries``.
+        """
+        try:
+            cursor = await db.execute(EVICT_LRU_SQL, (excess,))
+            await db.commit()
+            self._forget(cursor.rowcount)
+            if cursor.rowcount:
+                # Eviction is the steady-state delete path, so reclaim its pages here too
+                await db.executescript(INCREMENTAL_VACUUM_SQL)
         except aiosqlite.Error as exc:
-            raise CacheError(f"Failed to store cache entry: {exc}") from exc
+            with contextlib.suppress(aiosqlite.Error):
+                await db.rollback()
+            logger.warning("cache_eviction_failed", error=str(exc))
+            return
+        if cursor.rowcount:
+            logger.info("cache_evicted_lru", count=cursor.rowcount)
 
     async def get(self, entry_id: str) -> CacheEntry | None:
         """Retrieve a cache entry by ID.
 
-        Updates last_used_at on access and checks TTL validity.
+        Counts the hit, refreshes last_used_at when it is more than
+        ``_TOUCH_INTERVAL_SECONDS`` old, and checks TTL validity.
 
         Args:
             entry_id: Cache entry ID (SHA256 hash).
@@ -136,29 +226,23 @@ class CacheStore:
         now = time.time()
 
         try:
-            async with aiosqlite.connect(self._db_path) as db:
-                db.row_factory = aiosqlite.Row
-                async with db.execute("SELECT * FROM code_cache WHERE id = ?", (entry_id,)) as cursor:
+            async with self._connect() as db:
+                # Count and fetch a live entry in one statement; expired rows don't match
+                async with db.execute(HIT_ENTRY_SQL, (entry_id, now)) as cursor:
                     row = await cursor.fetchone()
 
                 if row is None:
-                    logger.debug("cache_miss", id=entry_id[:12])
-                    return None
-
-                entry = self._row_to_entry(row)
-
-                # Check TTL
-                if now - entry.created_at > entry.ttl_seconds:
-                    await self._delete(db, entry_id)
+                    # Absent or expired: the DELETE drops an expired row and its rowcount tells the two apart
+                    expired = await delete_entry(db, entry_id)
                     await db.commit()
-                    logger.debug("cache_expired", id=entry_id[:12])
+                    self._forget(int(expired))
+                    logger.debug("cache_expired" if expired else "cache_miss", id=entry_id[:12])
                     return None
 
-                # Update last_used_at
-                await db.execute(
-                    "UPDATE code_cache SET last_used_at = ?, use_count = use_count + 1 WHERE id = ?",
-                    (now, entry_id),
-                )
+                entry = row_to_entry(row)
+                if now - entry.last_used_at > _TOUCH_INTERVAL_SECONDS:
+                    await db.execute(TOUCH_ENTRY_SQL, (now, entry_id))
+                    entry.last_used_at = now
                 await db.commit()
 
             logger.debug("cache_hit", id=entry_id[:12])
@@ -183,41 +267,23 @@ class CacheStore:
         now = time.time()
 
         try:
-            async with aiosqlite.connect(self._db_path) as db:
-                db.row_factory = aiosqlite.Row
-
-                if query:
-                    sql = """
-                        SELECT id, description, servers_used, use_count, created_at, ttl_seconds
-                        FROM code_cache
-                        WHERE description LIKE ? AND (? - created_at) < ttl_seconds
-                        ORDER BY use_count DESC, last_used_at DESC
-                        LIMIT ?
-                    """
+            async with self._connect() as db:
+                if query and self._fts_enabled and len(query) >= FTS_MIN_QUERY_CHARS:
+                    # Quote as an FTS phrase so the query is matched literally
+                    phrase = '"' + query.replace('"', '""') + '"'
+                    sql = SEARCH_FTS_SQL
+                    params: tuple[object, ...] = (phrase, now, limit)
+                elif query:
+                    sql = SEARCH_MATCHING_SQL
                     params = (f"%{query}%", now, limit)
                 else:
-                    sql = """
-                        SELECT id, description, servers_used, use_count, created_at, ttl_seconds
-                        FROM code_cache
-                        WHERE (? - created_at) < ttl_seconds
-                        ORDER BY use_count DESC, last_used_at DESC
-                        LIMIT ?
-                    """
-                    params = (now, limit)  # type: ignore[assignment]
+                    sql = SEARCH_ALL_SQL
+                    params = (now, limit)
 
                 async with db.execute(sql, params) as cursor:
                     rows = await cursor.fetchall()
 
-            return [
-                CacheSummary(
-                    id=row["id"],
-                    description=row["description"],
-                    servers_used=json.loads(row["servers_used"]),
-                    use_count=row["use_count"],
-                    created_at=row["created_at"],
-                )
-                for row in rows
-            ]
+            return [row_to_summary(row) for row in rows]
 
         except aiosqlite.Error as exc:
             raise CacheError(f"Failed to search cache: {exc}") from exc
@@ -235,10 +301,13 @@ class CacheStore:
             CacheError: If database access fails.
         """
         try:
-            async with aiosqlite.connect(self._db_path) as db:
-                cursor = await db.execute("DELETE FROM code_cache WHERE swagger_hash = ?", (swagger_hash,))
+            async with self._connect() as db:
+                cursor = await db.execute(DELETE_BY_SWAGGER_HASH_SQL, (swagger_hash,))
                 await db.commit()
                 count = cursor.rowcount
+                self._forget(count)
+                if count:
+                    await db.executescript(INCREMENTAL_VACUUM_SQL)
 
             if count:
                 logger.info("cache_invalidated", swagger_hash=swagger_hash[:12], count=count)
@@ -258,10 +327,13 @@ class CacheStore:
         """
         now = time.time()
         try:
-            async with aiosqlite.connect(self._db_path) as db:
-                cursor = await db.execute("DELETE FROM code_cache WHERE (? - created_at) >= ttl_seconds", (now,))
+            async with self._connect() as db:
+                cursor = await db.execute(DELETE_EXPIRED_SQL, (now,))
                 await db.commit()
                 count = cursor.rowcount
+                self._forget(count)
+                if count:
+                    await db.executescript(INCREMENTAL_VACUUM_SQL)
 
             logger.debug("cache_expired_cleaned", count=count)
             return count
@@ -269,58 +341,11 @@ class CacheStore:
         except aiosqlite.Error as exc:
             raise CacheError(f"Failed to clean expired entries: {exc}") from exc
 
-    async def _evict_if_needed(self) -> None:
-        """Evict LRU entries if cache is over max_entries limit."""
-        try:
-            async with aiosqlite.connect(self._db_path) as db:
-                async with db.execute("SELECT COUNT(*) FROM code_cache") as cursor:
-                    row = await cursor.fetchone()
-                    count = row[0] if row else 0
-
-                if count > self._max_entries:
-                    excess = count - self._max_entries
-                    await db.execute(
-                        """
-                        DELETE FROM code_cache WHERE id IN (
-                            SELECT id FROM code_cache
-                            ORDER BY last_used_at ASC
-                            LIMIT ?
-                        )
-                        """,
-                        (excess,),
-                    )
-                    await db.commit()
-                    logger.info("cache_evicted_lru", count=excess)
-
-        except aiosqlite.Error as exc:
-            logger.warning("cache_eviction_failed", error=str(exc))
-
-    async def _delete(self, db: aiosqlite.Connection, entry_id: str) -> None:
-        """Delete a single cache entry.
-
-        Args:
-            db: Active database connection.
-            entry_id: Entry ID to delete.
-        """
-        await db.execute("DELETE FROM code_cache WHERE id = ?", (entry_id,))
-
-    def _row_to_entry(self, row: aiosqlite.Row) -> CacheEntry:
-        """Convert a database row to a CacheEntry model.
+    def _forget(self, removed: int) -> None:
+        """Subtract committed deletions from the tracked row count.
 
         Args:
-            row: SQLite row object.
-
-        Returns:
-            CacheEntry Pydantic model.
+            removed: Number of rows deleted.
         """
-        return CacheEntry(
-            id=row["id"],
-            description=row["description"],
-            code=row["code"],
-            servers_used=json.loads(row["servers_used"]),
-            swagger_hash=row["swagger_hash"],
-            created_at=row["created_at"],
-            last_used_at=row["last_used_at"],
-            use_count=row["use_count"],
-            ttl_seconds=row["ttl_seconds"],
-        )
+        if self._row_count is not None:
+            self._row_count = max(0, self._row_count - removed)
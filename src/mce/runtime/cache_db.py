@@ -0,0 +1,296 @@
+"""SQLite schema, statements and row mapping for the code cache."""
+
+from __future__ import annotations
+
+import functools
+
+import aiosqlite
+import orjson
+
+from mce.models import CacheEntry, CacheSummary
+from mce.utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+# File layout for a new database: larger pages for wider B-tree fanout, and page reclamation
+# on demand. Both only take effect before the first table exists; on an existing file they are no-ops.
+_NEW_DATABASE_PRAGMAS_SQL = """
+PRAGMA page_size=8192;
+PRAGMA auto_vacuum=INCREMENTAL;
+"""
+
+# WAL lets readers proceed while a writer commits; the mode persists in the database file
+_JOURNAL_MODE_SQL = "PRAGMA journal_mode=WAL"
+
+# Per-connection tuning applied when the connection is opened (these settings do not persist)
+_CONNECTION_PRAGMAS_SQL = """
+PRAGMA synchronous=NORMAL;
+PRAGMA busy_timeout=5000;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-64000;
+PRAGMA mmap_size=268435456;
+"""
+
+_CREATE_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS code_cache (
+    id TEXT PRIMARY KEY,
+    description TEXT NOT NULL,
+    code TEXT NOT NULL,
+    servers_used TEXT NOT NULL,
+    swagger_hash TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_used_at REAL NOT NULL,
+    use_count INTEGER DEFAULT 1,
+    ttl_seconds INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_cache_last_used ON code_cache(last_used_at);
+"""
+
+# Indexes created by earlier versions that no query can use (substring search can't seek a B-tree)
+_DROP_LEGACY_INDEXES_SQL = "DROP INDEX IF EXISTS idx_cache_description"
+
+# Trigram full-text index over description (external content, kept in sync by triggers).
+# Trigrams give the same case-insensitive substring semantics as LIKE '%q%' without a scan.
+_CREATE_FTS_SQL = """
+CREATE VIRTUAL TABLE IF NOT EXISTS code_cache_fts USING fts5(
+    description, content='code_cache', content_rowid='rowid', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS code_cache_fts_ai AFTER INSERT ON code_cache BEGIN
+    INSERT INTO code_cache_fts(rowid, description) VALUES (new.rowid, new.description);
+END;
+CREATE TRIGGER IF NOT EXISTS code_cache_fts_ad AFTER DELETE ON code_cache BEGIN
+    INSERT INTO code_cache_fts(code_cache_fts, rowid, description) VALUES ('delete', old.rowid, old.description);
+END;
+CREATE TRIGGER IF NOT EXISTS code_cache_fts_au AFTER UPDATE OF description ON code_cache BEGIN
+    INSERT INTO code_cache_fts(code_cache_fts, rowid, description) VALUES ('delete', old.rowid, old.description);
+    INSERT INTO code_cache_fts(rowid, description) VALUES (new.rowid, new.description);
+END;
+"""
+
+# Index rows that predate the FTS table (run once, when the table is first created)
+_REBUILD_FTS_SQL = "INSERT INTO code_cache_fts(code_cache_fts) VALUES ('rebuild')"
+
+_FTS_EXISTS_SQL = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'code_cache_fts'"
+
+# Return pages freed by a bulk delete to the filesystem (no-op unless auto_vacuum is INCREMENTAL)
+INCREMENTAL_VACUUM_SQL = "PRAGMA incremental_vacuum"
+
+# Trigram tokens are three characters; shorter queries can't use the index
+FTS_MIN_QUERY_CHARS = 3
+
+_COUNT_ENTRIES_SQL = "SELECT COUNT(*) FROM code_cache"
+
+# Drop the given number of least recently used rows; walks idx_cache_last_used, no full count
+EVICT_LRU_SQL = """
+DELETE FROM code_cache WHERE id IN (
+    SELECT id FROM code_cache
+    ORDER BY last_used_at ASC
+    LIMIT ?
+)
+"""
+
+# Count a hit on a live entry and return the updated row (bound: id, now). Leaving
+# last_used_at out of the SET list means SQLite skips idx_cache_last_used entirely.
+HIT_ENTRY_SQL = """
+UPDATE code_cache SET use_count = use_count + 1
+WHERE id = ? AND (? - created_at) <= ttl_seconds
+RETURNING *
+"""
+
+TOUCH_ENTRY_SQL = "UPDATE code_cache SET last_used_at = ? WHERE id = ?"
+
+# Insert a new entry, or bump recency and use_count if the same code is stored again.
+# The returned use_count is 1 only when a row was inserted.
+UPSERT_ENTRY_SQL = """
+INSERT INTO code_cache
+    (id, description, code, servers_used, swagger_hash,
+     created_at, last_used_at, use_count, ttl_seconds)
+VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?)
+ON CONFLICT(id) DO UPDATE SET
+    last_used_at = excluded.last_used_at,
+    use_count = use_count + 1
+RETURNING use_count
+"""
+
+# Live entries whose description contains the bound FTS phrase (bound: phrase, now, limit)
+SEARCH_FTS_SQL = """
+SELECT c.id, c.description, c.servers_used, c.use_count, c.created_at
+FROM code_cache_fts f JOIN code_cache c ON c.rowid = f.rowid
+WHERE code_cache_fts MATCH ? AND (? - c.created_at) < c.ttl_seconds
+ORDER BY c.use_count DESC, c.last_used_at DESC
+LIMIT ?
+"""
+
+# Live entries whose description contains the bound pattern (bound: pattern, now, limit)
+SEARCH_MATCHING_SQL = """
+SELECT id, description, servers_used, use_count, created_at
+FROM code_cache
+WHERE description LIKE ? AND (? - created_at) < ttl_seconds
+ORDER BY use_count DESC, last_used_at DESC
+LIMIT ?
+"""
+
+# All live entries (bound: now, limit)
+SEARCH_ALL_SQL = """
+SELECT id, description, servers_used, use_count, created_at
+FROM code_cache
+WHERE (? - created_at) < ttl_seconds
+ORDER BY use_count DESC, last_used_at DESC
+LIMIT ?
+"""
+
+DELETE_BY_SWAGGER_HASH_SQL = "DELETE FROM code_cache WHERE swagger_hash = ?"
+
+DELETE_EXPIRED_SQL = "DELETE FROM code_cache WHERE (? - created_at) >= ttl_seconds"
+
+_DELETE_ENTRY_SQL = "DELETE FROM code_cache WHERE id = ?"
+
+# Distinct server sets seen by store() and read back by get()/search(); callers tend to reuse a handful
+_SERVERS_CODEC_CACHE_SIZE = 256
+
+
+@functools.lru_cache(maxsize=_SERVERS_CODEC_CACHE_SIZE)
+def encode_servers(servers_used: tuple[str, ...]) -> str:
+    """Serialize a server list to the JSON text stored in ``servers_used``.
+
+    Args:
+        servers_used: Server names, in the caller's order.
+
+    Returns:
+        JSON array string.
+    """
+    return orjson.dumps(servers_used).decode("utf-8")
+
+
+@functools.lru_cache(maxsize=_SERVERS_CODEC_CACHE_SIZE)
+def decode_servers(raw: str) -> tuple[str, ...]:
+    """Parse the JSON text stored in ``servers_used``.
+
+    Args:
+        raw: JSON array string from the database.
+
+    Returns:
+        Server names; callers copy them into a list per row.
+    """
+    return tuple(orjson.loads(raw))
+
+
+async def configure_connection(db: aiosqlite.Connection) -> None:
+    """Apply the per-connection pragmas to a newly opened connection.
+
+    Args:
+        db: Freshly opened database connection.
+    """
+    await db.executescript(_CONNECTION_PRAGMAS_SQL)
+
+
+async def migrate_schema(db: aiosqlite.Connection) -> bool:
+    """Create the cache table and indexes, upgrading databases from earlier versions.
+
+    Args:
+        db: Active database connection.
+
+    Returns:
+        True if the description full-text index is available.
+
+    Raises:
+        aiosqlite.Error: If the table cannot be created.
+    """
+    await db.executescript(_NEW_DATABASE_PRAGMAS_SQL)
+    await db.execute(_JOURNAL_MODE_SQL)
+    await db.executescript(_CREATE_TABLE_SQL)
+    await db.execute(_DROP_LEGACY_INDEXES_SQL)
+    await db.commit()
+    return await _init_fts(db)
+
+
+async def _init_fts(db: aiosqlite.Connection) -> bool:
+    """Create the description full-text index, backfilling it on first creation.
+
+    Args:
+        db: Active database connection.
+
+    Returns:
+        True if the index is available; False if SQLite lacks FTS5/trigram,
+        in which case search falls back to a LIKE scan.
+    """
+    async with db.execute(_FTS_EXISTS_SQL) as cursor:
+        existed = await cursor.fetchone() is not None
+    try:
+        await db.executescript(_CREATE_FTS_SQL)
+        if not existed:
+            await db.execute(_REBUILD_FTS_SQL)
+        await db.commit()
+    except aiosqlite.OperationalError as exc:
+        await db.rollback()
+        logger.warning("cache_fts_unavailable", error=str(exc))
+        return False
+    return True
+
+
+def row_to_entry(row: aiosqlite.Row) -> CacheEntry:
+    """Convert a database row to a CacheEntry model.
+
+    Args:
+        row: SQLite row object.
+
+    Returns:
+        CacheEntry Pydantic model.
+    """
+    return CacheEntry(
+        id=row["id"],
+        description=row["description"],
+        code=row["code"],
+        servers_used=list(decode_servers(row["servers_used"])),
+        swagger_hash=row["swagger_hash"],
+        created_at=row["created_at"],
+        last_used_at=row["last_used_at"],
+        use_count=row["use_count"],
+        ttl_seconds=row["ttl_seconds"],
+    )
+
+
+def row_to_summary(row: aiosqlite.Row) -> CacheSummary:
+    """Convert a search result row to a CacheSummary model.
+
+    Args:
+        row: SQLite row with the summary columns.
+
+    Returns:
+        CacheSummary Pydantic model.
+    """
+    return CacheSummary(
+        id=row["id"],
+        description=row["description"],
+        servers_used=list(decode_servers(row["servers_used"])),
+        use_count=row["use_count"],
+        created_at=row["created_at"],
+    )
+
+
+async def count_entries(db: aiosqlite.Connection) -> int:
+    """Count all rows, expired or not.
+
+    Args:
+        db: Active database connection.
+
+    Returns:
+        Number of rows in ``code_cache``.
+    """
+    async with db.execute(_COUNT_ENTRIES_SQL) as cursor:
+        (count,) = await cursor.fetchone()  # type: ignore[misc]
+    return int(count)
+
+
+async def delete_entry(db: aiosqlite.Connection, entry_id: str) -> bool:
+    """Delete a single cache entry.
+
+    Args:
+        db: Active database connection.
+        entry_id: Entry ID to delete.
+
+    Returns:
+        True if a row was deleted.
+    """
+    cursor = await db.execute(_DELETE_ENTRY_SQL, (entry_id,))
+    return cursor.rowcount > 0
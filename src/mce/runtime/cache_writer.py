@@ -0,0 +1,111 @@
+"""Batched writer that commits concurrent cache stores in shared transactions."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+import aiosqlite
+
+from mce.errors import CacheError
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+# One queued row: its bound parameters and the future its store() call waits on
+type _Pending = tuple[tuple[object, ...], asyncio.Future[None]]
+
+
+def _store_error(exc: Exception) -> Exception:
+    """Map a failed write to the exception raised by ``store()``.
+
+    Args:
+        exc: Exception raised while writing the entry.
+
+    Returns:
+        CacheError for database errors, otherwise *exc* unchanged.
+    """
+    if not isinstance(exc, aiosqlite.Error):
+        return exc
+    error = CacheError(f"Failed to store cache entry: {exc}")
+    error.__cause__ = exc
+    return error
+
+
+class BatchWriter:
+    """Queue rows from concurrent callers and write them in batches.
+
+    Rows that arrive while a batch is being committed form the next batch, so
+    concurrent executions share a transaction instead of each paying for one.
+    """
+
+    def __init__(self, write: Callable[[list[tuple[object, ...]]], Awaitable[None]]) -> None:
+        """Initialize the writer.
+
+        Args:
+            write: Writes a list of rows in one transaction, raising if it fails.
+        """
+        self._write = write
+        # Rows waiting for the next batch, and the task currently draining them
+        self._pending: list[_Pending] = []
+        self._flush_task: asyncio.Task[None] | None = None
+
+    async def submit(self, row: tuple[object, ...]) -> None:
+        """Queue *row* and wait until the batch containing it has been written.
+
+        Args:
+            row: Bound parameters for one entry.
+
+        Raises:
+            CacheError: If the row could not be written or the writer was cancelled.
+        """
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._pending.append((row, future))
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush())
+        await future
+
+    async def drain(self) -> None:
+        """Wait for every queued row to be written or failed."""
+        if self._flush_task is not None:
+            # wait() rather than await: a cancelled flush must not abort the caller
+            await asyncio.wait([self._flush_task])
+
+    async def _flush(self) -> None:
+        """Write queued rows in batches until the queue is empty."""
+        batch: list[_Pending] = []
+        try:
+            while self._pending:
+                batch, self._pending = self._pending, []
+                await self._commit(batch)
+        finally:
+            # Only reached with unresolved futures when the flush itself was cancelled;
+            # fail those rows rather than leave their callers waiting forever
+            stranded, self._pending = [*batch, *self._pending], []
+            for _, future in stranded:
+                if not future.done():
+                    future.set_exception(CacheError("Failed to store cache entry: write was cancelled"))
+
+    async def _commit(self, batch: list[_Pending]) -> None:
+        """Write one batch and resolve each row's future with its own outcome.
+
+        If the batch transaction fails, its rows are retried one at a time so an
+        unrelated row is never failed by another row's error.
+
+        Args:
+            batch: Queued ``(row, future)`` pairs.
+        """
+        try:
+            await self._write([row for row, _ in batch])
+        except Exception as exc:  # noqa: BLE001 — delivered to the waiting callers instead
+            if len(batch) == 1:
+                _, future = batch[0]
+                if not future.done():
+                    future.set_exception(_store_error(exc))
+                return
+            for item in batch:
+                await self._commit([item])
+            return
+        for _, future in batch:
+            if not future.done():
+                future.set_result(None)
@@ -26,7 +26,6 @@ import asyncio
 import base64
 import json
 import re
-import subprocess
 import time
 import uuid
 from contextlib import asynccontextmanager, suppress
@@ -55,12 +54,60 @@ logger = get_logger(__name__)
 # Pattern to detect server function imports in user code
 _SERVER_IMPORT_RE = re.compile(r"from\s+(\w+)\.functions\s+import|import\s+(\w+)\.functions")
 
+# Module suffix every compiled server import contains — used to bound the regex scan
+_FUNCTIONS_SUFFIX = ".functions"
+
 # Maximum bytes of container output to capture
 _MAX_OUTPUT_BYTES = 1_048_576  # 1 MB
 
+# Seconds to wait for ruff before skipping the lint step
+_LINT_TIMEOUT_SECONDS = 10
+
+# Most lint output kept for the error message; ruff is killed once it writes more
+_LINT_OUTPUT_MAX_BYTES = 2000
+
 # Mount point for compiled functions inside every sandbox container
 _CONTAINER_COMPILED_PATH = "/mce_compiled"
 
+# Prefix that makes compiled server modules importable inside the sandbox
+_PATH_INJECTION = f"""
+import sys as _sys
+_sys.path.insert(0, {_CONTAINER_COMPILED_PATH!r})
+"""
+
+
+async def _read_lint_output(proc: asyncio.subprocess.Process) -> tuple[bytes, bool]:
+    """Read at most ``_LINT_OUTPUT_MAX_BYTES`` of ruff's report.
+
+    Args:
+        proc: Running ruff process with piped stdout; its stdin is already closed.
+
+    Returns:
+        Tuple of (report bytes, whether the report was cut off). When it was cut
+        off the process is left running for the caller to kill.
+    """
+    assert proc.stdout is not None
+    output = bytearray()
+    while len(output) <= _LINT_OUTPUT_MAX_BYTES:
+        chunk = await proc.stdout.read(_LINT_OUTPUT_MAX_BYTES + 1 - len(output))
+        if not chunk:
+            await proc.wait()
+            return bytes(output), False
+        output += chunk
+    return bytes(output[:_LINT_OUTPUT_MAX_BYTES]), True
+
+
+async def _reap_lint(proc: asyncio.subprocess.Process) -> None:
+    """Kill ruff if it is still running and wait for it to exit.
+
+    Args:
+        proc: ruff process started by :meth:`CodeExecutor._start_lint`.
+    """
+    if proc.returncode is None:
+        with suppress(ProcessLookupError):
+            proc.kill()
+        await proc.wait()
+
 
 def _detect_servers_used(code: str) -> list[str]:
     """Detect which server function modules are imported in the code.
@@ -71,12 +118,17 @@ def _detect_servers_used(code: str) -> list[str]:
     Returns:
         Sorted list of server names referenced by ``from <name>.functions import``.
     """
-    servers: set[str] = set()
-    for match in _SERVER_IMPORT_RE.finditer(code):
-        name = match.group(1) or match.group(2)
-        if name:
-            servers.add(name)
-    return sorted(servers)
+    # Substring prefilter: most snippets import no server module, so skip the regex scan
+    first = code.find(_FUNCTIONS_SUFFIX)
+    if first == -1:
+        return []
+    # An import statement sits on one line, so only the lines spanning the first and last
+    # ".functions" need scanning — usually the import block rather than the whole snippet
+    start = code.rfind("\n", 0, first) + 1
+    end = code.find("\n", code.rfind(_FUNCTIONS_SUFFIX))
+    if end == -1:
+        end = len(code)
+    return sorted({a or b for a, b in _SERVER_IMPORT_RE.findall(code, start, end)})
 
 
 # ---------------------------------------------------------------------------
@@ -171,11 +223,17 @@ class CodeExecutor:
         self._auth_configs: Mapping[str, AuthConfig | None] = auth_configs or {}
         self._ast_guard = ASTGuard()
         self._compiled_dir = Path(config.compiled_output_dir)
+        # Host side of the compiled-functions bind mount, resolved once
+        self._compiled_host_path = str(self._compiled_dir.resolve())
+        # Combined swagger hash per server set — manifests are fixed for the process lifetime
+        self._swagger_hash_cache: dict[frozenset[str], str] = {}
         self._docker: aiodocker.Docker | None = None
         self._warm_pool: _WarmPool | None = None
         # All warm containers ever created — used by shutdown() to guarantee full cleanup
         # even for containers currently borrowed from the pool mid-execution.
         self._warm_containers: list[aiodocker.containers.DockerContainer] = []
+        # Cold-container removals still in flight — results are returned without waiting on them
+        self._pending_deletes: set[asyncio.Task[None]] = set()
 
     # ------------------------------------------------------------------
     # Lifecycle
@@ -210,16 +268,28 @@ class CodeExecutor:
             # before creating fresh ones.  This prevents container accumulation across restarts.
             await self._cleanup_stale_warm_containers()
             logger.info("warm_pool_starting", size=size)
-            for i in range(size):
-                container = await self._create_warm_container(f"mce-warm-{i}-{uuid.uuid4().hex[:6]}")
-                self._warm_containers.append(container)
-                await self._warm_pool.push(container)
+            # Create/start round trips are independent — issue them together so pool fill
+            # costs one container start-up rather than `size` of them back to back
+            created = await asyncio.gather(
+                *(self._create_warm_container(f"mce-warm-{i}-{uuid.uuid4().hex[:6]}") for i in range(size)),
+                return_exceptions=True,
+            )
+            failures: list[BaseException] = []
+            for outcome in created:
+                if isinstance(outcome, BaseException):
+                    failures.append(outcome)
+                    continue
+                # Track every container that did start so shutdown() removes it even if startup fails
+                self._warm_containers.append(outcome)
+                await self._warm_pool.push(outcome)
+            if failures:
+                raise failures[0]
             logger.info("warm_pool_ready", size=size, image=self._config.docker_image)
         else:
             logger.info("cold_mode_active", image=self._config.docker_image)
 
     async def shutdown(self) -> None:
-        """Remove all warm containers and close the Docker client.
+        """Finish pending cold-container removals, remove all warm containers and close the Docker client.
 
         Uses ``delete(force=True)`` which is atomic — it sends SIGKILL and removes
         the container in a single Docker API call, eliminating the gap between
@@ -234,6 +304,12 @@ class CodeExecutor:
         """
         cancelled = False
 
+        if self._pending_deletes:
+            try:
+                await asyncio.gather(*self._pending_deletes, return_exceptions=True)
+            except asyncio.CancelledError:
+                cancelled = True
+
         if self._warm_containers and self._docker:
             logger.info("warm_pool_stopping", count=len(self._warm_containers))
             for container in self._warm_containers:
@@ -286,23 +362,30 @@ class CodeExecutor:
         start_ms = int(time.time() * 1000)
 
         # Enforce code size limit
-        if len(code.encode()) > self._config.max_code_size_bytes:
+        code_size = len(code.encode())
+        if code_size > self._config.max_code_size_bytes:
             raise SecurityViolationError(
-                f"Code size {len(code.encode())} bytes exceeds limit of {self._config.max_code_size_bytes}"
+                f"Code size {code_size} bytes exceeds limit of {self._config.max_code_size_bytes}"
             )
 
-        # Security scan
-        self._ast_guard.validate(code, context=description[:100])
-
-        # Optional lint check
-        if self._config.lint_enabled:
-            self._lint_code(code)
-
         # Detect servers used for credential injection
         servers_used = _detect_servers_used(code)
 
-        # Prepend sys.path injection so compiled server modules are importable
-        execution_code = self._build_execution_code(code, servers_used)
+        # Optional lint check — ruff is spawned with the code first, so it lints while the scan below runs
+        lint_proc = await self._start_lint(code) if self._config.lint_enabled else None
+        try:
+            # Security scan
+            self._ast_guard.validate(code, context=description[:100])
+
+            # Prepend sys.path injection so compiled server modules are importable
+            execution_code = self._build_execution_code(code, servers_used)
+        except BaseException:
+            if lint_proc is not None:
+                await _reap_lint(lint_proc)
+            raise
+
+        if lint_proc is not None:
+            await self._finish_lint(lint_proc)
 
         # Run in Docker sandbox (warm or cold)
         if self._config.sandbox_mode == "warm":
@@ -334,8 +417,8 @@ class CodeExecutor:
     # Lint
     # ------------------------------------------------------------------
 
-    def _lint_code(self, code: str) -> None:
-        """Run ruff linting on the code string.
+    async def _lint_code(self, code: str) -> None:
+        """Run ruff linting on the code string in a subprocess without blocking the loop.
 
         Args:
             code: Python source code to lint.
@@ -343,23 +426,66 @@ class CodeExecutor:
         Raises:
             LintError: If ruff finds issues.
         """
+        proc = await self._start_lint(code)
+        if proc is not None:
+            await self._finish_lint(proc)
+
+    async def _start_lint(self, code: str) -> asyncio.subprocess.Process | None:
+        """Spawn ruff and hand it the code, without waiting for the report.
+
+        Args:
+            code: Python source code to lint.
+
+        Returns:
+            The running ruff process, or None if ruff is not installed.
+        """
         try:
-            result = subprocess.run(  # noqa: S603
-                ["ruff", "check", "--select=E,F,W", "--stdin-filename", "code.py", "-"],  # noqa: S607
-                input=code,
-                capture_output=True,
-                text=True,
-                timeout=10,
+            proc = await asyncio.create_subprocess_exec(
+                "ruff",
+                "check",
+                "--select=E,F,W",
+                "--output-format=concise",
+                "--stdin-filename",
+                "code.py",
+                "-",
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
             )
-            if result.returncode != 0:
-                raise LintError(
-                    "Code has lint issues",
-                    lint_output=result.stdout[:2000],
-                )
-        except subprocess.TimeoutExpired:
-            logger.warning("lint_timeout_skipped")
         except FileNotFoundError:
             logger.warning("ruff_not_found_skipped")
+            return None
+
+        assert proc.stdin is not None
+        proc.stdin.write(code.encode())
+        with suppress(BrokenPipeError, ConnectionResetError):
+            await proc.stdin.drain()
+        proc.stdin.close()
+        return proc
+
+    async def _finish_lint(self, proc: asyncio.subprocess.Process) -> None:
+        """Wait for a ruff process from :meth:`_start_lint` and check its report.
+
+        Args:
+            proc: Running ruff process whose stdin is closed.
+
+        Raises:
+            LintError: If ruff finds issues.
+        """
+        try:
+            output, truncated = await asyncio.wait_for(_read_lint_output(proc), timeout=_LINT_TIMEOUT_SECONDS)
+        except TimeoutError:
+            logger.warning("lint_timeout_skipped")
+            return
+        finally:
+            # Reap ruff if it is still running (timeout, cancellation or oversized output)
+            await _reap_lint(proc)
+
+        if truncated or proc.returncode != 0:
+            raise LintError(
+                "Code has lint issues",
+                lint_output=output.decode("utf-8", errors="replace"),
+            )
 
     # ------------------------------------------------------------------
     # Code preparation
@@ -375,11 +501,7 @@ class CodeExecutor:
         Returns:
             Complete Python code ready for execution in sandbox.
         """
-        path_injection = f"""
-import sys as _sys
-_sys.path.insert(0, {_CONTAINER_COMPILED_PATH!r})
-"""
-        return f"{path_injection}\n{user_code}"
+        return f"{_PATH_INJECTION}\n{user_code}"
 
     # ------------------------------------------------------------------
     # Docker container config helpers
@@ -391,7 +513,6 @@ _sys.path.insert(0, {_CONTAINER_COMPILED_PATH!r})
         Returns:
             Docker API HostConfig dict with resource limits and mounts.
         """
-        compiled_host_path = str(self._compiled_dir.resolve())
         return {
             "Memory": 256 * 1_048_576,
             "MemorySwap": 256 * 1_048_576,
@@ -400,7 +521,7 @@ _sys.path.insert(0, {_CONTAINER_COMPILED_PATH!r})
             "SecurityOpt": ["no-new-privileges:true"],
             "ReadonlyRootfs": True,
             "Tmpfs": {"/tmp": "size=64m,mode=1777"},  # noqa: S108
-            "Binds": [f"{compiled_host_path}:{_CONTAINER_COMPILED_PATH}:ro"],
+            "Binds": [f"{self._compiled_host_path}:{_CONTAINER_COMPILED_PATH}:ro"],
             "NetworkMode": self._config.network_mode,
         }
 
@@ -504,7 +625,10 @@ _sys.path.insert(0, {_CONTAINER_COMPILED_PATH!r})
             except aiodocker.exceptions.DockerError as exc:
                 raise ExecutionError(f"docker exec create failed: {exc.message}") from exc
 
-            output_parts: list[bytes] = []
+            # Accumulate stdout up to the output cap; the stream is still drained past it
+            # so the exec'd process never blocks on a full pipe
+            output = bytearray()
+            output_limit = self._config.max_output_size_bytes
             try:
                 async with asyncio.timeout(float(self._config.execution_timeout_seconds)):
                     async with exec_obj.start(detach=False) as stream:
@@ -513,8 +637,8 @@ _sys.path.insert(0, {_CONTAINER_COMPILED_PATH!r})
                             if msg is None:
                                 break
                             # stream type 1 = stdout, 2 = stderr; capture stdout only
-                            if msg.stream == 1:
-                                output_parts.append(msg.data)
+                            if msg.stream == 1 and len(output) < output_limit:
+                                output += msg.data[: output_limit - len(output)]
             except TimeoutError as exc:
                 raise ExecutionTimeoutError(
                     f"Execution timed out after {self._config.execution_timeout_seconds}s",
@@ -523,8 +647,7 @@ _sys.path.insert(0, {_CONTAINER_COMPILED_PATH!r})
             except aiodocker.exceptions.DockerError as exc:
                 raise ExecutionError(f"docker exec failed: {exc.message}") from exc
 
-        raw = b"".join(output_parts).decode("utf-8", errors="replace")
-        return raw[: self._config.max_output_size_bytes]
+        return output.decode("utf-8", errors="replace")
 
     # ------------------------------------------------------------------
     # Cold mode
@@ -595,11 +718,23 @@ _sys.path.insert(0, {_CONTAINER_COMPILED_PATH!r})
             return raw[: self._config.max_output_size_bytes]
 
         finally:
-            try:
-                await container.delete(force=True)
-                logger.debug("cold_container_deleted", name=container_name)
-            except Exception as exc:  # noqa: BLE001
-                logger.warning("cold_container_delete_failed", name=container_name, error=str(exc))
+            # Removal takes a Docker round trip the caller doesn't need to wait for; shutdown() awaits it
+            task = asyncio.create_task(self._delete_cold(container, container_name))
+            self._pending_deletes.add(task)
+            task.add_done_callback(self._pending_deletes.discard)
+
+    async def _delete_cold(self, container: aiodocker.containers.DockerContainer, container_name: str) -> None:
+        """Force-remove a finished cold container, logging rather than raising on failure.
+
+        Args:
+            container: Container to remove.
+            container_name: Container name, for logging.
+        """
+        try:
+            await container.delete(force=True)
+            logger.debug("cold_container_deleted", name=container_name)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("cold_container_delete_failed", name=container_name, error=str(exc))
 
     # ------------------------------------------------------------------
     # Output parsing
@@ -627,23 +762,28 @@ _sys.path.insert(0, {_CONTAINER_COMPILED_PATH!r})
                 execution_time_ms=elapsed_ms,
             )
 
-        try:
-            parsed = json.loads(raw_output)
-            success = bool(parsed.get("success", False))
-            return ExecutionResult(
-                success=success,
-                data=parsed.get("data") if success else None,
-                error=parsed.get("error") if not success else None,
-                traceback=parsed.get("traceback") if self._config.debug else None,
-                prints=parsed.get("prints"),
-                execution_time_ms=elapsed_ms,
-            )
-        except (json.JSONDecodeError, KeyError):
-            return ExecutionResult(
-                success=True,
-                data=raw_output[:4096],
-                execution_time_ms=elapsed_ms,
-            )
+        # The entrypoint always emits a JSON object; anything else is plain text and skips the parser
+        if raw_output.startswith("{"):
+            try:
+                parsed = json.loads(raw_output)
+            except json.JSONDecodeError:
+                pass
+            else:
+                success = bool(parsed.get("success", False))
+                return ExecutionResult(
+                    success=success,
+                    data=parsed.get("data") if success else None,
+                    error=parsed.get("error") if not success else None,
+                    traceback=parsed.get("traceback") if self._config.debug else None,
+                    prints=parsed.get("prints"),
+                    execution_time_ms=elapsed_ms,
+                )
+
+        return ExecutionResult(
+            success=True,
+            data=raw_output[:4096],
+            execution_time_ms=elapsed_ms,
+        )
 
     # ------------------------------------------------------------------
     # Swagger hash helper
@@ -652,18 +792,26 @@ _sys.path.insert(0, {_CONTAINER_COMPILED_PATH!r})
     def _compute_swagger_hash(self, servers_used: list[str]) -> str:
         """Compute combined swagger hash for cache key disambiguation.
 
+        Results are memoized per server set; failures are not, so a later call can retry.
+
         Args:
             servers_used: List of server names.
 
         Returns:
             Combined SHA256 hash string, or ``"unknown"`` on failure.
         """
+        key = frozenset(servers_used)
+        cached = self._swagger_hash_cache.get(key)
+        if cached is not None:
+            return cached
         try:
             from mce.runtime.registry import Registry  # noqa: PLC0415
 
             registry = Registry(self._config.compiled_output_dir)
             registry.load()
             hashes = [registry.get_swagger_hash(name) for name in servers_used if name]
-            return combine_hashes(*hashes) if hashes else "no-servers"
+            swagger_hash = combine_hashes(*hashes) if hashes else "no-servers"
         except Exception:  # noqa: BLE001
             return "unknown"
+        self._swagger_hash_cache[key] = swagger_hash
+        return swagger_hash
@@ -0,0 +1,146 @@
+"""Batch reading and validation of compiled server manifests, and parsing of their summaries."""
+
+from __future__ import annotations
+
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
+
+from pydantic import TypeAdapter, ValidationError
+
+from mce.models import ParamSchema, ResponseField, ServerManifest
+from mce.utils.logging import get_logger
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+logger = get_logger(__name__)
+
+# Validates every manifest in a single pydantic-core call
+_MANIFEST_LIST_ADAPTER: TypeAdapter[list[ServerManifest]] = TypeAdapter(list[ServerManifest])
+
+# Upper bound on threads reading manifest files concurrently
+_MAX_READ_WORKERS = 32
+
+# Separator between "name (type, required)" entries of a parameters_summary
+_PARAM_SEPARATOR_RE = re.compile(r"\),\s*")
+
+
+def read_manifest(manifest_path: Path) -> bytes | None:
+    """Read a manifest file, logging and returning None if it can't be read.
+
+    Args:
+        manifest_path: Path to manifest.json file.
+
+    Returns:
+        Raw file contents, or None on I/O error.
+    """
+    try:
+        return manifest_path.read_bytes()
+    except OSError as exc:
+        logger.error("manifest_load_failed", path=str(manifest_path), error=str(exc))
+        return None
+
+
+def load_manifests(manifest_paths: dict[str, Path]) -> dict[str, ServerManifest]:
+    """Read and validate several manifests, dropping any that are unreadable or invalid.
+
+    Files are read on a thread pool and validated together in one call; if the
+    batch fails, each manifest is validated on its own so the rest still load.
+
+    Args:
+        manifest_paths: Server name → path of its manifest.json.
+
+    Returns:
+        Server name → validated manifest, for every manifest that loaded.
+    """
+    names = list(manifest_paths)
+    paths = list(manifest_paths.values())
+    if len(paths) > 1:
+        # File reads release the GIL, so they overlap; validation stays on this thread below
+        with ThreadPoolExecutor(max_workers=min(_MAX_READ_WORKERS, len(paths))) as pool:
+            contents = list(pool.map(read_manifest, paths))
+    else:
+        contents = [read_manifest(path) for path in paths]
+    raw_manifests = {name: raw for name, raw in zip(names, contents, strict=True) if raw is not None}
+
+    manifests: list[ServerManifest] = []
+    if raw_manifests:
+        try:
+            manifests = _MANIFEST_LIST_ADAPTER.validate_json(b"[" + b",".join(raw_manifests.values()) + b"]")
+        except ValidationError:
+            manifests = []
+
+    if len(manifests) == len(raw_manifests):
+        return dict(zip(raw_manifests, manifests, strict=True))
+    # A corrupt or empty file broke the batch — validate individually so the rest still load
+    return {
+        name: manifest
+        for name, raw in raw_manifests.items()
+        if (manifest := _validate_manifest(manifest_paths[name], raw)) is not None
+    }
+
+
+def _validate_manifest(manifest_path: Path, raw: bytes) -> ServerManifest | None:
+    """Validate a single server manifest, logging it if invalid.
+
+    Args:
+        manifest_path: Path to manifest.json file.
+        raw: Raw JSON bytes read from *manifest_path*.
+
+    Returns:
+        The validated manifest, or None if it is invalid.
+    """
+    try:
+        return ServerManifest.model_validate_json(raw)
+    except ValidationError as exc:
+        logger.error("manifest_load_failed", path=str(manifest_path), error=str(exc))
+        return None
+
+
+def parse_parameters_summary(summary: str) -> list[ParamSchema]:
+    """Parse the human-readable parameters_summary string into ParamSchema objects.
+
+    Args:
+        summary: e.g. "city (string, required), date (string, optional)"
+
+    Returns:
+        List of ParamSchema objects.
+    """
+    if not summary.strip():
+        return []
+
+    params: list[ParamSchema] = []
+    for part in _PARAM_SEPARATOR_RE.split(summary.rstrip(")")):
+        part = part.strip()  # noqa: PLW2901
+        if not part:
+            continue
+        name, _, rest = part.partition("(")
+        type_str, has_flag, req_str = rest.partition(",")
+        if not has_flag:
+            params.append(ParamSchema(name=part, location="query", param_type="string"))
+            continue
+        params.append(
+            ParamSchema(
+                name=name.strip(),
+                location="query",
+                param_type=type_str.strip(),
+                required="required" in req_str.lower(),
+            )
+        )
+
+    return params
+
+
+def parse_response_summary(summary: str) -> list[ResponseField]:
+    """Parse response_summary string into ResponseField list.
+
+    Args:
+        summary: e.g. "id, name, price"
+
+    Returns:
+        List of ResponseField objects.
+    """
+    if not summary or summary == "response data":
+        return []
+    return [ResponseField(name=field.strip(), field_type="string") for field in summary.split(",") if field.strip()]
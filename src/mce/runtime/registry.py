@@ -2,15 +2,24 @@
 
 from __future__ import annotations
 
-import json
+import os
+import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 from mce.errors import FunctionNotFoundError, ServerNotFoundError
-from mce.models import EndpointManifest, FunctionInfo, ParamSchema, ResponseField, ServerInfo, ServerManifest
+from mce.models import EndpointManifest, FunctionInfo, ServerInfo, ServerManifest
+from mce.runtime.manifest_loader import load_manifests, parse_parameters_summary, parse_response_summary
 from mce.utils.logging import get_logger
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
 logger = get_logger(__name__)
 
+# Manifest file expected in each compiled server directory
+_MANIFEST_FILENAME = "manifest.json"
+
 
 class Registry:
     """Loads and indexes compiled server manifests for fast LLM tool lookups."""
@@ -22,68 +31,132 @@ class Registry:
             compiled_dir: Path to directory containing compiled server subdirectories.
         """
         self._compiled_dir = Path(compiled_dir)
+        # Discovered manifest.json of every server, in directory order
+        self._manifest_paths: dict[str, Path] = {}
+        # Discovered servers whose manifest has not been read yet
+        self._unloaded: set[str] = set()
         self._servers: dict[str, ServerManifest] = {}
+        # Per server: function name → endpoint, built as each manifest is indexed
+        self._endpoints: dict[str, dict[str, EndpointManifest]] = {}
         self._function_source_cache: dict[str, str] = {}
+        # Full functions.py text of each server whose snippets are already in the source cache
+        self._hydrated_sources: dict[str, str] = {}
+        # list_servers() result, built on first call after each load()
+        self._server_infos: list[ServerInfo] | None = None
+        self._generation = 0
 
     def load(self) -> None:
-        """Load all compiled server manifests from the compiled directory.
+        """Discover the compiled server manifests in the compiled directory.
 
-        Scans compiled_dir for subdirectories with manifest.json files
-        and loads each into memory for fast lookup.
+        Scans compiled_dir for subdirectories with manifest.json files but
+        defers reading them: a manifest is parsed the first time its server is
+        looked up, and :meth:`list_servers` loads all remaining ones in one
+        batch.
         """
         self._servers.clear()
+        self._endpoints.clear()
+        self._manifest_paths.clear()
+        self._unloaded.clear()
         self._function_source_cache.clear()
+        self._hydrated_sources.clear()
+        self._server_infos = None
+        self._generation += 1
 
         if not self._compiled_dir.exists():
             logger.warning("compiled_dir_not_found", path=str(self._compiled_dir))
             return
 
-        manifest_files = list(self._compiled_dir.glob("*/manifest.json"))
-        for manifest_path in manifest_files:
-            try:
-                self._load_manifest(manifest_path)
-            except Exception as exc:  # noqa: BLE001
-                logger.error("manifest_load_failed", path=str(manifest_path), error=str(exc))
-
-        logger.info(
-            "registry_loaded",
-            servers=len(self._servers),
-            total_functions=sum(len(s.endpoints) for s in self._servers.values()),
-        )
-
-    def _load_manifest(self, manifest_path: Path) -> None:
-        """Load and index a single server manifest file.
+        # One scandir pass; DirEntry.is_dir() reuses the d_type from the listing instead of a stat
+        with os.scandir(self._compiled_dir) as entries:
+            for entry in entries:
+                # Hidden directories are skipped, as "*/manifest.json" globbing did
+                if entry.name.startswith(".") or not entry.is_dir():
+                    continue
+                path = Path(entry.path, _MANIFEST_FILENAME)
+                if not os.path.exists(path):
+                    continue
+                # Index by directory name (valid Python identifier) so imports like
+                # `from open_meteo_weather_api.functions import …` resolve correctly.
+                # Interned so lookups with interned names short-circuit on identity
+                module_name = sys.intern(entry.name)
+                self._manifest_paths[module_name] = path
+                self._unloaded.add(module_name)
+
+        logger.info("registry_loaded", servers=len(self._manifest_paths))
+
+    @property
+    def generation(self) -> int:
+        """Counter incremented by every :meth:`load`, for callers caching derived data."""
+        return self._generation
+
+    def _load_servers(self, server_names: Iterable[str]) -> None:
+        """Read, validate and index the manifests of servers not loaded yet.
+
+        Servers whose manifest is unreadable or invalid are logged and dropped
+        from the registry, so they are not retried on every lookup.
 
         Args:
-            manifest_path: Path to manifest.json file.
+            server_names: Discovered server names to make available.
         """
-        with open(manifest_path, encoding="utf-8") as f:
-            raw = json.load(f)
+        names = [name for name in server_names if name in self._unloaded]
+        if not names:
+            return
+        self._unloaded.difference_update(names)
 
-        manifest = ServerManifest(**raw)
-        # Index by directory name (valid Python identifier) so imports like
-        # `from open_meteo_weather_api.functions import …` resolve correctly.
-        module_name = manifest_path.parent.name
+        validated = load_manifests({name: self._manifest_paths[name] for name in names})
+        for name in names:
+            if name in validated:
+                self._index_manifest(name, validated[name])
+            else:
+                del self._manifest_paths[name]
+
+    def _index_manifest(self, module_name: str, manifest: ServerManifest) -> None:
+        """Register a validated manifest under its compiled module directory name.
+
+        Args:
+            module_name: Name of the server's compiled directory.
+            manifest: Validated server manifest.
+        """
         self._servers[module_name] = manifest
+        endpoints: dict[str, EndpointManifest] = {}
+        for ep in manifest.endpoints:
+            endpoints.setdefault(ep.function_name, ep)  # first definition wins, as with a linear scan
+        self._endpoints[module_name] = endpoints
         logger.debug("manifest_loaded", server=module_name, endpoints=len(manifest.endpoints))
 
     def list_servers(self) -> list[ServerInfo]:
         """Return summary information about all compiled servers.
 
+        Loads every manifest not read yet.  The summaries are built once per
+        :meth:`load`; callers get a fresh list of the shared ServerInfo
+        objects and must not mutate them.
+
         Returns:
             List of ServerInfo objects with function name/summary lists.
         """
-        result: list[ServerInfo] = []
-        for name, manifest in self._servers.items():
-            result.append(
-                ServerInfo(
-                    name=name,
-                    description=manifest.description,
-                    functions=[ep.function_name for ep in manifest.endpoints],
-                    function_summaries={ep.function_name: ep.summary for ep in manifest.endpoints},
+        if self._server_infos is None:
+            self._load_servers(list(self._manifest_paths))
+            server_infos: list[ServerInfo] = []
+            # Directory order, regardless of which servers were looked up first
+            for name in self._manifest_paths:
+                manifest = self._servers[name]
+                functions: list[str] = []
+                summaries: dict[str, str] = {}
+                # One pass over the endpoints fills both views
+                for ep in manifest.endpoints:
+                    function_name = ep.function_name
+                    functions.append(function_name)
+                    summaries[function_name] = ep.summary
+                server_infos.append(
+                    ServerInfo(
+                        name=name,
+                        description=manifest.description,
+                        functions=functions,
+                        function_summaries=summaries,
+                    )
                 )
-            )
-        return result
+            self._server_infos = server_infos
+        return list(self._server_infos)
 
     def get_function(self, server_name: str, function_name: str) -> FunctionInfo:
         """Get detailed function information by server and function name.
@@ -99,12 +172,12 @@ class Registry:
             ServerNotFoundError: If server doesn't exist in registry.
             FunctionNotFoundError: If function doesn't exist in server.
         """
-        manifest = self._get_server_manifest(server_name)
-        endpoint = self._find_endpoint(manifest, server_name, function_name)
+        self._get_server_manifest(server_name)  # Validate server exists
+        endpoint = self._find_endpoint(server_name, function_name)
 
         source_code = self._get_function_source(server_name, function_name)
-        parameters = self._parse_parameters_summary(endpoint.parameters_summary)
-        response_fields = self._parse_response_summary(endpoint.response_summary)
+        parameters = parse_parameters_summary(endpoint.parameters_summary)
+        response_fields = parse_response_summary(endpoint.response_summary)
 
         return FunctionInfo(
             server_name=server_name,
@@ -188,17 +261,20 @@ class Registry:
         Raises:
             ServerNotFoundError: If server is not compiled.
         """
-        if server_name not in self._servers:
-            available = list(self._servers.keys())
+        manifest = self._servers.get(server_name)
+        if manifest is None and server_name in self._unloaded:
+            self._load_servers((server_name,))
+            manifest = self._servers.get(server_name)
+        if manifest is None:
+            available = list(self._manifest_paths)
             raise ServerNotFoundError(f"Server '{server_name}' not found. Available: {available}")
-        return self._servers[server_name]
+        return manifest
 
-    def _find_endpoint(self, manifest: ServerManifest, server_name: str, function_name: str) -> EndpointManifest:
-        """Find an endpoint entry in a manifest.
+    def _find_endpoint(self, server_name: str, function_name: str) -> EndpointManifest:
+        """Find an endpoint entry of a loaded server.
 
         Args:
-            manifest: Server manifest to search.
-            server_name: Name for error context.
+            server_name: Server whose endpoints to search (must be loaded).
             function_name: Function name to find.
 
         Returns:
@@ -207,12 +283,12 @@ class Registry:
         Raises:
             FunctionNotFoundError: If function not in manifest.
         """
+        endpoints = self._endpoints[server_name]
+        endpoint = endpoints.get(function_name)
+        if endpoint is not None:
+            return endpoint
 
-        for ep in manifest.endpoints:
-            if ep.function_name == function_name:
-                return ep
-
-        available = [ep.function_name for ep in manifest.endpoints]
+        available = list(endpoints)
         raise FunctionNotFoundError(
             f"Function '{function_name}' not found in server '{server_name}'. Available: {available}"
         )
@@ -220,6 +296,9 @@ class Registry:
     def _get_function_source(self, server_name: str, function_name: str) -> str:
         """Extract the Python source for a function from functions.py.
 
+        The first request for a server parses its functions.py once and caches
+        the snippet of every function in it; later requests are dict lookups.
+
         Args:
             server_name: Server name.
             function_name: Function name.
@@ -228,105 +307,63 @@ class Registry:
             Source code of the specific function, or full file if extraction fails.
         """
         cache_key = f"{server_name}.{function_name}"
-        if cache_key in self._function_source_cache:
-            return self._function_source_cache[cache_key]
+        snippet = self._function_source_cache.get(cache_key)
+        if snippet is not None:
+            return snippet
+
+        full_source = self._hydrated_sources.get(server_name)
+        if full_source is None:
+            functions_file = self._compiled_dir / server_name / "functions.py"
+            if not functions_file.exists():
+                return f"# Source not found for {server_name}.{function_name}"
 
-        functions_file = self._compiled_dir / server_name / "functions.py"
-        if not functions_file.exists():
-            return f"# Source not found for {server_name}.{function_name}"
+            full_source = functions_file.read_text(encoding="utf-8")
+            for name, extracted in self._extract_function_snippets(full_source).items():
+                self._function_source_cache[f"{server_name}.{name}"] = extracted
+            self._hydrated_sources[server_name] = full_source
+            snippet = self._function_source_cache.get(cache_key)
+            if snippet is not None:
+                return snippet
 
-        full_source = functions_file.read_text(encoding="utf-8")
-        snippet = self._extract_function_snippet(full_source, function_name)
-        self._function_source_cache[cache_key] = snippet
-        return snippet
+        return full_source  # Function not in the file (or it doesn't parse) — fall back to full source
 
-    def _extract_function_snippet(self, source: str, function_name: str) -> str:
-        """Extract a function definition and its associated TypedDict classes from a Python source file.
+    def _extract_function_snippets(self, source: str) -> dict[str, str]:
+        """Extract every function definition, each with its associated TypedDict classes.
 
         Args:
             source: Full Python source file content.
-            function_name: Name of function to extract.
 
         Returns:
-            TypedDict class definitions (if any) followed by the function source,
-            or full source on failure.
+            Mapping of function name to its TypedDict class definitions (if any)
+            followed by the function source; empty if the source doesn't parse.
         """
         import ast  # noqa: PLC0415
 
         try:
             tree = ast.parse(source)
         except SyntaxError:
-            return source
+            return {}
 
         lines = source.splitlines()
 
-        # Derive the PascalCase prefix used for TypedDict class names
-        pascal_prefix = "".join(word.capitalize() for word in function_name.split("_"))
-
-        # Collect TypedDict classes whose names match this function's response types
-        class_snippets: list[str] = []
-        func_snippet: str | None = None
-
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef) and node.name.startswith(pascal_prefix):
+        class_snippets: list[tuple[str, str]] = []
+        func_snippets: dict[str, str] = {}
+        # Generated functions and their TypedDicts are always module-level, so nested bodies needn't be visited
+        for node in tree.body:
+            if isinstance(node, ast.ClassDef | ast.FunctionDef):
                 start = node.lineno - 1
                 end = node.end_lineno or (start + 1)
-                class_snippets.append("\n".join(lines[start:end]))
-            elif isinstance(node, ast.FunctionDef) and node.name == function_name:
-                start = node.lineno - 1
-                end = node.end_lineno or (start + 1)
-                func_snippet = "\n".join(lines[start:end])
-
-        if func_snippet is None:
-            return source  # Fallback to full source
-
-        parts = class_snippets + [func_snippet]
-        return "\n\n".join(parts)
-
-    def _parse_parameters_summary(self, summary: str) -> list[ParamSchema]:
-        """Parse the human-readable parameters_summary string into ParamSchema objects.
-
-        Args:
-            summary: e.g. "city (string, required), date (string, optional)"
-
-        Returns:
-            List of ParamSchema objects.
-        """
-        import re  # noqa: PLC0415
-
-        if not summary.strip():
-            return []
-
-        params: list[ParamSchema] = []
-        for part in re.split(r"\),\s*", summary.rstrip(")")):
-            part = part.strip()  # noqa: PLW2901
-            if not part:
-                continue
-            try:
-                name, rest = part.split("(", 1)
-                type_str, req_str = rest.split(",", 1)
-                params.append(
-                    ParamSchema(
-                        name=name.strip(),
-                        location="query",
-                        param_type=type_str.strip(),
-                        required="required" in req_str.lower(),
-                    )
-                )
-            except ValueError:
-                params.append(ParamSchema(name=part, location="query", param_type="string"))
-
-        return params
-
-    def _parse_response_summary(self, summary: str) -> list[ResponseField]:
-        """Parse response_summary string into ResponseField list.
-
-        Args:
-            summary: e.g. "id, name, price"
-
-        Returns:
-            List of ResponseField objects.
-        """
-        if not summary or summary == "response data":
-            return []
-        return [ResponseField(name=field.strip(), field_type="string") for field in summary.split(",") if field.strip()]
+                snippet = "\n".join(lines[start:end])
+                if isinstance(node, ast.ClassDef):
+                    class_snippets.append((node.name, snippet))
+                else:
+                    func_snippets[node.name] = snippet
+
+        snippets: dict[str, str] = {}
+        for function_name, func_snippet in func_snippets.items():
+            # TypedDict response classes are named with the function's PascalCase prefix
+            pascal_prefix = "".join(word.capitalize() for word in function_name.split("_"))
+            parts = [snippet for name, snippet in class_snippets if name.startswith(pascal_prefix)]
+            parts.append(func_snippet)
+            snippets[function_name] = "\n\n".join(parts)
+        return snippets
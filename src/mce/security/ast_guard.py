@@ -3,11 +3,16 @@
 from __future__ import annotations
 
 import ast
-from typing import Any
+import hashlib
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
 
 from mce.errors import SecurityViolationError
 from mce.utils.logging import get_logger
 
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
 logger = get_logger(__name__)
 
 # Modules completely blocked from import
@@ -161,14 +166,24 @@ _BLOCKED_ATTRIBUTES: frozenset[str] = frozenset(
 )
 
 
+# Verdicts remembered per ASTGuard, keyed by source digest; retries and agent loops resubmit the same code
+_VERDICT_CACHE_SIZE = 1024
+
+
 class ASTGuard:
     """Static code analyzer that blocks unsafe patterns before execution."""
 
+    def __init__(self) -> None:
+        """Initialize the guard with an empty verdict cache."""
+        # SHA256 digest of the code → its first violation, or None if it passed (LRU order)
+        self._verdicts: OrderedDict[bytes, dict[str, str] | None] = OrderedDict()
+
     def validate(self, code: str, context: str = "") -> None:
         """Validate Python code for security violations.
 
         Parses the code into an AST and walks it, checking all nodes
         against block/allow lists for imports, calls, and attribute access.
+        The verdict for code seen before is reused without re-parsing.
 
         Args:
             code: Python source code to validate.
@@ -177,16 +192,22 @@ class ASTGuard:
         Raises:
             SecurityViolationError: If any blocked pattern is found.
         """
-        try:
-            tree = ast.parse(code, mode="exec")
-        except SyntaxError as exc:
-            raise SecurityViolationError(f"Invalid Python syntax: {exc}") from exc
+        digest = hashlib.sha256(code.encode("utf-8")).digest()
+        if digest in self._verdicts:
+            self._verdicts.move_to_end(digest)
+            violation = self._verdicts[digest]
+        else:
+            try:
+                tree = ast.parse(code, mode="exec")
+            except SyntaxError as exc:
+                raise SecurityViolationError(f"Invalid Python syntax: {exc}") from exc
 
-        visitor = _SecurityVisitor()
-        visitor.visit(tree)
+            violation = _find_violation(tree)
+            self._verdicts[digest] = violation
+            if len(self._verdicts) > _VERDICT_CACHE_SIZE:
+                self._verdicts.popitem(last=False)
 
-        if visitor.violations:
-            violation = visitor.violations[0]
+        if violation is not None:
             logger.warning(
                 "security_violation_blocked",
                 context=context,
@@ -196,58 +217,94 @@ class ASTGuard:
             raise SecurityViolationError(f"Security violation ({violation['type']}): {violation['detail']}")
 
 
-class _SecurityVisitor(ast.NodeVisitor):
-    """AST node visitor that collects security violations."""
+def _find_violation(tree: ast.AST) -> dict[str, str] | None:
+    """Walk *tree* depth-first in source order and return the first security violation.
 
-    def __init__(self) -> None:
-        self.violations: list[dict[str, Any]] = []
-
-    def _add_violation(self, violation_type: str, detail: str) -> None:
-        self.violations.append({"type": violation_type, "detail": detail})
-
-    def visit_Import(self, node: ast.Import) -> None:  # noqa: N802
-        """Check top-level import statements."""
-        for alias in node.names:
-            module = alias.name.split(".")[0]
-            if module in _BLOCKED_MODULES:
-                self._add_violation("blocked_import", f"import {alias.name}")
-            elif module not in _ALLOWED_MODULES and not module.startswith("_"):
-                # Allow server function modules (e.g., weather.functions)
-                # Deny anything else not in allowlist
-                pass  # Conservative: only block explicitly blocked modules
-        self.generic_visit(node)
-
-    def visit_ImportFrom(self, node: ast.ImportFrom) -> None:  # noqa: N802
-        """Check from X import Y statements."""
-        module = (node.module or "").split(".")[0]
-        if module in _BLOCKED_MODULES:
-            self._add_violation("blocked_import", f"from {node.module} import ...")
-        self.generic_visit(node)
-
-    def visit_Call(self, node: ast.Call) -> None:  # noqa: N802
-        """Check function call nodes."""
-        # Direct function calls: eval(), exec(), etc.
-        if isinstance(node.func, ast.Name) and node.func.id in _BLOCKED_CALLS:
-            self._add_violation("blocked_call", f"call to {node.func.id}()")
-
-        # Method calls: obj.method()
-        if isinstance(node.func, ast.Attribute) and node.func.attr in _BLOCKED_ATTRIBUTES:
-            self._add_violation("blocked_attribute_call", f"call to .{node.func.attr}()")
-
-        self.generic_visit(node)
-
-    def visit_Attribute(self, node: ast.Attribute) -> None:  # noqa: N802
-        """Check attribute access nodes."""
-        if node.attr in _BLOCKED_ATTRIBUTES:
-            self._add_violation("blocked_attribute", f"access to .{node.attr}")
-        self.generic_visit(node)
-
-    def visit_Global(self, node: ast.Global) -> None:  # noqa: N802
-        """Block global statement usage."""
-        self._add_violation("blocked_global", "global statement not allowed")
-        self.generic_visit(node)
-
-    def visit_Nonlocal(self, node: ast.Nonlocal) -> None:  # noqa: N802
-        """Block nonlocal statement usage."""
-        self._add_violation("blocked_nonlocal", "nonlocal statement not allowed")
-        self.generic_visit(node)
+    Only node types with an entry in ``_CHECKS`` are inspected; every other
+    node costs a single dict miss. Child fields are read directly rather than
+    through ``ast.iter_child_nodes``, which dominates the cost of a walk. The
+    walk stops at the first violation since only that one is reported.
+
+    Args:
+        tree: Parsed module.
+
+    Returns:
+        The first violation in the code, or None if it is clean.
+    """
+    checks = _CHECKS
+    node_type = ast.AST
+
+    def visit(node: ast.AST) -> dict[str, str] | None:
+        check = checks.get(type(node))
+        if check is not None and (violation := check(node)) is not None:
+            return violation
+        for field in node._fields:
+            value = getattr(node, field, None)
+            if isinstance(value, node_type):
+                if (violation := visit(value)) is not None:
+                    return violation
+            elif isinstance(value, list):
+                for item in value:
+                    if isinstance(item, node_type) and (violation := visit(item)) is not None:
+                        return violation
+        return None
+
+    return visit(tree)
+
+
+def _check_import(node: ast.Import) -> dict[str, str] | None:
+    """Check top-level import statements."""
+    for alias in node.names:
+        # Server function modules (e.g. weather.functions) and other unlisted modules
+        # are allowed — conservative: only explicitly blocked modules are rejected
+        if alias.name.split(".")[0] in _BLOCKED_MODULES:
+            return {"type": "blocked_import", "detail": f"import {alias.name}"}
+    return None
+
+
+def _check_import_from(node: ast.ImportFrom) -> dict[str, str] | None:
+    """Check from X import Y statements."""
+    if (node.module or "").split(".")[0] in _BLOCKED_MODULES:
+        return {"type": "blocked_import", "detail": f"from {node.module} import ..."}
+    return None
+
+
+def _check_call(node: ast.Call) -> dict[str, str] | None:
+    """Check function call nodes.
+
+    Method calls (``obj.method()``) are left to ``_check_attribute``, which the
+    walk reaches next through ``node.func``.
+    """
+    func = node.func
+    # Direct function calls: eval(), exec(), etc.
+    if isinstance(func, ast.Name) and func.id in _BLOCKED_CALLS:
+        return {"type": "blocked_call", "detail": f"call to {func.id}()"}
+    return None
+
+
+def _check_attribute(node: ast.Attribute) -> dict[str, str] | None:
+    """Check attribute access nodes."""
+    if node.attr in _BLOCKED_ATTRIBUTES:
+        return {"type": "blocked_attribute", "detail": f"access to .{node.attr}"}
+    return None
+
+
+def _check_global(_node: ast.Global) -> dict[str, str] | None:
+    """Block global statement usage."""
+    return {"type": "blocked_global", "detail": "global statement not allowed"}
+
+
+def _check_nonlocal(_node: ast.Nonlocal) -> dict[str, str] | None:
+    """Block nonlocal statement usage."""
+    return {"type": "blocked_nonlocal", "detail": "nonlocal statement not allowed"}
+
+
+# Node type → check, looked up once per node instead of NodeVisitor's per-node getattr dispatch
+_CHECKS: dict[type[ast.AST], Callable[[Any], dict[str, str] | None]] = {
+    ast.Import: _check_import,
+    ast.ImportFrom: _check_import_from,
+    ast.Call: _check_call,
+    ast.Attribute: _check_attribute,
+    ast.Global: _check_global,
+    ast.Nonlocal: _check_nonlocal,
+}
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 from urllib.parse import urlparse
 
 from mce.errors import SecurityViolationError
@@ -12,6 +13,9 @@ logger = get_logger(__name__)
 # HTTP methods that mutate state
 _MUTATING_METHODS: frozenset[str] = frozenset({"POST", "PUT", "PATCH", "DELETE"})
 
+# Distinct allowlists kept compiled; in practice there is one per configuration
+_ALLOWLIST_CACHE_SIZE = 64
+
 
 def enforce_read_only(method: str, server_name: str) -> None:
     """Raise SecurityViolationError if a mutating method is used on a read-only server.
@@ -28,6 +32,19 @@ def enforce_read_only(method: str, server_name: str) -> None:
         raise SecurityViolationError(f"Server '{server_name}' is read-only but code attempts {method} operation")
 
 
+@functools.lru_cache(maxsize=_ALLOWLIST_CACHE_SIZE)
+def _compile_allowlist(allowed_domains: tuple[str, ...]) -> tuple[frozenset[str], tuple[str, ...]]:
+    """Split an allowlist into an exact-match set and a subdomain suffix tuple.
+
+    Args:
+        allowed_domains: Allowed hostname strings.
+
+    Returns:
+        Tuple of (exact hostnames, ".domain" suffixes for ``str.endswith``).
+    """
+    return frozenset(allowed_domains), tuple(f".{domain}" for domain in allowed_domains)
+
+
 def check_domain_allowed(url: str, allowed_domains: list[str]) -> None:
     """Verify that a URL's domain is in the allowed domains list.
 
@@ -46,6 +63,7 @@ def check_domain_allowed(url: str, allowed_domains: list[str]) -> None:
     parsed = urlparse(url)
     hostname = parsed.hostname or ""
 
-    if not any(hostname == domain or hostname.endswith(f".{domain}") for domain in allowed_domains):
+    exact, suffixes = _compile_allowlist(tuple(allowed_domains))
+    if hostname not in exact and not hostname.endswith(suffixes):
         logger.warning("domain_blocked", url=url, hostname=hostname)
         raise SecurityViolationError(f"Domain '{hostname}' is not in the allowed domains list")
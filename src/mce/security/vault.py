@@ -49,6 +49,9 @@ def resolve_env_references(value: str) -> str:
         String with all resolvable references replaced by env values.
         Unresolvable references are left as-is and a warning is logged.
     """
+    # Most config values are literals; skip the regex entirely when there is no placeholder
+    if "${" not in value:
+        return value
 
     def replace_ref(match: re.Match[str]) -> str:
         var_name = match.group(1)
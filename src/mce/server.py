@@ -1,10 +1,13 @@
-"""MCE FastMCP server — registers the 4 MCP tools and 1 prompt exposed to LLMs."""
+"""MCE FastMCP server — registers the 5 MCP tools and 1 prompt exposed to LLMs."""
 
 from __future__ import annotations
 
+import asyncio
 import importlib.util
+import inspect
 import re
 import sys
+import weakref
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -26,10 +29,16 @@ from mce.runtime.registry import Registry
 from mce.utils.logging import get_logger
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from mce.config import MCEConfig
 
 logger = get_logger(__name__)
 
+# Registry and cache captured by each server built with create_server, so
+# initialize_server can reuse them instead of opening a second set
+_SERVER_COMPONENTS: weakref.WeakKeyDictionary[FastMCP, tuple[Registry, CacheStore]] = weakref.WeakKeyDictionary()
+
 
 def _load_top_level_tools(compiled_dir: str | Path) -> list[dict[str, Any]]:
     """Scan the compiled directory for ``top_level_functions.py`` files and load them.
@@ -116,6 +125,7 @@ for the same type of operation.
 - Keep `execute_code` payloads minimal — extract only the fields you need.
 - description must be generic — "action + entity type", NO specific values or dates.
 - If execution fails, re-read `get_functions` output before retrying.
+- Independent calls can be sent together through `batch_execute` to run concurrently.
 """
 
 
@@ -215,13 +225,67 @@ def _apply_params_to_code(code: str, params: dict[str, Any]) -> str:
     return f"_params = {params!r}\n{code}"
 
 
+def _security_response(exc: SecurityViolationError, _timeout: int) -> dict[str, Any]:
+    """Build the tool response for code rejected by the AST guard."""
+    return {"success": False, "error": f"Security violation: {exc}", "error_type": "security"}
+
+
+def _lint_response(exc: LintError, _timeout: int) -> dict[str, Any]:
+    """Build the tool response for code that failed ruff, including its output."""
+    return {
+        "success": False,
+        "error": f"Code has issues: {exc}",
+        "lint_output": exc.lint_output,
+        "error_type": "lint",
+    }
+
+
+def _timeout_response(_exc: ExecutionTimeoutError, timeout: int) -> dict[str, Any]:
+    """Build the tool response for a sandbox run that exceeded the timeout."""
+    return {"success": False, "error": f"Execution timed out after {timeout}s", "error_type": "timeout"}
+
+
+def _execution_response(exc: ExecutionError, _timeout: int) -> dict[str, Any]:
+    """Build the tool response for a sandbox failure, including its stderr."""
+    return {"success": False, "error": str(exc), "stderr": exc.stderr, "error_type": "execution"}
+
+
+# Expected executor failure → tool response builder (called with the exception and the timeout)
+_EXECUTION_ERROR_RESPONSES: dict[type[Exception], Callable[[Any, int], dict[str, Any]]] = {
+    SecurityViolationError: _security_response,
+    LintError: _lint_response,
+    ExecutionTimeoutError: _timeout_response,
+    ExecutionError: _execution_response,
+}
+
+
+def _execution_error_response(exc: Exception, timeout: int) -> dict[str, Any] | None:
+    """Map an executor failure to the tool response shared by execute_code and run_cached_code.
+
+    The exception's MRO is walked so subclasses resolve to their closest mapped
+    base (``ExecutionTimeoutError`` before ``ExecutionError``).
+
+    Args:
+        exc: Exception raised by ``CodeExecutor.execute``.
+        timeout: Configured execution timeout in seconds, quoted in timeout errors.
+
+    Returns:
+        Error response dict, or None if the exception is unexpected.
+    """
+    for cls in type(exc).__mro__:
+        build = _EXECUTION_ERROR_RESPONSES.get(cls)
+        if build is not None:
+            return build(exc, timeout)
+    return None
+
+
 def create_server(
     config: MCEConfig,
     registry: Registry | None = None,
     cache: CacheStore | None = None,
     executor: CodeExecutor | None = None,
 ) -> FastMCP:
-    """Create and configure the MCE FastMCP server with all 4 tools and 1 prompt.
+    """Create and configure the MCE FastMCP server with all 5 tools and 1 prompt.
 
     Args:
         config: MCE configuration instance.
@@ -260,6 +324,15 @@ def create_server(
     if executor is None:
         executor = CodeExecutor(config, cache)
 
+    # Registry lookups read manifests and functions.py from disk and fill the
+    # registry's caches; run them off the event loop in the loop's default
+    # executor, one at a time so those caches are never touched concurrently.
+    registry_lock = asyncio.Lock()
+
+    async def _in_registry_thread[T](fn: Callable[..., T], *args: Any) -> T:
+        async with registry_lock:
+            return await asyncio.to_thread(fn, *args)
+
     try:
         _sandbox_libraries = [
             line.strip() for line in Path(config.sandbox_requirements_path).read_text().splitlines() if line.strip()
@@ -267,6 +340,9 @@ def create_server(
     except OSError:
         _sandbox_libraries = []
 
+    # Encoded list_servers response and the registry generation it was built from
+    listing_cache: tuple[int, str] | None = None
+
     @mcp.tool()
     async def list_servers() -> str:
         """List all available API servers and their functions.
@@ -277,10 +353,15 @@ def create_server(
 
         Use this to discover what APIs are available before getting function details.
         """
+        nonlocal listing_cache
         try:
-            servers = registry.list_servers()
+            generation = registry.generation
+            if listing_cache is not None and listing_cache[0] == generation:
+                logger.info("tool_list_servers_called", cached=True)
+                return listing_cache[1]
+            servers = await _in_registry_thread(registry.list_servers)
             logger.info("tool_list_servers_called", server_count=len(servers))
-            return str(
+            listing = str(
                 _toon_encode(
                     {
                         "sandbox_libraries": _sandbox_libraries,
@@ -297,6 +378,8 @@ def create_server(
                     }
                 )
             )
+            listing_cache = (generation, listing)
+            return listing
         except Exception as exc:  # noqa: BLE001
             logger.exception("list_servers_unexpected_error")
             return str(_toon_encode({"error": "Internal error loading servers", "detail": str(exc)}))
@@ -326,7 +409,7 @@ def create_server(
             server_name = item.get("server_name", "")
             function_name = item.get("function_name", "")
             try:
-                fn = registry.get_function(server_name, function_name)
+                fn = await _in_registry_thread(registry.get_function, server_name, function_name)
                 logger.info("tool_get_function_called", server=server_name, function=function_name)
                 results.append(
                     {
@@ -421,26 +504,12 @@ def create_server(
                     f"Do NOT call execute_code again for this type of query."
                 )
             return dump
-        except SecurityViolationError as exc:
-            return {"success": False, "error": f"Security violation: {exc}", "error_type": "security"}
-        except LintError as exc:
-            return {
-                "success": False,
-                "error": f"Code has issues: {exc}",
-                "lint_output": exc.lint_output,
-                "error_type": "lint",
-            }
-        except ExecutionTimeoutError:
-            return {
-                "success": False,
-                "error": f"Execution timed out after {config.execution_timeout_seconds}s",
-                "error_type": "timeout",
-            }
-        except ExecutionError as exc:
-            return {"success": False, "error": str(exc), "stderr": exc.stderr, "error_type": "execution"}
-        except Exception:  # noqa: BLE001
-            logger.exception("execute_code_unexpected_error")
-            return {"success": False, "error": "Internal error occurred", "error_type": "internal"}
+        except Exception as exc:  # noqa: BLE001
+            response = _execution_error_response(exc, config.execution_timeout_seconds)
+            if response is None:
+                logger.exception("execute_code_unexpected_error")
+                response = {"success": False, "error": "Internal error occurred", "error_type": "internal"}
+            return response
 
     @mcp.tool()
     async def run_cached_code(cache_id: str, params: dict[str, Any] | None = None) -> dict[str, Any]:
@@ -490,26 +559,73 @@ def create_server(
         try:
             result = await executor.execute(code, entry.description)
             return result.model_dump()
-        except SecurityViolationError as exc:
-            return {"success": False, "error": f"Security violation: {exc}", "error_type": "security"}
-        except LintError as exc:
-            return {
-                "success": False,
-                "error": f"Code has issues: {exc}",
-                "lint_output": exc.lint_output,
-                "error_type": "lint",
-            }
-        except ExecutionTimeoutError:
-            return {
-                "success": False,
-                "error": f"Execution timed out after {config.execution_timeout_seconds}s",
-                "error_type": "timeout",
-            }
-        except ExecutionError as exc:
-            return {"success": False, "error": str(exc), "stderr": exc.stderr, "error_type": "execution"}
-        except Exception:  # noqa: BLE001
-            logger.exception("run_cached_code_unexpected_error")
-            return {"success": False, "error": "Internal error occurred", "error_type": "internal"}
+        except Exception as exc:  # noqa: BLE001
+            response = _execution_error_response(exc, config.execution_timeout_seconds)
+            if response is None:
+                logger.exception("run_cached_code_unexpected_error")
+                response = {"success": False, "error": "Internal error occurred", "error_type": "internal"}
+            return response
+
+    # Tools batch_execute can dispatch to, by MCP tool name
+    batchable_tools: dict[str, Callable[..., Awaitable[Any]]] = {
+        "list_servers": list_servers,
+        "get_functions": get_functions,
+        "execute_code": execute_code,
+        "run_cached_code": run_cached_code,
+    }
+    # Signatures of the batchable tools, for checking a call's arguments before running it
+    batchable_signatures = {name: inspect.signature(fn) for name, fn in batchable_tools.items()}
+    # Bounds sandbox and cache load from batch_execute, shared by every batch in flight
+    batch_semaphore = asyncio.Semaphore(max(1, config.max_concurrent_tools))
+
+    @mcp.tool()
+    async def batch_execute(calls: list[dict[str, Any]]) -> dict[str, Any]:
+        """Run several independent tool calls concurrently and return all results in order.
+
+        Use this when you already know every call you need — e.g. executing two
+        cached snippets for different cities — instead of calling tools one by one.
+        Calls must not depend on each other's output.
+
+        Args:
+            calls: List of items, each with:
+                - tool: One of list_servers, get_functions, execute_code, run_cached_code.
+                - args: Keyword arguments for that tool (omit for list_servers).
+
+        Returns:
+            ``{"results": [...]}`` with one entry per call, in the same order.  Each
+            entry is the tool's own response, or an error dict for that call only.
+        """
+        if not calls:
+            return {"error": "Provide at least 1 call.", "error_type": "validation"}
+
+        async def _run(call: dict[str, Any]) -> Any:
+            tool_name = call.get("tool", "")
+            tool_fn = batchable_tools.get(tool_name)
+            if tool_fn is None:
+                return {
+                    "tool": tool_name,
+                    "error": f"Unknown tool '{tool_name}'. Available: {list(batchable_tools)}",
+                    "error_type": "validation",
+                }
+            args = call.get("args") or {}
+            # Only a failure to bind the arguments is the caller's fault; errors raised by the tool are not
+            try:
+                batchable_signatures[tool_name].bind(**args)
+            except TypeError as exc:
+                return {"tool": tool_name, "error": str(exc), "error_type": "validation"}
+            async with batch_semaphore:
+                return await tool_fn(**args)
+
+        outcomes = await asyncio.gather(*(_run(call) for call in calls), return_exceptions=True)
+        results: list[Any] = []
+        for call, outcome in zip(calls, outcomes, strict=True):
+            if isinstance(outcome, BaseException):
+                logger.error("batch_execute_call_failed", tool=call.get("tool"), exc_info=outcome)
+                results.append({"tool": call.get("tool"), "error": "Internal error", "error_type": "internal"})
+            else:
+                results.append(outcome)
+        logger.info("tool_batch_execute_called", call_count=len(calls))
+        return {"results": results}
 
     @mcp.prompt()
     def reusable_code_guide() -> str:
@@ -552,6 +668,8 @@ def create_server(
     for _sn in servers_with_skills:
         _make_skills_resource(_sn)
 
+    _SERVER_COMPONENTS[mcp] = (registry, cache)
+
     # Register top-level tools as first-class FastMCP tools.
     # Each tool is an async function defined in compiled/<server>/top_level_functions.py.
     # The function's __name__ becomes the MCP tool name; its docstring the description.
@@ -586,18 +704,30 @@ def create_server(
 async def initialize_server(config: MCEConfig, mcp: FastMCP) -> None:
     """Run startup initialization: load registry and initialize cache.
 
+    For a server built by :func:`create_server` this prepares the same cache
+    the tools use (its registry is already loaded) and leaves it open.  Any
+    other FastMCP instance gets a standalone pre-flight check with a fresh
+    registry and a cache connection that is closed afterwards.
+
     Args:
         config: MCE configuration.
-        mcp: FastMCP server instance (used to access registry/cache via closure — handled elsewhere).
+        mcp: FastMCP server instance.
     """
-    # Registry and cache are loaded via the create_server closure
-    # This function can be used for pre-flight checks
-    registry = Registry(config.compiled_output_dir)
-    registry.load()
-
-    cache = CacheStore(config.cache_db_path, config.cache_ttl_seconds, config.cache_max_entries)
-    await cache.initialize()
-    await cache.cleanup_expired()
+    components = _SERVER_COMPONENTS.get(mcp)
+    if components is not None:
+        _, cache = components
+        await cache.initialize()
+        await cache.cleanup_expired()
+    else:
+        registry = Registry(config.compiled_output_dir)
+        registry.load()
+
+        cache = CacheStore(config.cache_db_path, config.cache_ttl_seconds, config.cache_max_entries)
+        try:
+            await cache.initialize()
+            await cache.cleanup_expired()
+        finally:
+            await cache.close()
 
     logger.info(
         "mce_server_initialized",
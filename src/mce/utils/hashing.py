@@ -1,7 +1,11 @@
 """Hashing utilities for swagger version detection and cache keys."""
 
+import functools
 import hashlib
 
+# Distinct code strings whose cache key is remembered; repeat executions skip normalization
+_HASH_CODE_CACHE_SIZE = 1024
+
 
 def hash_content(content: str | bytes) -> str:
     """Compute SHA256 hash of string or bytes content.
@@ -17,17 +21,20 @@ def hash_content(content: str | bytes) -> str:
     return hashlib.sha256(content).hexdigest()
 
 
+@functools.lru_cache(maxsize=_HASH_CODE_CACHE_SIZE)
 def hash_code(code: str) -> str:
     """Hash Python code string for cache key generation.
 
+    Results are memoized per code string; ``hash_code.cache_clear()`` resets them.
+
     Args:
         code: Python source code to hash.
 
     Returns:
         SHA256 hex digest of normalized code.
     """
-    # Normalize whitespace to avoid trivial cache misses
-    normalized = "\n".join(line.rstrip() for line in code.splitlines() if line.strip())
+    # Normalize whitespace to avoid trivial cache misses; rstrip() is empty exactly for blank lines
+    normalized = "\n".join([stripped for line in code.splitlines() if (stripped := line.rstrip())])
     return hash_content(normalized)
 
 
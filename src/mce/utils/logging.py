@@ -1,10 +1,35 @@
 """Structured logging configuration using structlog."""
 
+import json
 import logging
-from typing import cast
+from typing import Any, cast
 
+import orjson
 import structlog
 
+# Allow int/float dict keys in log fields the way stdlib json does
+_ORJSON_OPTS = orjson.OPT_NON_STR_KEYS
+
+
+def _dumps(obj: Any, **kwargs: Any) -> str:
+    """Serialize a log event dict with orjson, falling back to stdlib json.
+
+    orjson rejects a few payloads stdlib json accepts (e.g. integers wider
+    than 64 bits); those events still render instead of being dropped.
+
+    Args:
+        obj: Event dict to serialize.
+        **kwargs: JSONRenderer keyword arguments; only ``default`` is used.
+
+    Returns:
+        JSON document as text.
+    """
+    default = kwargs.get("default")
+    try:
+        return orjson.dumps(obj, default=default, option=_ORJSON_OPTS).decode("utf-8")
+    except TypeError:
+        return json.dumps(obj, default=default)
+
 
 def setup_logging(level: str = "INFO") -> None:
     """Configure structlog for structured logging.
@@ -30,7 +55,7 @@ def setup_logging(level: str = "INFO") -> None:
     if level.upper() == "DEBUG":
         renderer: structlog.types.Processor = structlog.dev.ConsoleRenderer()
     else:
-        renderer = structlog.processors.JSONRenderer()
+        renderer = structlog.processors.JSONRenderer(serializer=_dumps)
 
     structlog.configure(
         processors=[
@@ -12,6 +12,12 @@ from mce.models import EndpointSpec, ParamSchema, ResponseField, ServerSpec, Swa
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
 
+@pytest.fixture(autouse=True)
+def _isolated_template_cache(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep the Jinja2 bytecode cache inside the test's temp directory."""
+    monkeypatch.setenv("MCE_TEMPLATE_CACHE_DIR", str(tmp_path / "jinja_cache"))
+
+
 @pytest.fixture
 def mce_config(tmp_path: Path) -> MCEConfig:
     """Return a test MCEConfig pointing at temp directories."""
@@ -2,112 +2,79 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import pytest
+import yaml
+
 from mce.compiler.orchestrator import Orchestrator
+from mce.config import MCEConfig
 
 if TYPE_CHECKING:
-    from mce.config import MCEConfig
-
+    from mce.compiler.orchestrator import CompileResult
 
-async def test_compile_weather_api(tmp_path: Path, mce_config: MCEConfig) -> None:
-    """Full compile pipeline produces valid output for weather fixture."""
-    from pathlib import Path  # noqa: PLC0415
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures"
 
-    import yaml  # noqa: PLC0415
 
-    fixtures_dir = Path(__file__).parent.parent / "fixtures"
+def _write_swaggers_config(root: Path, *, is_read_only: bool | None = None) -> Path:
+    """Write a swaggers.yaml describing the weather fixture under *root*/config."""
+    server: dict[str, object] = {
+        "name": "weather",
+        "swagger_url": str(FIXTURES_DIR / "weather_api.yaml"),
+        "base_url": "https://api.weather.example.com/v1",
+    }
+    if is_read_only is not None:
+        server["is_read_only"] = is_read_only
 
-    # Create a swaggers.yaml config
-    config_dir = tmp_path / "config"
+    config_dir = root / "config"
     config_dir.mkdir()
     config_file = config_dir / "swaggers.yaml"
-    config_file.write_text(
-        yaml.dump(
-            {
-                "servers": [
-                    {
-                        "name": "weather",
-                        "swagger_url": str(fixtures_dir / "weather_api.yaml"),
-                        "base_url": "https://api.weather.example.com/v1",
-                        "is_read_only": True,
-                    }
-                ]
-            }
-        )
+    config_file.write_text(yaml.dump({"servers": [server]}))
+    return config_file
+
+
+@pytest.fixture(scope="module")
+def compiled_weather(tmp_path_factory: pytest.TempPathFactory) -> tuple[MCEConfig, CompileResult]:
+    """Compile the weather fixture once for the tests that only read the output."""
+    root = tmp_path_factory.mktemp("compiled_weather")
+    config = MCEConfig(
+        compiled_output_dir=str(root / "compiled"),
+        cache_db_path=str(root / "data" / "cache.db"),
+        swagger_config_file=str(_write_swaggers_config(root, is_read_only=True)),
+        log_level="DEBUG",
+        debug=True,
     )
+    result = asyncio.run(Orchestrator(config).compile_all())
+    return config, result
 
-    mce_config.swagger_config_file = str(config_file)
 
-    orchestrator = Orchestrator(mce_config)
-    result = await orchestrator.compile_all()
+def test_compile_weather_api(compiled_weather: tuple[MCEConfig, CompileResult]) -> None:
+    """Full compile pipeline produces valid output for weather fixture."""
+    _, result = compiled_weather
 
     assert "weather" in result.compiled
     assert result.total_endpoints > 0
     assert not result.failed
 
 
-async def test_compile_produces_functions_py(tmp_path: Path, mce_config: MCEConfig) -> None:
+def test_compile_produces_functions_py(compiled_weather: tuple[MCEConfig, CompileResult]) -> None:
     """Compiled output directory contains functions.py for each server."""
-    import yaml  # noqa: PLC0415
+    config, _ = compiled_weather
 
-    fixtures_dir = Path(__file__).parent.parent / "fixtures"
-    config_dir = tmp_path / "config"
-    config_dir.mkdir()
-    config_file = config_dir / "swaggers.yaml"
-    config_file.write_text(
-        yaml.dump(
-            {
-                "servers": [
-                    {
-                        "name": "weather",
-                        "swagger_url": str(fixtures_dir / "weather_api.yaml"),
-                        "base_url": "https://api.weather.example.com/v1",
-                    }
-                ]
-            }
-        )
-    )
-    mce_config.swagger_config_file = str(config_file)
-
-    orchestrator = Orchestrator(mce_config)
-    await orchestrator.compile_all()
-
-    functions_file = Path(mce_config.compiled_output_dir) / "weather" / "functions.py"
+    functions_file = Path(config.compiled_output_dir) / "weather" / "functions.py"
     assert functions_file.exists()
     content = functions_file.read_text()
     assert "def get_current_weather" in content
 
 
-async def test_compile_produces_manifest_json(tmp_path: Path, mce_config: MCEConfig) -> None:
+def test_compile_produces_manifest_json(compiled_weather: tuple[MCEConfig, CompileResult]) -> None:
     """Compiled output contains valid manifest.json."""
-    import yaml  # noqa: PLC0415
+    config, _ = compiled_weather
 
-    fixtures_dir = Path(__file__).parent.parent / "fixtures"
-    config_dir = tmp_path / "config"
-    config_dir.mkdir()
-    config_file = config_dir / "swaggers.yaml"
-    config_file.write_text(
-        yaml.dump(
-            {
-                "servers": [
-                    {
-                        "name": "weather",
-                        "swagger_url": str(fixtures_dir / "weather_api.yaml"),
-                        "base_url": "https://api.weather.example.com/v1",
-                    }
-                ]
-            }
-        )
-    )
-    mce_config.swagger_config_file = str(config_file)
-
-    orchestrator = Orchestrator(mce_config)
-    await orchestrator.compile_all()
-
-    manifest_file = Path(mce_config.compiled_output_dir) / "weather" / "manifest.json"
+    manifest_file = Path(config.compiled_output_dir) / "weather" / "manifest.json"
     assert manifest_file.exists()
     manifest = json.loads(manifest_file.read_text())
 
@@ -119,26 +86,7 @@ async def test_compile_produces_manifest_json(tmp_path: Path, mce_config: MCECon
 
 async def test_compile_skips_unchanged_server(tmp_path: Path, mce_config: MCEConfig) -> None:
     """Second compile run skips server if swagger hash matches."""
-    import yaml  # noqa: PLC0415
-
-    fixtures_dir = Path(__file__).parent.parent / "fixtures"
-    config_dir = tmp_path / "config"
-    config_dir.mkdir()
-    config_file = config_dir / "swaggers.yaml"
-    config_file.write_text(
-        yaml.dump(
-            {
-                "servers": [
-                    {
-                        "name": "weather",
-                        "swagger_url": str(fixtures_dir / "weather_api.yaml"),
-                        "base_url": "https://api.weather.example.com/v1",
-                    }
-                ]
-            }
-        )
-    )
-    mce_config.swagger_config_file = str(config_file)
+    mce_config.swagger_config_file = str(_write_swaggers_config(tmp_path))
 
     orchestrator = Orchestrator(mce_config)
     result1 = await orchestrator.compile_all()
@@ -151,26 +99,7 @@ async def test_compile_skips_unchanged_server(tmp_path: Path, mce_config: MCECon
 
 async def test_dry_run_does_not_write_files(tmp_path: Path, mce_config: MCEConfig) -> None:
     """Dry run parses but does not write any output files."""
-    import yaml  # noqa: PLC0415
-
-    fixtures_dir = Path(__file__).parent.parent / "fixtures"
-    config_dir = tmp_path / "config"
-    config_dir.mkdir()
-    config_file = config_dir / "swaggers.yaml"
-    config_file.write_text(
-        yaml.dump(
-            {
-                "servers": [
-                    {
-                        "name": "weather",
-                        "swagger_url": str(fixtures_dir / "weather_api.yaml"),
-                        "base_url": "https://api.weather.example.com/v1",
-                    }
-                ]
-            }
-        )
-    )
-    mce_config.swagger_config_file = str(config_file)
+    mce_config.swagger_config_file = str(_write_swaggers_config(tmp_path))
 
     orchestrator = Orchestrator(mce_config)
     result = await orchestrator.compile_all(dry_run=True)
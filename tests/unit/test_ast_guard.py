@@ -116,6 +116,12 @@ def test_environ_access_blocked(guard: ASTGuard) -> None:
         guard.validate("x = something.environ['SECRET']")
 
 
+def test_blocked_method_call_reported_as_attribute(guard: ASTGuard) -> None:
+    """A call through a blocked attribute is caught once, by the attribute check."""
+    with pytest.raises(SecurityViolationError, match=r"blocked_attribute\): access to \.system"):
+        guard.validate("shell.system('ls')")
+
+
 def test_invalid_syntax_raises_violation(guard: ASTGuard) -> None:
     with pytest.raises(SecurityViolationError, match="syntax"):
         guard.validate("def broken(: pass")
@@ -124,3 +130,51 @@ def test_invalid_syntax_raises_violation(guard: ASTGuard) -> None:
 def test_global_statement_blocked(guard: ASTGuard) -> None:
     with pytest.raises(SecurityViolationError, match="blocked_global"):
         guard.validate("def f():\n    global x\n    x = 1")
+
+
+def test_first_violation_in_source_order_is_reported(guard: ASTGuard) -> None:
+    code = "def f():\n    return [eval(x) for x in y]\n\nimport os"
+    with pytest.raises(SecurityViolationError, match=r"blocked_call\): call to eval\(\)"):
+        guard.validate(code)
+
+
+def test_violation_nested_in_expression_is_found(guard: ASTGuard) -> None:
+    with pytest.raises(SecurityViolationError, match="blocked_attribute"):
+        guard.validate("result = {k: (lambda: obj.__globals__)() for k in range(3)}")
+
+
+def test_walk_stops_at_first_violation(guard: ASTGuard) -> None:
+    import ast  # noqa: PLC0415
+    from unittest.mock import MagicMock, patch  # noqa: PLC0415
+
+    from mce.security import ast_guard  # noqa: PLC0415
+
+    name_check = MagicMock(return_value=None)
+    with (
+        patch.dict(ast_guard._CHECKS, {ast.Name: name_check}),
+        pytest.raises(SecurityViolationError, match="blocked_import"),
+    ):
+        guard.validate("import os\nresult = value")
+    name_check.assert_not_called()
+
+
+def test_repeated_code_reuses_cached_verdict(guard: ASTGuard) -> None:
+    import ast  # noqa: PLC0415
+    from unittest.mock import patch  # noqa: PLC0415
+
+    with patch("mce.security.ast_guard.ast.parse", wraps=ast.parse) as parse:
+        guard.validate("result = 1")
+        guard.validate("result = 1")
+        for _ in range(2):
+            with pytest.raises(SecurityViolationError, match="blocked_import"):
+                guard.validate("import os")
+    assert parse.call_count == 2
+
+
+def test_verdict_cache_is_bounded() -> None:
+    from mce.security.ast_guard import _VERDICT_CACHE_SIZE  # noqa: PLC0415
+
+    guard = ASTGuard()
+    for i in range(_VERDICT_CACHE_SIZE + 5):
+        guard.validate(f"result = {i}")
+    assert len(guard._verdicts) == _VERDICT_CACHE_SIZE
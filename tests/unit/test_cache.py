@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import time
 from typing import TYPE_CHECKING
 from unittest.mock import patch
@@ -13,18 +14,82 @@ from mce.errors import CacheError
 from mce.runtime.cache import CacheStore
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
     from pathlib import Path
 
 
+# code_cache as created by earlier releases (no full-text index)
+_LEGACY_SCHEMA_SQL = (
+    "CREATE TABLE code_cache (id TEXT PRIMARY KEY, description TEXT NOT NULL, code TEXT NOT NULL,"
+    " servers_used TEXT NOT NULL, swagger_hash TEXT NOT NULL, created_at REAL NOT NULL,"
+    " last_used_at REAL NOT NULL, use_count INTEGER DEFAULT 1, ttl_seconds INTEGER NOT NULL);"
+)
+
+
 @pytest.fixture
-async def cache(tmp_path: Path) -> CacheStore:
+async def cache(tmp_path: Path) -> AsyncIterator[CacheStore]:
     store = CacheStore(
         db_path=str(tmp_path / "test_cache.db"),
         ttl_seconds=3600,
         max_entries=10,
     )
     await store.initialize()
-    return store
+    yield store
+    await store.close()
+
+
+async def test_initialize_enables_wal_journal(tmp_path: Path) -> None:
+    """The cache database is switched to WAL so readers don't block on writers."""
+    db_path = tmp_path / "wal.db"
+    store = CacheStore(db_path=str(db_path))
+    await store.initialize()
+    await store.close()
+
+    async with aiosqlite.connect(db_path) as db, db.execute("PRAGMA journal_mode") as cursor:
+        row = await cursor.fetchone()
+    assert row is not None
+    assert row[0] == "wal"
+
+
+async def test_new_database_uses_large_pages_and_reclaims_deleted_space(tmp_path: Path) -> None:
+    """A fresh file gets 8 KiB pages and incremental auto-vacuum; bulk deletes leave no free pages."""
+    store = CacheStore(db_path=str(tmp_path / "layout.db"))
+    await store.initialize()
+    for i in range(50):
+        await store.store(f"result = {i}", "x" * 2000, [], "stale")
+    await store.invalidate_by_swagger_hash("stale")
+    await store.close()
+
+    async with aiosqlite.connect(tmp_path / "layout.db") as db:
+        pragmas = {}
+        for name in ("page_size", "auto_vacuum", "freelist_count"):
+            async with db.execute(f"PRAGMA {name}") as cursor:
+                (pragmas[name],) = await cursor.fetchone()  # type: ignore[misc]
+    assert pragmas == {"page_size": 8192, "auto_vacuum": 2, "freelist_count": 0}
+
+
+async def test_lru_eviction_reclaims_deleted_space(tmp_path: Path) -> None:
+    """Pages freed by LRU eviction are returned to the filesystem, not left on the freelist."""
+    store = CacheStore(db_path=str(tmp_path / "evict_layout.db"), max_entries=5)
+    await store.initialize()
+    for i in range(50):
+        await store.store(f"result = {i}", "x" * 2000, [], "hash")
+    await store.close()
+
+    async with aiosqlite.connect(tmp_path / "evict_layout.db") as db, db.execute("PRAGMA freelist_count") as cursor:
+        (freelist_count,) = await cursor.fetchone()  # type: ignore[misc]
+    assert freelist_count == 0
+
+
+async def test_operations_reuse_one_connection(cache: CacheStore) -> None:
+    """Every operation runs on the connection opened by initialize(); close() releases it."""
+    with patch("aiosqlite.connect", side_effect=AssertionError("reconnected")):
+        entry_id = await cache.store("result = 1", "reuse", [], "hash1")
+        assert await cache.get(entry_id) is not None
+        assert await cache.search("reuse")
+
+    await cache.close()
+    assert cache._db is None
 
 
 async def test_store_and_retrieve(cache: CacheStore) -> None:
@@ -100,6 +165,7 @@ async def test_expired_entry_not_returned(tmp_path: Path) -> None:
     time.sleep(1.1)
 
     entry = await cache.get(entry_id)
+    await cache.close()
     assert entry is None
 
 
@@ -116,6 +182,7 @@ async def test_cleanup_expired_removes_old_entries(tmp_path: Path) -> None:
     time.sleep(1.1)
 
     removed = await cache.cleanup_expired()
+    await cache.close()
     assert removed >= 1
 
 
@@ -132,9 +199,94 @@ async def test_lru_eviction_on_max_entries(tmp_path: Path) -> None:
         await cache.store(f"result = {i}", f"code {i}", [], f"hash{i}")
 
     results = await cache.search()
+    await cache.close()
     assert len(results) <= 3
 
 
+async def test_store_succeeds_when_eviction_fails(tmp_path: Path) -> None:
+    """A failing LRU eviction is logged; the store that triggered it still commits."""
+    cache = CacheStore(db_path=str(tmp_path / "evict_fail.db"), ttl_seconds=3600, max_entries=1)
+    await cache.initialize()
+    await cache.store("result = 1", "first", [], "hash1")
+
+    with patch("mce.runtime.cache.EVICT_LRU_SQL", "DELETE FROM missing_table WHERE ?"):
+        entry_id = await cache.store("result = 2", "second", [], "hash1")
+
+    assert await cache.get(entry_id) is not None
+    assert cache._row_count == 2
+    await cache.close()
+
+
+async def test_row_count_tracked_without_count_scans(tmp_path: Path) -> None:
+    """The in-process row count follows inserts, re-stores, evictions and deletes."""
+    cache = CacheStore(db_path=str(tmp_path / "count_cache.db"), ttl_seconds=3600, max_entries=2)
+    await cache.initialize()
+
+    with patch("mce.runtime.cache.count_entries", side_effect=AssertionError("COUNT(*) not expected")):
+        await cache.store("result = 1", "one", [], "hash_a")
+        await cache.store("result = 1", "one again", [], "hash_a")
+        assert cache._row_count == 1
+        await cache.store("result = 2", "two", [], "hash_b")
+        await cache.store("result = 3", "three", [], "hash_b")
+        assert cache._row_count == 2
+        assert await cache.invalidate_by_swagger_hash("hash_b") == 2
+        assert cache._row_count == 0
+
+    await cache.close()
+
+
+async def test_concurrent_stores_share_one_transaction(cache: CacheStore) -> None:
+    """Stores issued together are committed as a batch and each still returns its own ID."""
+    batch_sizes: list[int] = []
+    real_write_batch = cache._write_batch
+
+    async def _record(rows: list[tuple[object, ...]]) -> None:
+        batch_sizes.append(len(rows))
+        await real_write_batch(rows)
+
+    with patch.object(cache._writer, "_write", side_effect=_record):
+        ids = await asyncio.gather(*(cache.store(f"result = {i}", f"batch {i}", [], "h") for i in range(5)))
+
+    assert batch_sizes == [5]
+    assert len(set(ids)) == 5
+    assert len(await cache.search("batch")) == 5
+
+
+async def test_failing_row_does_not_fail_its_batch(cache: CacheStore) -> None:
+    """A row rejected by the database fails only its own store, not the rest of the batch."""
+    results = await asyncio.gather(
+        cache.store("result = 1", "good one", [], "h"),
+        cache.store("result = 2", None, [], "h"),  # type: ignore[arg-type]  # violates NOT NULL
+        cache.store("result = 3", "good two", [], "h"),
+        return_exceptions=True,
+    )
+
+    assert isinstance(results[1], CacheError)
+    assert all(isinstance(r, str) for r in (results[0], results[2]))
+    assert len(await cache.search("good")) == 2
+
+
+async def test_cancelled_flush_fails_waiting_stores(cache: CacheStore) -> None:
+    """Cancelling the batch writer fails pending stores with CacheError instead of hanging them."""
+    blocked = asyncio.Event()
+
+    async def _hang(rows: list[tuple[object, ...]]) -> None:
+        blocked.set()
+        await asyncio.Event().wait()
+
+    with patch.object(cache._writer, "_write", side_effect=_hang):
+        first = asyncio.create_task(cache.store("result = 1", "first", [], "h"))
+        await blocked.wait()
+        queued = asyncio.create_task(cache.store("result = 2", "queued", [], "h"))
+        await asyncio.sleep(0)
+        assert cache._writer._flush_task is not None
+        cache._writer._flush_task.cancel()
+
+        for task in (first, queued):
+            with pytest.raises(CacheError, match="cancelled"):
+                await asyncio.wait_for(task, timeout=1)
+
+
 async def test_invalidate_by_swagger_hash(cache: CacheStore) -> None:
     """invalidate_by_swagger_hash removes entries with matching hash."""
     await cache.store("result = 1", "uses old api", ["weather"], "old_hash_abc")
@@ -204,3 +356,112 @@ async def test_cleanup_expired_raises_cache_error_on_db_failure(tmp_path: Path)
         pytest.raises(CacheError, match="Failed to clean"),
     ):
         await store.cleanup_expired()
+
+
+async def test_get_returns_entry_with_hit_recorded(cache: CacheStore) -> None:
+    """get() returns the row as updated by the hit and misses cleanly on unknown IDs."""
+    entry_id = await cache.store("result = 'touch'", "touched", [], "hash1")
+
+    entry = await cache.get(entry_id)
+
+    assert entry is not None
+    assert entry.use_count == 2
+    assert entry.last_used_at >= entry.created_at
+    assert await cache.get("0" * 64) is None
+
+
+async def test_store_reuses_encoded_server_lists(cache: CacheStore) -> None:
+    """The JSON for a recurring server list is encoded once and round-trips intact."""
+    from mce.runtime.cache_db import encode_servers  # noqa: PLC0415
+
+    encode_servers.cache_clear()
+    await cache.store("result = 1", "first", ["weather", "petstore"], "hash1")
+    await cache.store("result = 2", "second", ["weather", "petstore"], "hash1")
+
+    assert encode_servers.cache_info().hits == 1
+    results = await cache.search("first")
+    assert results[0].servers_used == ["weather", "petstore"]
+
+
+async def test_rows_decode_recurring_server_lists_once(cache: CacheStore) -> None:
+    """Rows sharing a server list parse its JSON once and still get independent lists."""
+    from mce.runtime.cache_db import decode_servers  # noqa: PLC0415
+
+    await cache.store("result = 1", "alpha", ["weather"], "hash1")
+    await cache.store("result = 2", "beta", ["weather"], "hash1")
+    decode_servers.cache_clear()
+
+    results = await cache.search()
+
+    assert decode_servers.cache_info().hits == 1
+    assert [r.servers_used for r in results] == [["weather"], ["weather"]]
+    assert results[0].servers_used is not results[1].servers_used
+
+
+async def test_search_uses_fts_substring_match(cache: CacheStore) -> None:
+    """Indexed search keeps LIKE semantics: case-insensitive substrings, deletes stay in sync."""
+    assert cache._fts_enabled
+    await cache.store("result = 1", "Fetch Weather forecast", [], "old_hash")
+    await cache.store("result = 2", "List hotels", [], "new_hash")
+
+    assert [r.description for r in await cache.search("WEATH")] == ["Fetch Weather forecast"]
+    assert [r.description for r in await cache.search("ot")] == ["List hotels"]  # short query, LIKE path
+
+    await cache.invalidate_by_swagger_hash("old_hash")
+    assert await cache.search("weather") == []
+
+
+async def test_initialize_backfills_fts_for_existing_rows(tmp_path: Path) -> None:
+    """Rows written before the full-text index existed are searchable after initialize()."""
+    db_path = tmp_path / "legacy.db"
+    async with aiosqlite.connect(db_path) as db:
+        await db.executescript(_LEGACY_SCHEMA_SQL)
+        now = time.time()
+        await db.execute(
+            "INSERT INTO code_cache VALUES ('a', 'legacy weather lookup', 'result = 1', '[]', 'h', ?, ?, 1, 3600)",
+            (now, now),
+        )
+        await db.commit()
+
+    store = CacheStore(db_path=str(db_path))
+    await store.initialize()
+    results = await store.search("weather")
+    await store.close()
+
+    assert [r.id for r in results] == ["a"]
+
+
+async def test_initialize_drops_unused_description_index(tmp_path: Path) -> None:
+    """The legacy B-tree index on description is removed from existing databases."""
+    db_path = tmp_path / "indexed.db"
+    async with aiosqlite.connect(db_path) as db:
+        await db.executescript(_LEGACY_SCHEMA_SQL + "CREATE INDEX idx_cache_description ON code_cache(description);")
+
+    store = CacheStore(db_path=str(db_path))
+    await store.initialize()
+    await store.close()
+
+    async with (
+        aiosqlite.connect(db_path) as db,
+        db.execute("SELECT name FROM sqlite_master WHERE type = 'index' AND name = 'idx_cache_description'") as cursor,
+    ):
+        assert await cursor.fetchone() is None
+
+
+async def test_get_refreshes_recency_only_when_stale(cache: CacheStore) -> None:
+    """Hits always count, but last_used_at is rewritten only once it is older than the interval."""
+    from mce.runtime.cache import _TOUCH_INTERVAL_SECONDS  # noqa: PLC0415
+
+    entry_id = await cache.store("result = 'lru'", "recency", [], "hash1")
+    stored_at = (await cache.get(entry_id)).last_used_at  # type: ignore[union-attr]
+
+    fresh = await cache.get(entry_id)
+    assert fresh is not None
+    assert fresh.last_used_at == stored_at
+    assert fresh.use_count == 3
+
+    later = stored_at + _TOUCH_INTERVAL_SECONDS + 1
+    with patch("mce.runtime.cache.time.time", return_value=later):
+        stale = await cache.get(entry_id)
+    assert stale is not None
+    assert stale.last_used_at == later
@@ -7,6 +7,8 @@ from typing import TYPE_CHECKING
 from mce.compiler.codegen import CodeGenerator
 
 if TYPE_CHECKING:
+    from pathlib import Path
+
     from mce.models import ServerSpec
 
 
@@ -105,3 +107,66 @@ def test_safe_name_already_snake_case() -> None:
 
     assert _safe_name("city") == "city"
     assert _safe_name("start_time") == "start_time"
+
+
+def test_build_bytecode_cache_disabled_when_dir_unusable(tmp_path: Path) -> None:
+    """An uncreatable cache directory disables the bytecode cache instead of failing."""
+    from unittest.mock import patch  # noqa: PLC0415
+
+    from mce.compiler.codegen import _build_bytecode_cache  # noqa: PLC0415
+
+    with patch("pathlib.Path.mkdir", side_effect=PermissionError("read-only dir")):
+        assert _build_bytecode_cache(tmp_path / "jinja") is None
+
+
+def test_generator_writes_bytecode_only_to_configured_dir(tmp_path: Path, sample_server_spec: ServerSpec) -> None:
+    """No cache directory means no bytecode cache; a given one receives the compiled templates."""
+    CodeGenerator().generate(sample_server_spec)
+    assert not any(tmp_path.iterdir())
+
+    cache_dir = tmp_path / "jinja"
+    CodeGenerator(cache_dir).generate(sample_server_spec)
+    assert any(cache_dir.iterdir())
+
+
+def test_safe_name_replaces_non_identifier_characters() -> None:
+    """Punctuation and non-ASCII characters collapse to single underscores."""
+    from mce.compiler.codegen import _safe_name  # noqa: PLC0415
+
+    assert _safe_name("x-api--key") == "x_api_key"
+    assert _safe_name("naïve.value") == "na_ve_value"
+    assert _safe_name("2fa") == "p_2fa"
+    assert _safe_name("class") == "class_"
+    assert _safe_name("$$") == "param"
+
+
+def test_safe_name_is_memoized() -> None:
+    """Repeated sanitization of the same name is served from the cache."""
+    from mce.compiler.codegen import _safe_name  # noqa: PLC0415
+
+    _safe_name.cache_clear()
+    assert _safe_name("pageSize") == _safe_name("pageSize") == "page_size"
+    assert _safe_name.cache_info().hits == 1
+
+
+def test_partition_parameters_groups_in_declaration_order(sample_server_spec: ServerSpec) -> None:
+    """Parameters are split by required-ness and by location in a single pass."""
+    from mce.compiler.codegen import _partition_parameters  # noqa: PLC0415
+
+    endpoint = sample_server_spec.endpoints[0]
+    required, optional, query, path = _partition_parameters(endpoint)
+
+    assert [p.name for p in required] == ["city"]
+    assert [p.name for p in optional] == ["units"]
+    assert [p.name for p in query] == ["city", "units"]
+    assert path == []
+
+
+def test_get_endpoint_uses_specialized_template(sample_server_spec: ServerSpec) -> None:
+    """Body-less GET endpoints render through the GET-only block template."""
+    gen = CodeGenerator()
+    data = gen._prepare_function_data(sample_server_spec.endpoints[0])
+
+    assert data["template"] == "get_function_block.py.j2"
+    assert "has_body" not in data
+    assert '"GET",' in gen.generate(sample_server_spec)
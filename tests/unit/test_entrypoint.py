@@ -0,0 +1,72 @@
+"""Unit tests for the result serializer in sandbox/entrypoint.py."""
+
+from __future__ import annotations
+
+import dataclasses
+import datetime
+import importlib.util
+import json
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+if TYPE_CHECKING:
+    from types import ModuleType
+
+_ENTRYPOINT_PATH = Path(__file__).parents[2] / "sandbox" / "entrypoint.py"
+
+
+@pytest.fixture(scope="module")
+def entrypoint() -> ModuleType:
+    """Load sandbox/entrypoint.py, which is not part of the installed package."""
+    spec = importlib.util.spec_from_file_location("mce_sandbox_entrypoint", _ENTRYPOINT_PATH)
+    assert spec is not None
+    assert spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@dataclasses.dataclass
+class _Point:
+    x: int
+    y: int
+
+
+def _stdlib(payload: dict[str, object]) -> bytes:
+    return json.dumps(payload, default=str).encode("utf-8")
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"when": datetime.datetime(2024, 5, 1, 12, 30, tzinfo=datetime.UTC), "day": datetime.date(2024, 5, 1)},
+        {"at": datetime.time(8, 15)},
+        {"point": _Point(1, 2)},
+        {"id": uuid.UUID("12345678-1234-5678-1234-567812345678")},
+        {1: "int key", "nested": [1, 2.5, None, True, "x"]},
+    ],
+)
+def test_dumps_matches_stdlib_json(entrypoint: ModuleType, data: object) -> None:
+    """Values orjson would encode natively keep the stdlib ``default=str`` format."""
+    payload = {"success": True, "data": data, "prints": None}
+
+    assert json.loads(entrypoint._dumps(payload)) == json.loads(_stdlib(payload))
+
+
+def test_dumps_keeps_non_finite_floats(entrypoint: ModuleType) -> None:
+    """NaN and infinities are emitted as stdlib json does instead of becoming null."""
+    payload = {"success": True, "data": {"ratio": [float("nan"), float("inf")], "missing": None}}
+
+    assert entrypoint._dumps(payload) == _stdlib(payload)
+
+
+def test_dumps_renders_datetime_alike_with_and_without_fallback(entrypoint: ModuleType) -> None:
+    """A datetime renders the same whether or not a wide int forces the stdlib fallback."""
+    when = datetime.datetime(2024, 5, 1, 12, 30)
+    plain = json.loads(entrypoint._dumps({"data": {"when": when}}))
+    wide = json.loads(entrypoint._dumps({"data": {"when": when, "big": 2**70}}))
+
+    assert plain["data"]["when"] == wide["data"]["when"] == str(when)
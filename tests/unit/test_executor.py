@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import asyncio
+import io
 import json
-import subprocess
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import aiodocker
 import pytest
 
 if TYPE_CHECKING:
@@ -82,6 +83,21 @@ def test_detect_servers_used_deduplicates() -> None:
     assert _detect_servers_used(code) == ["weather"]
 
 
+def test_detect_servers_used_mixed_styles_sorted() -> None:
+    code = "import weather.functions\nfrom hotel.functions import search\nfunctions = 1"
+    assert _detect_servers_used(code) == ["hotel", "weather"]
+
+
+def test_detect_servers_used_scans_only_lines_with_imports() -> None:
+    body = "x = 1\n" * 50
+    code = f"import os\nfrom weather.functions import fn\n{body}    import hotel.functions"
+    with patch("mce.runtime.executor._SERVER_IMPORT_RE") as pattern:
+        pattern.findall.return_value = []
+        _detect_servers_used(code)
+    assert pattern.findall.call_args.args == (code, len("import os\n"), len(code))
+    assert _detect_servers_used(code) == ["hotel", "weather"]
+
+
 # ---------------------------------------------------------------------------
 # CodeExecutor.__init__
 # ---------------------------------------------------------------------------
@@ -136,6 +152,53 @@ async def test_startup_warm_mode_creates_pool(tmp_path: Path) -> None:
     mock_containers_api.create.assert_awaited_once()
 
 
+async def test_startup_warm_mode_fills_pool_concurrently(tmp_path: Path) -> None:
+    config = _make_config(tmp_path, sandbox_mode="warm")
+    config.warm_pool_size = 3
+    executor = CodeExecutor(config, _make_mock_cache())
+    in_flight = 0
+    peak = 0
+
+    async def _create(config: dict[str, Any], name: str) -> AsyncMock:  # noqa: ARG001
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        container = AsyncMock()
+        container.id = name
+        return container
+
+    mock_client = _make_docker_mock()
+    mock_client.containers = AsyncMock()
+    mock_client.containers.list = AsyncMock(return_value=[])
+    mock_client.containers.create = AsyncMock(side_effect=_create)
+
+    with patch("aiodocker.Docker", return_value=mock_client):
+        await executor.startup()
+
+    assert peak == 3
+    assert len(executor._warm_containers) == 3
+
+
+async def test_startup_warm_mode_tracks_started_containers_on_partial_failure(tmp_path: Path) -> None:
+    config = _make_config(tmp_path, sandbox_mode="warm")
+    config.warm_pool_size = 2
+    executor = CodeExecutor(config, _make_mock_cache())
+    good = AsyncMock()
+    good.id = "good00000000"
+
+    mock_client = _make_docker_mock()
+    mock_client.containers = AsyncMock()
+    mock_client.containers.list = AsyncMock(return_value=[])
+    mock_client.containers.create = AsyncMock(side_effect=[good, aiodocker.exceptions.DockerError(500, "boom")])
+
+    with patch("aiodocker.Docker", return_value=mock_client), pytest.raises(ExecutionError):
+        await executor.startup()
+
+    assert executor._warm_containers == [good]
+
+
 async def test_startup_warm_mode_removes_stale_containers(tmp_path: Path) -> None:
     config = _make_config(tmp_path, sandbox_mode="warm")
     executor = CodeExecutor(config, _make_mock_cache())
@@ -203,39 +266,115 @@ async def test_shutdown_safe_when_startup_not_called(tmp_path: Path) -> None:
 # ---------------------------------------------------------------------------
 
 
-def test_lint_code_skips_when_ruff_not_found(tmp_path: Path) -> None:
+def _make_ruff_proc(returncode: int = 0, stdout: bytes = b"") -> MagicMock:
+    proc = MagicMock()
+    proc.returncode = returncode
+    proc.stdin.drain = AsyncMock()
+    stream = io.BytesIO(stdout)
+    proc.stdout.read = AsyncMock(side_effect=stream.read)
+    proc.wait = AsyncMock(return_value=returncode)
+    return proc
+
+
+async def test_lint_code_skips_when_ruff_not_found(tmp_path: Path) -> None:
     config = _make_config(tmp_path)
     executor = CodeExecutor(config, _make_mock_cache())
-    with patch("subprocess.run", side_effect=FileNotFoundError("ruff not found")):
-        executor._lint_code("result = 42")  # must not raise
+    with patch("asyncio.create_subprocess_exec", side_effect=FileNotFoundError("ruff not found")):
+        await executor._lint_code("result = 42")  # must not raise
 
 
-def test_lint_code_timeout_is_skipped(tmp_path: Path) -> None:
+async def test_lint_code_timeout_is_skipped(tmp_path: Path) -> None:
     config = _make_config(tmp_path)
     executor = CodeExecutor(config, _make_mock_cache())
-    with patch("subprocess.run", side_effect=subprocess.TimeoutExpired(cmd=["ruff"], timeout=10)):
-        executor._lint_code("result = 42")  # must not raise
+    proc = _make_ruff_proc()
+    proc.returncode = None
+    proc.stdout.read = AsyncMock(side_effect=TimeoutError)
+    with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=proc)):
+        await executor._lint_code("result = 42")  # must not raise
+    proc.kill.assert_called_once()
+    proc.wait.assert_awaited_once()
 
 
-def test_lint_code_raises_lint_error_on_failure(tmp_path: Path) -> None:
+async def test_lint_code_raises_lint_error_on_failure(tmp_path: Path) -> None:
     config = _make_config(tmp_path)
     executor = CodeExecutor(config, _make_mock_cache())
-    mock_result = MagicMock()
-    mock_result.returncode = 1
-    mock_result.stdout = "E501 line too long"
-    with patch("subprocess.run", return_value=mock_result):
+    proc = _make_ruff_proc(returncode=1, stdout=b"E501 line too long")
+    with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=proc)):
         with pytest.raises(LintError) as exc_info:
-            executor._lint_code("x = 1")
+            await executor._lint_code("x = 1")
         assert exc_info.value.lint_output == "E501 line too long"
 
 
-def test_lint_code_passes_on_zero_returncode(tmp_path: Path) -> None:
+async def test_lint_code_stops_reading_oversized_output(tmp_path: Path) -> None:
+    from mce.runtime.executor import _LINT_OUTPUT_MAX_BYTES  # noqa: PLC0415
+
+    config = _make_config(tmp_path)
+    executor = CodeExecutor(config, _make_mock_cache())
+    proc = _make_ruff_proc(stdout=b"E" * (_LINT_OUTPUT_MAX_BYTES * 50))
+    proc.returncode = None
+    with (
+        patch("asyncio.create_subprocess_exec", AsyncMock(return_value=proc)) as spawn,
+        pytest.raises(LintError) as exc_info,
+    ):
+        await executor._lint_code("x = 1")
+    assert exc_info.value.lint_output == "E" * _LINT_OUTPUT_MAX_BYTES
+    assert spawn.await_args is not None
+    assert "--output-format=concise" in spawn.await_args.args
+    proc.kill.assert_called_once()
+
+
+async def test_lint_code_passes_on_zero_returncode(tmp_path: Path) -> None:
+    config = _make_config(tmp_path)
+    executor = CodeExecutor(config, _make_mock_cache())
+    with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=_make_ruff_proc())):
+        await executor._lint_code("result = 42")  # must not raise
+
+
+async def test_execute_spawns_lint_before_security_scan(tmp_path: Path) -> None:
+    """ruff is already running with the code when the AST guard starts."""
+    config = _make_config(tmp_path)
+    config.lint_enabled = True
+    config.cache_enabled = False
+    executor = CodeExecutor(config, _make_mock_cache())
+    executor._docker = _make_docker_mock()
+    events: list[str] = []
+    proc = _make_ruff_proc()
+    proc.stdin.close.side_effect = lambda: events.append("ruff_stdin_closed")
+
+    async def _spawn(*_args: Any, **_kwargs: Any) -> MagicMock:
+        events.append("ruff_spawn")
+        return proc
+
+    def _validate(*_args: Any, **_kwargs: Any) -> None:
+        events.append("validate")
+
+    with (
+        patch("asyncio.create_subprocess_exec", side_effect=_spawn),
+        patch.object(executor._ast_guard, "validate", side_effect=_validate),
+        patch.object(executor, "_run_cold", AsyncMock(return_value='{"success": true, "data": 1}')),
+    ):
+        await executor.execute("result = 1", "one")
+
+    assert events == ["ruff_spawn", "ruff_stdin_closed", "validate"]
+
+
+async def test_execute_security_error_reaps_spawned_lint(tmp_path: Path) -> None:
     config = _make_config(tmp_path)
+    config.lint_enabled = True
     executor = CodeExecutor(config, _make_mock_cache())
-    mock_result = MagicMock()
-    mock_result.returncode = 0
-    with patch("subprocess.run", return_value=mock_result):
-        executor._lint_code("result = 42")  # must not raise
+    executor._docker = _make_docker_mock()
+    proc = _make_ruff_proc()
+    proc.returncode = None
+
+    with (
+        patch("asyncio.create_subprocess_exec", AsyncMock(return_value=proc)),
+        pytest.raises(SecurityViolationError),
+    ):
+        await executor.execute("import subprocess\nresult = 1", "dangerous code")
+
+    proc.kill.assert_called_once()
+    proc.wait.assert_awaited_once()
+    proc.stdout.read.assert_not_awaited()
 
 
 # ---------------------------------------------------------------------------
@@ -293,6 +432,23 @@ def test_parse_output_non_json_returns_raw_as_data(tmp_path: Path) -> None:
     assert isinstance(result.data, str) and "raw text output" in result.data
 
 
+def test_parse_output_skips_json_parser_for_non_object_output(tmp_path: Path) -> None:
+    config = _make_config(tmp_path)
+    executor = CodeExecutor(config, _make_mock_cache())
+    with patch("mce.runtime.executor.json.loads") as loads:
+        result = executor._parse_output("  [1, 2] then text", 10)
+    loads.assert_not_called()
+    assert result.data == "[1, 2] then text"
+
+
+def test_parse_output_malformed_object_falls_back_to_text(tmp_path: Path) -> None:
+    config = _make_config(tmp_path)
+    executor = CodeExecutor(config, _make_mock_cache())
+    result = executor._parse_output('{"success": tru', 10)
+    assert result.success is True
+    assert result.data == '{"success": tru'
+
+
 def test_parse_output_traceback_only_in_debug_mode(tmp_path: Path) -> None:
     config = _make_config(tmp_path)
     config.debug = True
@@ -409,9 +565,38 @@ async def test_run_cold_container_deleted_on_success(tmp_path: Path) -> None:
     executor._docker = mock_docker
 
     await executor._run_cold("result = None", [])
+    await executor.shutdown()
     mock_container.delete.assert_awaited_once()
 
 
+async def test_run_cold_returns_before_container_removal_finishes(tmp_path: Path) -> None:
+    config = _make_config(tmp_path, sandbox_mode="cold")
+    executor = CodeExecutor(config, _make_mock_cache())
+
+    removal_started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def _slow_delete(**_kwargs: Any) -> None:
+        removal_started.set()
+        await release.wait()
+
+    mock_container = _make_cold_container_mock(json.dumps({"success": True, "data": 1}))
+    mock_container.delete = AsyncMock(side_effect=_slow_delete)
+    mock_docker = _make_docker_mock()
+    mock_docker.containers = AsyncMock()
+    mock_docker.containers.create = AsyncMock(return_value=mock_container)
+    executor._docker = mock_docker
+
+    output = await executor._run_cold("result = 1", [])
+    await removal_started.wait()
+
+    assert '"data": 1' in output
+    assert len(executor._pending_deletes) == 1
+    release.set()
+    await executor.shutdown()
+    assert not executor._pending_deletes
+
+
 # ---------------------------------------------------------------------------
 # _run_warm — mocked aiodocker exec
 # ---------------------------------------------------------------------------
@@ -455,6 +640,24 @@ async def test_run_warm_success(tmp_path: Path) -> None:
     assert "42" in output
 
 
+async def test_run_warm_caps_captured_output(tmp_path: Path) -> None:
+    config = _make_config(tmp_path, sandbox_mode="warm")
+    config.max_output_size_bytes = 8
+    executor = CodeExecutor(config, _make_mock_cache())
+
+    exec_obj = AsyncMock()
+    exec_obj.start = MagicMock(return_value=_make_exec_stream_mock(b"0123456789abcdef"))
+    mock_container = AsyncMock()
+    mock_container.exec = AsyncMock(return_value=exec_obj)
+
+    warm_pool = _WarmPool()
+    await warm_pool.push(mock_container)
+    executor._warm_pool = warm_pool
+    executor._docker = _make_docker_mock()
+
+    assert await executor._run_warm("result = 1", []) == "01234567"
+
+
 async def test_run_warm_container_returned_to_pool_after_exec(tmp_path: Path) -> None:
     """Container must be returned to the pool even on success."""
     config = _make_config(tmp_path, sandbox_mode="warm")
@@ -534,10 +737,7 @@ async def test_execute_cold_happy_path(tmp_path: Path) -> None:
     mock_docker.containers.create = AsyncMock(return_value=mock_container)
     executor._docker = mock_docker
 
-    ruff_result = MagicMock()
-    ruff_result.returncode = 0
-
-    with patch("subprocess.run", return_value=ruff_result):
+    with patch("asyncio.create_subprocess_exec", AsyncMock(return_value=_make_ruff_proc())):
         result = await executor.execute("result = 42", "compute 42")
 
     assert result.success is True
@@ -664,7 +864,9 @@ async def test_run_cold_container_delete_failure_is_swallowed(tmp_path: Path) ->
 
     # Should not raise despite delete failure
     output = await executor._run_cold("result = None", [])
+    await executor.shutdown()
     assert output
+    mock_container.delete.assert_awaited_once()
 
 
 # ---------------------------------------------------------------------------
@@ -737,3 +939,15 @@ def test_compute_swagger_hash_no_servers_returns_no_servers(tmp_path: Path) -> N
     config = _make_config(tmp_path)
     executor = CodeExecutor(config, _make_mock_cache())
     assert executor._compute_swagger_hash([]) == "no-servers"
+
+
+def test_compute_swagger_hash_memoizes_per_server_set(tmp_path: Path) -> None:
+    config = _make_config(tmp_path)
+    executor = CodeExecutor(config, _make_mock_cache())
+    with patch("mce.runtime.registry.Registry") as registry_cls:
+        registry_cls.return_value.get_swagger_hash.side_effect = lambda name: f"{name}-hash"
+        first = executor._compute_swagger_hash(["petstore", "weather"])
+        second = executor._compute_swagger_hash(["petstore", "weather"])
+
+    assert first == second != "unknown"
+    registry_cls.assert_called_once()
@@ -122,7 +122,7 @@ async def test_cmd_clean_removes_directory(tmp_path: Path) -> None:
     args = MagicMock()
     args.then = None
 
-    with patch("mce.__main__.load_config") as mock_cfg:
+    with patch("mce.config.load_config") as mock_cfg:
         cfg = MagicMock()
         cfg.compiled_output_dir = str(compiled_dir)
         mock_cfg.return_value = cfg
@@ -136,7 +136,7 @@ async def test_cmd_clean_nonexistent_dir_exits_0(tmp_path: Path) -> None:
     args = MagicMock()
     args.then = None
 
-    with patch("mce.__main__.load_config") as mock_cfg:
+    with patch("mce.config.load_config") as mock_cfg:
         cfg = MagicMock()
         cfg.compiled_output_dir = str(tmp_path / "does_not_exist")
         mock_cfg.return_value = cfg
@@ -162,7 +162,7 @@ async def test_cmd_clean_then_compile_calls_compile(tmp_path: Path) -> None:
     args.dry_run = False
 
     with (
-        patch("mce.__main__.load_config") as mock_cfg,
+        patch("mce.config.load_config") as mock_cfg,
         patch("mce.compiler.orchestrator.Orchestrator.compile_all", new=AsyncMock(return_value=mock_result)),
     ):
         cfg = MagicMock()
@@ -191,7 +191,7 @@ async def test_cmd_compile_success(tmp_path: Path) -> None:
     args.dry_run = False
 
     with (
-        patch("mce.__main__.load_config") as mock_config,
+        patch("mce.config.load_config") as mock_config,
         patch("mce.compiler.orchestrator.Orchestrator.compile_all", new=AsyncMock(return_value=mock_result)),
     ):
         mock_config.return_value = MagicMock()
@@ -212,7 +212,7 @@ async def test_cmd_compile_with_failures_returns_1(tmp_path: Path) -> None:
     args.dry_run = False
 
     with (
-        patch("mce.__main__.load_config"),
+        patch("mce.config.load_config"),
         patch("mce.compiler.orchestrator.Orchestrator.compile_all", new=AsyncMock(return_value=mock_result)),
     ):
         code = await _cmd_compile(args)
@@ -233,7 +233,7 @@ async def test_cmd_compile_llm_enhance_sets_config(tmp_path: Path) -> None:
 
     config_mock = MagicMock()
     with (
-        patch("mce.__main__.load_config", return_value=config_mock),
+        patch("mce.config.load_config", return_value=config_mock),
         patch("mce.compiler.orchestrator.Orchestrator.compile_all", new=AsyncMock(return_value=mock_result)),
     ):
         await _cmd_compile(args)
@@ -254,7 +254,7 @@ async def test_cmd_compile_skipped_sources_exits_0(tmp_path: Path) -> None:
     args.dry_run = True
 
     with (
-        patch("mce.__main__.load_config"),
+        patch("mce.config.load_config"),
         patch("mce.compiler.orchestrator.Orchestrator.compile_all", new=AsyncMock(return_value=mock_result)),
     ):
         code = await _cmd_compile(args)
@@ -289,7 +289,7 @@ async def test_cmd_serve_stdio_transport(tmp_path: Path) -> None:
     mock_executor.shutdown = AsyncMock()
 
     with (
-        patch("mce.__main__.load_config") as mock_cfg,
+        patch("mce.config.load_config") as mock_cfg,
         patch("mce.runtime.cache.CacheStore", return_value=mock_cache),
         patch("mce.runtime.registry.Registry", return_value=mock_registry),
         patch("mce.runtime.executor.CodeExecutor", return_value=mock_executor),
@@ -331,7 +331,7 @@ async def test_cmd_serve_http_transport(tmp_path: Path) -> None:
     mock_executor.shutdown = AsyncMock()
 
     with (
-        patch("mce.__main__.load_config") as mock_cfg,
+        patch("mce.config.load_config") as mock_cfg,
         patch("mce.runtime.cache.CacheStore", return_value=mock_cache),
         patch("mce.runtime.registry.Registry", return_value=mock_registry),
         patch("mce.runtime.executor.CodeExecutor", return_value=mock_executor),
@@ -373,7 +373,7 @@ async def test_cmd_serve_overrides_host_and_port(tmp_path: Path) -> None:
     mock_executor.shutdown = AsyncMock()
 
     with (
-        patch("mce.__main__.load_config") as mock_cfg,
+        patch("mce.config.load_config") as mock_cfg,
         patch("mce.runtime.cache.CacheStore", return_value=mock_cache),
         patch("mce.runtime.registry.Registry", return_value=mock_registry),
         patch("mce.runtime.executor.CodeExecutor", return_value=mock_executor),
@@ -407,7 +407,7 @@ async def test_cmd_run_compile_failure_returns_1() -> None:
     args.transport = "stdio"
 
     with (
-        patch("mce.__main__.load_config"),
+        patch("mce.config.load_config"),
         patch("mce.compiler.orchestrator.Orchestrator.compile_all", new=AsyncMock(return_value=mock_result)),
     ):
         code = await _cmd_run(args)
@@ -428,7 +428,7 @@ async def test_cmd_run_success_calls_serve() -> None:
     args.port = None
 
     with (
-        patch("mce.__main__.load_config"),
+        patch("mce.config.load_config"),
         patch("mce.compiler.orchestrator.Orchestrator.compile_all", new=AsyncMock(return_value=mock_result)),
         patch("mce.__main__._cmd_serve", new=AsyncMock(return_value=0)) as mock_serve,
     ):
@@ -446,9 +446,9 @@ async def test_cmd_run_success_calls_serve() -> None:
 def test_main_no_args_exits_0(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr("sys.argv", ["mce"])
     with (
-        patch("mce.__main__.load_dotenv"),
-        patch("mce.__main__.load_config", return_value=MagicMock(log_level="INFO")),
-        patch("mce.__main__.setup_logging"),
+        patch("dotenv.load_dotenv"),
+        patch("mce.config.load_config", return_value=MagicMock(log_level="INFO")),
+        patch("mce.utils.logging.setup_logging"),
         pytest.raises(SystemExit) as exc_info,
     ):
         main()
@@ -465,9 +465,9 @@ def test_main_compile_command_runs(monkeypatch: pytest.MonkeyPatch) -> None:
     mock_result.total_endpoints = 3
 
     with (
-        patch("mce.__main__.load_dotenv"),
-        patch("mce.__main__.load_config", return_value=MagicMock(log_level="INFO")),
-        patch("mce.__main__.setup_logging"),
+        patch("dotenv.load_dotenv"),
+        patch("mce.config.load_config", return_value=MagicMock(log_level="INFO")),
+        patch("mce.utils.logging.setup_logging"),
         patch("mce.compiler.orchestrator.Orchestrator.compile_all", new=AsyncMock(return_value=mock_result)),
         pytest.raises(SystemExit) as exc_info,
     ):
@@ -479,11 +479,29 @@ def test_main_compile_command_runs(monkeypatch: pytest.MonkeyPatch) -> None:
 def test_main_config_load_exception_falls_back_to_info(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.setattr("sys.argv", ["mce"])
     with (
-        patch("mce.__main__.load_dotenv"),
-        patch("mce.__main__.load_config", side_effect=Exception("bad config")),
-        patch("mce.__main__.setup_logging") as mock_setup,
+        patch("dotenv.load_dotenv"),
+        patch("mce.config.load_config", side_effect=Exception("bad config")),
+        patch("mce.utils.logging.setup_logging") as mock_setup,
         pytest.raises(SystemExit),
     ):
         main()
     # Falls back to INFO level
     mock_setup.assert_called_with("INFO")
+
+
+def test_help_does_not_import_config_or_logging() -> None:
+    """``mce --help`` exits before pydantic settings or structlog are imported."""
+    import subprocess  # noqa: PLC0415
+    import sys  # noqa: PLC0415
+
+    probe = (
+        "import sys, runpy\n"
+        "sys.argv = ['mce', '--help']\n"
+        "try:\n"
+        "    runpy.run_module('mce', run_name='__main__')\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print(sorted(m for m in ('mce.config', 'mce.utils.logging', 'pydantic') if m in sys.modules))\n"
+    )
+    result = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True)  # noqa: S603
+    assert result.stdout.strip().endswith("[]")
@@ -10,7 +10,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import pytest
 import yaml
 
-from mce.compiler.orchestrator import CompileResult, Orchestrator, _to_module_name
+from mce.compiler.orchestrator import CompileResult, Orchestrator, _ruff_binary, _to_module_name
 from mce.config import MCEConfig
 from mce.errors import CompileError
 
@@ -81,6 +81,14 @@ def test_compile_result_defaults() -> None:
 # ---------------------------------------------------------------------------
 
 
+def test_template_cache_defaults_to_compiled_output_dir(tmp_path: Path) -> None:
+    """Without MCE_TEMPLATE_CACHE_DIR, template bytecode goes under the compiled output dir."""
+    config = _make_config(tmp_path).model_copy(update={"template_cache_dir": ""})
+    Orchestrator(config)
+
+    assert (tmp_path / "compiled" / ".jinja_cache").is_dir()
+
+
 def test_load_swagger_sources_no_config_file_returns_empty(tmp_path: Path) -> None:
     config = _make_config(tmp_path)
     orchestrator = Orchestrator(config)
@@ -176,6 +184,13 @@ def test_is_up_to_date_returns_false_on_bad_json(tmp_path: Path) -> None:
     assert orchestrator._is_up_to_date(manifest_path, "any") is False
 
 
+def test_is_up_to_date_returns_false_on_non_object_json(tmp_path: Path) -> None:
+    manifest_path = tmp_path / "manifest.json"
+    manifest_path.write_text("[]", encoding="utf-8")
+    orchestrator = Orchestrator(_make_config(tmp_path))
+    assert orchestrator._is_up_to_date(manifest_path, "any") is False
+
+
 # ---------------------------------------------------------------------------
 # _write_functions() / _write_manifest()
 # ---------------------------------------------------------------------------
@@ -216,6 +231,19 @@ def test_write_manifest_contains_endpoints(tmp_path: Path, sample_server_spec) -
     assert endpoints[0]["function_name"] == "get_current_weather"
 
 
+def test_write_outputs_without_code_only_refreshes_skills(tmp_path: Path, sample_server_spec) -> None:  # type: ignore[no-untyped-def]
+    """An up-to-date server refresh writes skills but leaves functions/manifest alone."""
+    from mce.models import SwaggerSource  # noqa: PLC0415
+
+    orchestrator = Orchestrator(_make_config(tmp_path))
+    server_dir = tmp_path / "weather"
+    source = SwaggerSource(name="weather", swagger_url="http://example.com/swagger.json")
+    orchestrator._write_outputs(server_dir, sample_server_spec, "weather", source, None, "# Skills")
+    assert (server_dir / "skills.md").read_text(encoding="utf-8") == "# Skills"
+    assert not (server_dir / "functions.py").exists()
+    assert not (server_dir / "manifest.json").exists()
+
+
 # ---------------------------------------------------------------------------
 # _lint_all_generated_code()
 # ---------------------------------------------------------------------------
@@ -252,6 +280,42 @@ def test_lint_all_generated_code_lint_warnings(tmp_path: Path) -> None:
         orchestrator._lint_all_generated_code()  # logs warning, does not raise
 
 
+def test_lint_all_generated_code_skips_unchanged_files(tmp_path: Path) -> None:
+    """A second lint pass over unchanged files must not spawn ruff."""
+    orchestrator = Orchestrator(_make_config(tmp_path))
+    compiled = tmp_path / "compiled" / "weather"
+    compiled.mkdir(parents=True)
+    (compiled / "functions.py").write_text("result = 1\n")
+    with patch("subprocess.run", return_value=MagicMock(returncode=0, stdout="")) as mock_run:
+        orchestrator._lint_all_generated_code()
+        orchestrator._lint_all_generated_code()
+    assert mock_run.call_count == 1
+
+
+def test_lint_all_generated_code_relints_changed_file(tmp_path: Path) -> None:
+    orchestrator = Orchestrator(_make_config(tmp_path))
+    compiled = tmp_path / "compiled" / "weather"
+    compiled.mkdir(parents=True)
+    functions_file = compiled / "functions.py"
+    functions_file.write_text("result = 1\n")
+    with patch("subprocess.run", return_value=MagicMock(returncode=0, stdout="")) as mock_run:
+        orchestrator._lint_all_generated_code()
+        functions_file.write_text("result = 2\n")
+        orchestrator._lint_all_generated_code()
+    assert mock_run.call_count == 2
+
+
+def test_lint_all_generated_code_failure_not_cached(tmp_path: Path) -> None:
+    orchestrator = Orchestrator(_make_config(tmp_path))
+    compiled = tmp_path / "compiled" / "weather"
+    compiled.mkdir(parents=True)
+    (compiled / "functions.py").write_text("result = 1\n")
+    with patch("subprocess.run", return_value=MagicMock(returncode=1, stdout="E: bad")) as mock_run:
+        orchestrator._lint_all_generated_code()
+        orchestrator._lint_all_generated_code()
+    assert mock_run.call_count == 2
+
+
 # ---------------------------------------------------------------------------
 # compile_all() — with real fixture YAMLs
 # ---------------------------------------------------------------------------
@@ -363,6 +427,39 @@ async def test_compile_all_records_failed_source(tmp_path: Path) -> None:
     assert "bad" in result.failed
 
 
+async def test_compile_all_classifies_mixed_sources(tmp_path: Path) -> None:
+    """Concurrent compile keeps per-source outcomes separate and in source order."""
+    servers = [
+        {
+            "name": "hotel",
+            "swagger_url": str(FIXTURES_DIR / "hotel_api.yaml"),
+            "base_url": "https://api.hotel.example.com/v2",
+        },
+        {
+            "name": "bad",
+            "swagger_url": "/tmp/totally_nonexistent_123.yaml",
+            "base_url": "https://bad.example.com",
+        },
+        {
+            "name": "weather",
+            "swagger_url": str(FIXTURES_DIR / "weather_api.yaml"),
+            "base_url": "https://api.weather.example.com/v1",
+        },
+    ]
+    _write_swagger_yaml(tmp_path, servers)
+    config = _make_config(tmp_path, str(tmp_path / "swaggers.yaml"))
+    orchestrator = Orchestrator(config)
+
+    with patch("subprocess.run", return_value=MagicMock(returncode=0, stdout="")):
+        result = await orchestrator.compile_all()
+
+    assert result.compiled == ["hotel", "weather"]
+    assert result.failed == ["bad"]
+    # Every manifest from one pass shares the same compiled_at stamp
+    stamps = {json.loads(p.read_text())["compiled_at"] for p in (tmp_path / "compiled").glob("*/manifest.json")}
+    assert len(stamps) == 1
+
+
 # ---------------------------------------------------------------------------
 # _fetch_skills_content()
 # ---------------------------------------------------------------------------
@@ -439,3 +536,28 @@ def test_write_skills_noop_when_none(tmp_path: Path) -> None:
     server_dir.mkdir()
     orchestrator._write_skills(server_dir, None, "weather")
     assert not (server_dir / "skills.md").exists()
+
+
+def test_ruff_binary_falls_back_to_path_lookup() -> None:
+    """When the ruff wheel's binary cannot be located, the PATH name is used."""
+    _ruff_binary.cache_clear()
+    try:
+        with patch("ruff.find_ruff_bin", side_effect=FileNotFoundError("no ruff")):
+            assert _ruff_binary() == "ruff"
+    finally:
+        _ruff_binary.cache_clear()
+
+
+def test_lint_cache_round_trips_and_ignores_corrupt_file(tmp_path: Path) -> None:
+    """Recorded lint passes read back intact; an unparseable cache file reads as empty."""
+    config = _make_config(tmp_path)
+    orchestrator = Orchestrator(config)
+    server_dir = tmp_path / "weather"
+    server_dir.mkdir()
+    functions_path = server_dir / "functions.py"
+
+    orchestrator._record_lint_pass({functions_path: "abc123"})
+    assert orchestrator._lint_cache_hit(functions_path, "abc123")
+
+    (server_dir / ".lint_cache.json").write_bytes(b"{not json")
+    assert Orchestrator._read_lint_cache(server_dir) == {}
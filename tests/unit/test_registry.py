@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+import ast
 import json
 from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -12,6 +14,7 @@ import pytest
 
 from mce.errors import FunctionNotFoundError, ServerNotFoundError
 from mce.models import EndpointManifest, ServerManifest
+from mce.runtime.manifest_loader import parse_parameters_summary
 from mce.runtime.registry import Registry
 
 # ---------------------------------------------------------------------------
@@ -115,6 +118,89 @@ def test_load_skips_invalid_manifest(tmp_path: Path) -> None:
     assert registry.list_servers() == []
 
 
+def test_load_keeps_valid_manifests_when_one_is_corrupt(tmp_path: Path) -> None:
+    """A corrupt or empty manifest does not prevent the other servers from loading."""
+    _make_manifest(tmp_path, server_name="weather")
+    for name, content in (("bad_server", "not valid json"), ("empty_server", "")):
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "manifest.json").write_text(content, encoding="utf-8")
+    registry = Registry(str(tmp_path))
+    registry.load()
+    assert [s.name for s in registry.list_servers()] == ["weather"]
+
+
+def test_load_skips_unreadable_manifest_among_many(tmp_path: Path) -> None:
+    """Manifests are read concurrently; one that can't be read is skipped, the rest load."""
+    for name in ("weather", "hotel", "flights"):
+        _make_manifest(tmp_path, server_name=name)
+    (tmp_path / "locked").mkdir()
+    (tmp_path / "locked" / "manifest.json").mkdir()  # reading a directory raises OSError
+    registry = Registry(str(tmp_path))
+    registry.load()
+    assert sorted(s.name for s in registry.list_servers()) == ["flights", "hotel", "weather"]
+
+
+def test_load_skips_hidden_and_manifestless_directories(tmp_path: Path) -> None:
+    _make_manifest(tmp_path, server_name="weather")
+    _make_manifest(tmp_path, server_name=".trash")
+    (tmp_path / "no_manifest").mkdir()
+    (tmp_path / "stray_file.json").write_text("{}", encoding="utf-8")
+    registry = Registry(str(tmp_path))
+    registry.load()
+    assert [s.name for s in registry.list_servers()] == ["weather"]
+
+
+def test_load_defers_reading_manifests(tmp_path: Path) -> None:
+    """load() only discovers manifests; a lookup reads just the server it needs."""
+    _make_manifest(tmp_path, server_name="weather")
+    _make_manifest(tmp_path, server_name="hotel")
+    registry = Registry(str(tmp_path))
+    with patch("mce.runtime.manifest_loader.read_manifest", wraps=lambda path: path.read_bytes()) as read:
+        registry.load()
+        read.assert_not_called()
+        assert registry.get_swagger_hash("weather") == "abc123"
+    assert [call.args[0].parent.name for call in read.call_args_list] == ["weather"]
+
+
+def test_list_servers_keeps_directory_order_after_lazy_lookup(tmp_path: Path) -> None:
+    for name in ("weather", "hotel", "flights"):
+        _make_manifest(tmp_path, server_name=name)
+    registry = Registry(str(tmp_path))
+    registry.load()
+    expected = [path.parent.name for path in tmp_path.glob("*/manifest.json")]
+    registry.get_swagger_hash(expected[-1])
+    assert [s.name for s in registry.list_servers()] == expected
+
+
+def test_get_function_invalid_manifest_raises_not_found(tmp_path: Path) -> None:
+    (tmp_path / "bad_server").mkdir()
+    (tmp_path / "bad_server" / "manifest.json").write_text("not valid json", encoding="utf-8")
+    registry = Registry(str(tmp_path))
+    registry.load()
+    with pytest.raises(ServerNotFoundError, match=r"Available: \[\]"):
+        registry.get_swagger_hash("bad_server")
+
+
+def test_load_rereads_manifest_rewritten_with_older_mtime(tmp_path: Path) -> None:
+    """A manifest restored with an older mtime is still read fresh on the next load()."""
+    import os  # noqa: PLC0415
+
+    manifest_path = _make_manifest(tmp_path, server_name="weather")
+    first = Registry(str(tmp_path))
+    first.load()
+    first.list_servers()
+    original_mtime = manifest_path.stat().st_mtime_ns
+    data = json.loads(manifest_path.read_text(encoding="utf-8"))
+    data["description"] = "restored"
+    manifest_path.write_text(json.dumps(data), encoding="utf-8")
+    os.utime(manifest_path, ns=(original_mtime - 1_000_000, original_mtime - 1_000_000))
+
+    registry = Registry(str(tmp_path))
+    registry.load()
+    assert registry.list_servers()[0].description == "restored"
+    assert not manifest_path.with_suffix(".bin").exists()
+
+
 # ---------------------------------------------------------------------------
 # list_servers()
 # ---------------------------------------------------------------------------
@@ -128,6 +214,28 @@ def test_list_servers_returns_function_names(tmp_path: Path) -> None:
     assert "get_current_weather" in server.functions
 
 
+def test_list_servers_reuses_summaries_until_reload(tmp_path: Path) -> None:
+    _make_manifest(tmp_path, server_name="weather")
+    registry = Registry(str(tmp_path))
+    registry.load()
+    first = registry.list_servers()
+    second = registry.list_servers()
+    assert first is not second
+    assert first[0] is second[0]
+
+    _make_manifest(tmp_path, server_name="hotel")
+    registry.load()
+    assert {s.name for s in registry.list_servers()} == {"weather", "hotel"}
+
+
+def test_generation_increments_on_each_load(tmp_path: Path) -> None:
+    registry = Registry(str(tmp_path))
+    registry.load()
+    first = registry.generation
+    registry.load()
+    assert registry.generation == first + 1
+
+
 def test_list_servers_returns_function_summaries(tmp_path: Path) -> None:
     _make_manifest(tmp_path, server_name="weather")
     registry = Registry(str(tmp_path))
@@ -205,6 +313,23 @@ def test_get_function_function_not_found_raises(tmp_path: Path) -> None:
         registry.get_function("weather", "nonexistent_fn")
 
 
+def test_get_function_duplicate_names_resolve_to_first_endpoint(tmp_path: Path) -> None:
+    endpoint = {"summary": "First", "method": "GET", "path": "/a", "parameters_summary": "", "response_summary": ""}
+    _make_manifest(
+        tmp_path,
+        server_name="weather",
+        endpoints=[
+            {**endpoint, "function_name": "get_a"},
+            {**endpoint, "function_name": "get_a", "summary": "Second", "path": "/b"},
+        ],
+    )
+    registry = Registry(str(tmp_path))
+    registry.load()
+    assert registry.get_function("weather", "get_a").path == "/a"
+    with pytest.raises(FunctionNotFoundError, match=r"Available: \['get_a'\]"):
+        registry.get_function("weather", "get_b")
+
+
 # ---------------------------------------------------------------------------
 # get_function_source() and _get_function_source()
 # ---------------------------------------------------------------------------
@@ -247,6 +372,35 @@ def test_get_function_source_caches_result(tmp_path: Path) -> None:
     assert fn1.source_code == fn2.source_code
 
 
+def test_get_function_source_parses_functions_file_once_per_server(tmp_path: Path) -> None:
+    _make_manifest(tmp_path, server_name="weather")
+    (tmp_path / "weather" / "functions.py").write_text(
+        "class GetForecastResponse(TypedDict):\n    temp: float\n\n"
+        "def get_forecast():\n    return {}\n\n"
+        "def get_current_weather():\n    return {}\n",
+        encoding="utf-8",
+    )
+    registry = Registry(str(tmp_path))
+    registry.load()
+    with patch("ast.parse", wraps=ast.parse) as parse:
+        forecast = registry.get_function_source("weather", "get_forecast")
+        current = registry.get_function_source("weather", "get_current_weather")
+    assert parse.call_count == 1
+    assert forecast.startswith("class GetForecastResponse") and "def get_forecast" in forecast
+    assert current == "def get_current_weather():\n    return {}"
+
+
+def test_get_function_source_ignores_nested_definitions(tmp_path: Path) -> None:
+    _make_manifest(tmp_path, server_name="weather")
+    source = "def get_current_weather():\n    def get_forecast():\n        return 1\n    return get_forecast()\n"
+    (tmp_path / "weather" / "functions.py").write_text(source, encoding="utf-8")
+    registry = Registry(str(tmp_path))
+    registry.load()
+    assert registry.get_function_source("weather", "get_current_weather") == source.rstrip("\n")
+    # Only module-level functions get their own snippet; anything else falls back to the full file
+    assert registry.get_function_source("weather", "get_forecast") == source
+
+
 def test_get_function_source_public_method_server_not_found(tmp_path: Path) -> None:
     registry = Registry(str(tmp_path))
     registry.load()
@@ -274,7 +428,7 @@ def test_get_swagger_hash_server_not_found_raises(tmp_path: Path) -> None:
 
 
 # ---------------------------------------------------------------------------
-# _parse_parameters_summary
+# parse_parameters_summary
 # ---------------------------------------------------------------------------
 
 
@@ -322,8 +476,17 @@ def test_parse_parameters_summary_malformed_part(tmp_path: Path) -> None:
     assert len(fn.parameters) >= 1
 
 
+def test_parse_parameters_summary_keeps_non_identifier_names() -> None:
+    """Header-style names and bracketed types from the compiler round-trip intact."""
+    params = parse_parameters_summary("X-Api-Key (string, required), tags (array[string], optional)")
+    assert [(p.name, p.param_type, p.required) for p in params] == [
+        ("X-Api-Key", "string", True),
+        ("tags", "array[string]", False),
+    ]
+
+
 # ---------------------------------------------------------------------------
-# _parse_response_summary
+# parse_response_summary
 # ---------------------------------------------------------------------------
 
 
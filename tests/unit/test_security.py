@@ -95,6 +95,18 @@ def test_check_domain_allowed_multiple_domains_none_match_raises() -> None:
         check_domain_allowed("https://bad.io/v1", ["safe.com", "good.org"])
 
 
+def test_check_domain_allowed_ignores_domain_in_query_string() -> None:
+    """An allowed domain smuggled into the query or fragment does not authorize the host."""
+    with pytest.raises(SecurityViolationError):
+        check_domain_allowed("https://evil.com?x=.safe.com", ["safe.com"])
+    with pytest.raises(SecurityViolationError):
+        check_domain_allowed("https://evil.com#.safe.com", ["safe.com"])
+
+
+def test_check_domain_allowed_ignores_userinfo_and_port() -> None:
+    check_domain_allowed("https://user:pw@API.Safe.com:8443/v1", ["safe.com"])  # must not raise
+
+
 # ---------------------------------------------------------------------------
 # resolve_env_references
 # ---------------------------------------------------------------------------
@@ -124,6 +136,12 @@ def test_resolve_env_references_multiple_vars(monkeypatch: pytest.MonkeyPatch) -
     assert result == "http://api.example.com:8080/v1"
 
 
+def test_resolve_env_references_unclosed_placeholder_untouched(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("TOKEN", "secret")
+    assert resolve_env_references("${TOKEN}-${UNCLOSED") == "secret-${UNCLOSED"
+    assert resolve_env_references("cost ${ 5") == "cost ${ 5"
+
+
 def test_resolve_env_references_empty_string() -> None:
     assert resolve_env_references("") == ""
 
@@ -162,6 +180,15 @@ def test_build_server_env_vars_auth_resolves_references(monkeypatch: pytest.Monk
     assert result["MCE_MYAPI_AUTH"] == "Bearer resolved-key"
 
 
+def test_build_server_env_vars_sees_rotated_values(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Credentials rotated in the environment are used by the next call."""
+    monkeypatch.setenv("MCE_ROTATE_AUTH", "Bearer old-token")
+    assert build_server_env_vars("rotate")["MCE_ROTATE_AUTH"] == "Bearer old-token"
+
+    monkeypatch.setenv("MCE_ROTATE_AUTH", "Bearer new-token")
+    assert build_server_env_vars("rotate")["MCE_ROTATE_AUTH"] == "Bearer new-token"
+
+
 def test_build_server_env_vars_uppercase_server_name(monkeypatch: pytest.MonkeyPatch) -> None:
     """Server name is upper-cased when building env var keys."""
     monkeypatch.setenv("MCE_PETSTORE_BASE_URL", "https://petstore.example.com")
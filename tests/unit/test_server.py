@@ -24,6 +24,7 @@ from mce.server import (
     _BASE_INSTRUCTIONS,
     _apply_params_to_code,
     _build_instructions,
+    _execution_error_response,
     _load_top_level_tools,
     create_server,
     initialize_server,
@@ -154,6 +155,44 @@ async def test_list_servers_returns_function_list(tmp_path: Path) -> None:
     assert any(f["name"] == "get_current_weather" for f in functions)
 
 
+async def test_list_servers_reuses_encoded_listing_until_reload(tmp_path: Path) -> None:
+    config = _make_config(tmp_path)
+    registry = _make_mock_registry()
+    registry.generation = 1
+    mcp = create_server(config, registry=registry, cache=_make_mock_cache())
+    registry.list_servers.reset_mock()
+
+    first = await _call_tool(mcp, "list_servers")
+    second = await _call_tool(mcp, "list_servers")
+    assert first == second
+    assert registry.list_servers.call_count == 1
+
+    registry.generation = 2
+    await _call_tool(mcp, "list_servers")
+    assert registry.list_servers.call_count == 2
+
+
+async def test_registry_calls_run_off_the_event_loop(tmp_path: Path) -> None:
+    """Registry lookups run in a worker thread, not the event loop thread."""
+    import threading  # noqa: PLC0415
+
+    config = _make_config(tmp_path)
+    registry = _make_mock_registry()
+    mcp = create_server(config, registry=registry, cache=_make_mock_cache())
+    servers: list[Any] = registry.list_servers.return_value
+    threads: list[threading.Thread] = []
+
+    def _list_servers() -> list[Any]:
+        threads.append(threading.current_thread())
+        return servers
+
+    registry.list_servers.side_effect = _list_servers
+    await _call_tool(mcp, "list_servers")
+
+    assert threads
+    assert threads[0] is not threading.current_thread()
+
+
 async def test_list_servers_handles_exception(tmp_path: Path) -> None:
     config = _make_config(tmp_path)
     registry = _make_mock_registry()
@@ -397,6 +436,140 @@ async def test_execute_code_unexpected_error(tmp_path: Path) -> None:
     assert result["error_type"] == "internal"
 
 
+def test_execution_error_response_resolves_closest_mapped_base() -> None:
+    class _SlowSandboxError(ExecutionTimeoutError):
+        pass
+
+    assert _execution_error_response(_SlowSandboxError("slow"), 30)["error_type"] == "timeout"  # type: ignore[index]
+    assert _execution_error_response(ExecutionError("boom"), 30)["error_type"] == "execution"  # type: ignore[index]
+    assert _execution_error_response(RuntimeError("?"), 30) is None
+
+
+# ---------------------------------------------------------------------------
+# batch_execute
+# ---------------------------------------------------------------------------
+
+
+async def test_batch_execute_runs_calls_concurrently_in_order(tmp_path: Path) -> None:
+    import asyncio  # noqa: PLC0415
+
+    config = _make_config(tmp_path)
+    mcp = create_server(config, registry=_make_mock_registry(), cache=_make_mock_cache())
+    both_started = asyncio.Event()
+    started: list[str] = []
+
+    async def _execute(_self: Any, code: str, description: str) -> ExecutionResult:
+        started.append(code)
+        if len(started) == 2:
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), timeout=1)  # deadlocks if run one at a time
+        return ExecutionResult(success=True, data=code, execution_time_ms=1)
+
+    with patch("mce.runtime.executor.CodeExecutor.execute", new=_execute):
+        result = await _call_tool(
+            mcp,
+            "batch_execute",
+            calls=[
+                {"tool": "execute_code", "args": {"code": "result = 1", "description": "one"}},
+                {"tool": "execute_code", "args": {"code": "result = 2", "description": "two"}},
+            ],
+        )
+
+    assert [r["data"] for r in result["results"]] == ["result = 1", "result = 2"]
+
+
+async def test_batch_execute_respects_concurrency_limit(tmp_path: Path) -> None:
+    import asyncio  # noqa: PLC0415
+
+    config = _make_config(tmp_path)
+    config.max_concurrent_tools = 1
+    mcp = create_server(config, registry=_make_mock_registry(), cache=_make_mock_cache())
+    running = 0
+    peak = 0
+
+    async def _execute(_self: Any, code: str, description: str) -> ExecutionResult:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0)
+        running -= 1
+        return ExecutionResult(success=True, data=None, execution_time_ms=1)
+
+    calls = [{"tool": "execute_code", "args": {"code": "result = 1", "description": "d"}}] * 3
+    with patch("mce.runtime.executor.CodeExecutor.execute", new=_execute):
+        result = await _call_tool(mcp, "batch_execute", calls=calls)
+
+    assert len(result["results"]) == 3
+    assert peak == 1
+
+
+async def test_batch_execute_limit_is_shared_across_batches(tmp_path: Path) -> None:
+    """Concurrent batch_execute requests draw from the same concurrency budget."""
+    import asyncio  # noqa: PLC0415
+
+    config = _make_config(tmp_path)
+    config.max_concurrent_tools = 1
+    mcp = create_server(config, registry=_make_mock_registry(), cache=_make_mock_cache())
+    running = 0
+    peak = 0
+
+    async def _execute(_self: Any, code: str, description: str) -> ExecutionResult:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0)
+        running -= 1
+        return ExecutionResult(success=True, data=None, execution_time_ms=1)
+
+    calls = [{"tool": "execute_code", "args": {"code": "result = 1", "description": "d"}}] * 2
+    with patch("mce.runtime.executor.CodeExecutor.execute", new=_execute):
+        await asyncio.gather(*(_call_tool(mcp, "batch_execute", calls=calls) for _ in range(2)))
+
+    assert peak == 1
+
+
+async def test_batch_execute_reports_bad_calls_per_entry(tmp_path: Path) -> None:
+    config = _make_config(tmp_path)
+    mcp = create_server(config, registry=_make_mock_registry(), cache=_make_mock_cache())
+
+    result = await _call_tool(
+        mcp,
+        "batch_execute",
+        calls=[
+            {"tool": "drop_tables"},
+            {"tool": "execute_code", "args": {"unexpected": 1}},
+            {"tool": "list_servers"},
+        ],
+    )
+
+    unknown, bad_args, listing = result["results"]
+    assert unknown["error_type"] == "validation"
+    assert "drop_tables" in unknown["error"]
+    assert bad_args["error_type"] == "validation"
+    assert "weather" in listing
+
+
+async def test_batch_execute_reports_type_error_inside_tool_as_internal(tmp_path: Path) -> None:
+    """A TypeError raised by the tool itself is not blamed on the call's arguments."""
+    config = _make_config(tmp_path)
+    mcp = create_server(config, registry=_make_mock_registry(), cache=_make_mock_cache())
+
+    with patch("mce.server._toon_encode", side_effect=TypeError("unsupported type")):
+        result = await _call_tool(mcp, "batch_execute", calls=[{"tool": "list_servers"}])
+
+    (entry,) = result["results"]
+    assert entry["error_type"] == "internal"
+    assert "unsupported type" not in entry["error"]
+
+
+async def test_batch_execute_rejects_empty_list(tmp_path: Path) -> None:
+    config = _make_config(tmp_path)
+    mcp = create_server(config, registry=_make_mock_registry(), cache=_make_mock_cache())
+
+    result = await _call_tool(mcp, "batch_execute", calls=[])
+    assert result["error_type"] == "validation"
+
+
 # ---------------------------------------------------------------------------
 # _apply_params_to_code helper
 # ---------------------------------------------------------------------------
@@ -616,6 +789,24 @@ async def test_initialize_server_logs_and_returns(tmp_path: Path) -> None:
         await initialize_server(config, mcp)  # must not raise
 
 
+async def test_initialize_server_reuses_components_of_created_server(tmp_path: Path) -> None:
+    config = _make_config(tmp_path)
+    cache = _make_mock_cache()
+    cache.initialize = AsyncMock()
+    cache.cleanup_expired = AsyncMock(return_value=0)
+    cache.close = AsyncMock()
+    mcp = create_server(config, registry=_make_mock_registry(), cache=cache)
+
+    with patch("mce.server.Registry") as registry_cls, patch("mce.server.CacheStore") as cache_cls:
+        await initialize_server(config, mcp)
+
+    registry_cls.assert_not_called()
+    cache_cls.assert_not_called()
+    cache.initialize.assert_awaited_once()
+    cache.cleanup_expired.assert_awaited_once()
+    cache.close.assert_not_awaited()  # the server keeps using it
+
+
 # ---------------------------------------------------------------------------
 # _build_instructions — skills embedding
 # ---------------------------------------------------------------------------
@@ -2,18 +2,19 @@
 
 from __future__ import annotations
 
+import asyncio
 from pathlib import Path
 
 import pytest
 
 from mce.compiler.swagger_parser import SwaggerParser
 from mce.errors import SwaggerFetchError
-from mce.models import ServerSpec, SwaggerSource
+from mce.models import EndpointSpec, ServerSpec, SwaggerSource
 
 FIXTURES_DIR = Path(__file__).parent.parent / "fixtures"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def weather_source() -> SwaggerSource:
     return SwaggerSource(
         name="weather",
@@ -23,7 +24,7 @@ def weather_source() -> SwaggerSource:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def hotel_source() -> SwaggerSource:
     return SwaggerSource(
         name="hotel",
@@ -33,7 +34,7 @@ def hotel_source() -> SwaggerSource:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def petstore_source() -> SwaggerSource:
     return SwaggerSource(
         name="petstore",
@@ -43,33 +44,47 @@ def petstore_source() -> SwaggerSource:
     )
 
 
-async def test_parse_weather_api_returns_server_spec(weather_source: SwaggerSource) -> None:
-    """Parser returns a valid ServerSpec for the weather fixture."""
-    parser = SwaggerParser(weather_source)
-    spec = await parser.parse()
+@pytest.fixture(scope="module")
+def weather_spec(weather_source: SwaggerSource) -> ServerSpec:
+    """Parse the weather fixture once for the tests that only inspect the spec."""
+    return asyncio.run(SwaggerParser(weather_source).parse())
 
-    assert isinstance(spec, ServerSpec)
-    assert spec.name == "weather"
-    assert spec.is_read_only is True
-    assert len(spec.swagger_hash) == 64  # SHA256 hex digest
 
+@pytest.fixture(scope="module")
+def petstore_spec(petstore_source: SwaggerSource) -> ServerSpec:
+    """Parse the petstore fixture once for the tests that only inspect the spec."""
+    return asyncio.run(SwaggerParser(petstore_source).parse())
 
-async def test_weather_api_has_expected_endpoints(weather_source: SwaggerSource) -> None:
-    """Weather fixture has the expected endpoint operation IDs."""
-    parser = SwaggerParser(weather_source)
-    spec = await parser.parse()
 
-    op_ids = {ep.operation_id for ep in spec.endpoints}
-    assert "get_current_weather" in op_ids
-    assert "get_weather_forecast" in op_ids
+@pytest.fixture(scope="module")
+def weather_endpoints(weather_spec: ServerSpec) -> dict[str, EndpointSpec]:
+    """Weather endpoints indexed by operation ID."""
+    return {ep.operation_id: ep for ep in weather_spec.endpoints}
 
 
-async def test_weather_api_parameters_parsed(weather_source: SwaggerSource) -> None:
-    """Required and optional parameters are correctly classified."""
-    parser = SwaggerParser(weather_source)
-    spec = await parser.parse()
+@pytest.fixture(scope="module")
+def petstore_endpoints(petstore_spec: ServerSpec) -> dict[str, EndpointSpec]:
+    """Petstore endpoints indexed by operation ID."""
+    return {ep.operation_id: ep for ep in petstore_spec.endpoints}
+
+
+def test_parse_weather_api_returns_server_spec(weather_spec: ServerSpec) -> None:
+    """Parser returns a valid ServerSpec for the weather fixture."""
+    assert isinstance(weather_spec, ServerSpec)
+    assert weather_spec.name == "weather"
+    assert weather_spec.is_read_only is True
+    assert len(weather_spec.swagger_hash) == 64  # SHA256 hex digest
 
-    current = next(ep for ep in spec.endpoints if ep.operation_id == "get_current_weather")
+
+def test_weather_api_has_expected_endpoints(weather_endpoints: dict[str, EndpointSpec]) -> None:
+    """Weather fixture has the expected endpoint operation IDs."""
+    assert "get_current_weather" in weather_endpoints
+    assert "get_weather_forecast" in weather_endpoints
+
+
+def test_weather_api_parameters_parsed(weather_endpoints: dict[str, EndpointSpec]) -> None:
+    """Required and optional parameters are correctly classified."""
+    current = weather_endpoints["get_current_weather"]
     param_map = {p.name: p for p in current.parameters}
 
     assert "city" in param_map
@@ -99,12 +114,9 @@ async def test_readonly_server_excludes_mutating_methods(hotel_source: SwaggerSo
     assert "GET" in methods
 
 
-async def test_petstore_resolves_dollar_refs(petstore_source: SwaggerSource) -> None:
+def test_petstore_resolves_dollar_refs(petstore_endpoints: dict[str, EndpointSpec]) -> None:
     """Parser resolves $ref pointers in response schemas."""
-    parser = SwaggerParser(petstore_source)
-    spec = await parser.parse()
-
-    list_ep = next(ep for ep in spec.endpoints if ep.operation_id == "list_pets")
+    list_ep = petstore_endpoints["list_pets"]
     # The response schema should be populated (from resolved $ref)
     assert isinstance(list_ep.response_schema, list)
 
@@ -121,23 +133,16 @@ async def test_missing_file_raises_swagger_fetch_error() -> None:
         await parser.parse()
 
 
-async def test_swagger_hash_is_consistent(weather_source: SwaggerSource) -> None:
-    """Same file produces the same swagger hash across parses."""
-    parser1 = SwaggerParser(weather_source)
-    parser2 = SwaggerParser(weather_source)
-
-    spec1 = await parser1.parse()
-    spec2 = await parser2.parse()
+def test_swagger_hash_is_consistent(weather_spec: ServerSpec) -> None:
+    """The swagger hash is the SHA256 of the document bytes, so it is stable across parses."""
+    from mce.utils.hashing import hash_content  # noqa: PLC0415
 
-    assert spec1.swagger_hash == spec2.swagger_hash
+    assert weather_spec.swagger_hash == hash_content((FIXTURES_DIR / "weather_api.yaml").read_bytes())
 
 
-async def test_response_schema_fields_populated(weather_source: SwaggerSource) -> None:
+def test_response_schema_fields_populated(weather_endpoints: dict[str, EndpointSpec]) -> None:
     """Response schema fields are extracted from 200 response."""
-    parser = SwaggerParser(weather_source)
-    spec = await parser.parse()
-
-    current_ep = next(ep for ep in spec.endpoints if ep.operation_id == "get_current_weather")
+    current_ep = weather_endpoints["get_current_weather"]
     field_names = {f.name for f in current_ep.response_schema}
 
     assert "temperature" in field_names
@@ -182,12 +187,9 @@ def test_sanitize_identifier_abbreviations() -> None:
     assert parser._sanitize_identifier("getHTTPStatus") == "get_http_status"
 
 
-async def test_declared_path_param_parsed(petstore_source: SwaggerSource) -> None:
+def test_declared_path_param_parsed(petstore_endpoints: dict[str, EndpointSpec]) -> None:
     """Path parameter declared in swagger parameters array is parsed correctly."""
-    parser = SwaggerParser(petstore_source)
-    spec = await parser.parse()
-
-    ep = next(ep for ep in spec.endpoints if ep.operation_id == "get_pet_by_id")
+    ep = petstore_endpoints["get_pet_by_id"]
     path_params = [p for p in ep.parameters if p.location == "path"]
 
     assert len(path_params) == 1
@@ -271,3 +273,218 @@ paths:
 
     # f-string with substituted param in URL
     assert 'f"/internal/apm/services/{service_name}/agent"' in code
+
+
+async def test_json_swagger_parses_same_as_yaml(weather_source: SwaggerSource, tmp_path: Path) -> None:
+    """A JSON copy of a YAML fixture yields the same endpoints via the JSON fast path."""
+    import json  # noqa: PLC0415
+
+    import yaml  # noqa: PLC0415
+
+    doc = yaml.safe_load((FIXTURES_DIR / "weather_api.yaml").read_text(encoding="utf-8"))
+    json_path = tmp_path / "weather_api.json"
+    json_path.write_text(json.dumps(doc), encoding="utf-8")
+    json_source = weather_source.model_copy(update={"swagger_url": str(json_path)})
+
+    yaml_spec = await SwaggerParser(weather_source).parse()
+    json_spec = await SwaggerParser(json_source).parse()
+
+    assert json_spec.endpoints == yaml_spec.endpoints
+
+
+async def test_remote_fetch_uses_shared_client(weather_source: SwaggerSource) -> None:
+    """A client passed to the parser is used for the remote fetch and left open."""
+    import httpx  # noqa: PLC0415
+    import respx  # noqa: PLC0415
+
+    url = "https://specs.example.com/weather.yaml"
+    body = (FIXTURES_DIR / "weather_api.yaml").read_text(encoding="utf-8")
+    source = weather_source.model_copy(update={"swagger_url": url})
+
+    async with httpx.AsyncClient() as client:
+        with respx.mock:
+            route = respx.get(url).mock(return_value=httpx.Response(200, text=body))
+            spec = await SwaggerParser(source, client).parse()
+        assert not client.is_closed
+
+    assert route.called
+    assert spec.endpoints
+
+
+async def test_remote_fetch_hashes_streamed_body(weather_source: SwaggerSource) -> None:
+    """The digest computed while streaming matches hashing the full body afterwards."""
+    import httpx  # noqa: PLC0415
+    import respx  # noqa: PLC0415
+
+    from mce.utils.hashing import hash_content  # noqa: PLC0415
+
+    url = "https://specs.example.com/weather.yaml"
+    body = (FIXTURES_DIR / "weather_api.yaml").read_text(encoding="utf-8")
+    source = weather_source.model_copy(update={"swagger_url": url})
+
+    with respx.mock:
+        respx.get(url).mock(return_value=httpx.Response(200, text=body))
+        content, digest = await SwaggerParser(source)._fetch_document()
+
+    assert content == body
+    assert digest == hash_content(body)
+
+
+async def test_remote_fetch_tolerates_misdeclared_charset(weather_source: SwaggerSource) -> None:
+    """Bytes invalid in the declared charset are replaced instead of failing the fetch."""
+    import httpx  # noqa: PLC0415
+    import respx  # noqa: PLC0415
+
+    url = "https://specs.example.com/weather.yaml"
+    body = (FIXTURES_DIR / "weather_api.yaml").read_bytes() + b"# caf\xe9\n"
+    source = weather_source.model_copy(update={"swagger_url": url})
+
+    with respx.mock:
+        respx.get(url).mock(
+            return_value=httpx.Response(200, content=body, headers={"content-type": "text/yaml; charset=utf-8"})
+        )
+        content, _ = await SwaggerParser(source)._fetch_document()
+
+    assert isinstance(content, str)
+    assert content.endswith("# caf\ufffd\n")
+
+
+def test_shared_ref_fields_are_memoized(weather_source: SwaggerSource) -> None:
+    """A $ref used by several responses is converted to fields once per document."""
+    parser = SwaggerParser(weather_source)
+    parser._raw_doc = {
+        "components": {
+            "schemas": {"User": {"type": "object", "properties": {"id": {"type": "integer"}}}},
+        }
+    }
+    response = {"content": {"application/json": {"schema": {"$ref": "#/components/schemas/User"}}}}
+
+    first = parser._extract_response_fields(response)
+    second = parser._extract_response_fields(response)
+
+    assert [f.name for f in first] == ["id"]
+    assert second is first
+
+
+async def test_parse_responses_false_skips_response_schema(weather_source: SwaggerSource) -> None:
+    """Dry-run style parsing keeps endpoints but leaves response fields empty."""
+    full = await SwaggerParser(weather_source).parse()
+    lean = await SwaggerParser(weather_source, parse_responses=False).parse()
+
+    assert [ep.operation_id for ep in lean.endpoints] == [ep.operation_id for ep in full.endpoints]
+    assert any(ep.response_schema for ep in full.endpoints)
+    assert all(not ep.response_schema for ep in lean.endpoints)
+
+
+def test_types_and_locations_are_interned(weather_source: SwaggerSource) -> None:
+    """Known type and location strings resolve to a single shared instance."""
+    parser = SwaggerParser(weather_source)
+    raw = [
+        {"name": "a", "in": "".join(["qu", "ery"]), "schema": {"type": "".join(["str", "ing"])}},
+        {"name": "b", "in": "query", "schema": {"type": ["integer", "null"]}},
+    ]
+
+    first, second = parser._parse_parameters(raw)
+
+    assert first.location is second.location
+    assert first.param_type is parser._extract_type({"type": "string"})
+    assert second.param_type == "integer"
+
+
+def test_index_refs_resolves_components_without_walking(weather_source: SwaggerSource) -> None:
+    """Component and Swagger 2.0 definition refs are indexed before path parsing."""
+    parser = SwaggerParser(weather_source)
+    parser._raw_doc = {
+        "components": {
+            "schemas": {"User": {"type": "object"}},
+            "parameters": {"Limit": {"name": "limit", "in": "query"}},
+        },
+        "definitions": {"Pet": {"type": "object"}},
+    }
+
+    parser._index_refs()
+
+    assert set(parser._ref_cache) == {
+        "#/components/schemas/User",
+        "#/components/parameters/Limit",
+        "#/definitions/Pet",
+    }
+    assert parser._resolve_ref("#/components/parameters/Limit") == {"name": "limit", "in": "query"}
+    assert parser._resolve_ref("#/components/schemas/Missing") is None
+
+
+async def test_parsed_spec_is_immutable(weather_source: SwaggerSource) -> None:
+    """Parsed specs are frozen so later compiler stages cannot modify them."""
+    from pydantic import ValidationError  # noqa: PLC0415
+
+    spec = await SwaggerParser(weather_source).parse()
+
+    with pytest.raises(ValidationError):
+        spec.name = "other"
+    with pytest.raises(ValidationError):
+        spec.endpoints[0].parameters[0].required = False
+
+
+def test_operation_summary_fallbacks(weather_source: SwaggerSource) -> None:
+    """Summary falls back to the description, then to "METHOD path"; scalars are stringified."""
+    parser = SwaggerParser(weather_source)
+
+    described = parser._parse_operation("/a", "GET", {"description": "Lists things"}, [])
+    bare = parser._parse_operation("/b", "GET", {}, [])
+    numeric = parser._parse_operation("/c", "GET", {"summary": 42, "description": 7}, [])
+
+    assert described is not None
+    assert (described.summary, described.description) == ("Lists things", "Lists things")
+    assert bare is not None
+    assert (bare.summary, bare.description) == ("GET /b", "")
+    assert numeric is not None
+    assert (numeric.summary, numeric.description) == ("42", "7")
+
+
+def test_spec_models_build_validators_at_import() -> None:
+    """Spec models have their core schema built eagerly, not on first parse."""
+    from mce.models import EndpointSpec, ParamSchema, ResponseField, ServerSpec  # noqa: PLC0415
+
+    for model in (ParamSchema, ResponseField, EndpointSpec, ServerSpec):
+        assert model.__pydantic_complete__, model.__name__
+
+
+async def test_local_document_is_read_as_bytes(weather_source: SwaggerSource, tmp_path: Path) -> None:
+    """Local files are hashed and parsed as raw bytes; undecodable content is a CompileError."""
+    from mce.errors import CompileError  # noqa: PLC0415
+    from mce.utils.hashing import hash_content  # noqa: PLC0415
+
+    parser = SwaggerParser(weather_source)
+    content, digest = await parser._fetch_document()
+
+    assert isinstance(content, bytes)
+    assert digest == hash_content((FIXTURES_DIR / "weather_api.yaml").read_text(encoding="utf-8"))
+    assert parser._load_document(content)["openapi"]
+
+    with pytest.raises(CompileError):
+        parser._load_document(b"openapi: \xff\xfe\n")
+
+
+def test_generate_operation_id_from_path(weather_source: SwaggerSource) -> None:
+    """Generated IDs join the alphanumeric path segments; a bare root path gets a placeholder."""
+    parser = SwaggerParser(weather_source)
+
+    assert parser._generate_operation_id("GET", "/users/{user_id}/posts") == "get_users_user_id_posts"
+    assert parser._generate_operation_id("POST", "/") == "post_endpoint"
+
+
+async def test_request_body_schema_does_not_leak_between_parses(petstore_source: SwaggerSource) -> None:
+    """Mutating a parsed request body leaves later parses of the same document intact."""
+    first = await SwaggerParser(petstore_source.model_copy(update={"name": "pets_a"})).parse()
+    body = next(ep for ep in first.endpoints if ep.operation_id == "create_pet").request_body_schema
+    assert body is not None
+    body["injected"] = True
+    for prop in body.get("properties", {}).values():
+        prop["default"] = "tampered"
+
+    second = await SwaggerParser(petstore_source.model_copy(update={"name": "pets_b"})).parse()
+    fresh = next(ep for ep in second.endpoints if ep.operation_id == "create_pet").request_body_schema
+
+    assert fresh is not None
+    assert "injected" not in fresh
+    assert all("default" not in prop for prop in fresh.get("properties", {}).values())
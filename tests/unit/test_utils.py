@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 import logging
 
 from mce.utils.hashing import combine_hashes, hash_code, hash_content
@@ -65,6 +66,11 @@ def test_hash_code_normalizes_blank_lines() -> None:
     assert hash_code(code_no_blanks) == hash_code(code_with_blanks)
 
 
+def test_hash_code_whitespace_only_lines_match_sha256_of_normalized_code() -> None:
+    """Whitespace-only lines are dropped and the key stays a plain SHA256 digest."""
+    assert hash_code("a = 1  \n \t \n  b = 2\r\n") == hash_content("a = 1\n  b = 2")
+
+
 def test_hash_code_different_logic_differs() -> None:
     assert hash_code("result = 1") != hash_code("result = 2")
 
@@ -74,6 +80,13 @@ def test_hash_code_is_deterministic() -> None:
     assert hash_code(code) == hash_code(code)
 
 
+def test_hash_code_memoizes_repeated_code() -> None:
+    hash_code.cache_clear()
+    code = "result = 1\n"
+    assert hash_code(code) == hash_code(code)
+    assert hash_code.cache_info().hits == 1
+
+
 # ---------------------------------------------------------------------------
 # combine_hashes
 # ---------------------------------------------------------------------------
@@ -139,6 +152,19 @@ def test_setup_logging_invalid_level_defaults_to_info() -> None:
     assert root.level >= 0
 
 
+def test_json_log_dumps_matches_stdlib_json() -> None:
+    from mce.utils.logging import _dumps  # noqa: PLC0415
+
+    event = {"event": "tool_called", "count": 3, 7: "int key", "ratio": 0.5}
+    assert json.loads(_dumps(event)) == json.loads(json.dumps(event))
+
+
+def test_json_log_dumps_falls_back_for_wide_ints() -> None:
+    from mce.utils.logging import _dumps  # noqa: PLC0415
+
+    assert json.loads(_dumps({"big": 2**70})) == {"big": 2**70}
+
+
 # ---------------------------------------------------------------------------
 # get_logger
 # ---------------------------------------------------------------------------